@@ -0,0 +1,97 @@
+"""Benchmarks for blocking_queue.py
+
+Run with `python -m benchmarks.bench_blocking_queue`
+"""
+
+import queue
+import threading
+import time
+from typing import Callable
+
+from data_structures.blocking_queue import BlockingQueue
+
+ITEMS_PER_PRODUCER: int = 100_000
+THREAD_COUNTS: list[int] = [1, 2, 4]
+MAXSIZE: int = 1_000
+BATCH_SIZE: int = 256
+
+
+def run(
+    produce: Callable[[int], None], consume: Callable[[int], None], threads: int
+) -> float:
+    """Run `threads` producers and consumers, returning the elapsed seconds"""
+    workers = [threading.Thread(target=produce, args=(i,)) for i in range(threads)]
+    workers += [threading.Thread(target=consume, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def bench_stdlib(threads: int) -> float:
+    """queue.Queue with one get() per item"""
+    shared: queue.Queue = queue.Queue(MAXSIZE)
+
+    def produce(_: int) -> None:
+        for value in range(ITEMS_PER_PRODUCER):
+            shared.put(value)
+
+    def consume(_: int) -> None:
+        for _ in range(ITEMS_PER_PRODUCER):
+            shared.get()
+
+    return run(produce, consume, threads)
+
+
+def bench_blocking(threads: int) -> float:
+    """BlockingQueue with one get() per item"""
+    shared: BlockingQueue = BlockingQueue(MAXSIZE)
+
+    def produce(_: int) -> None:
+        for value in range(ITEMS_PER_PRODUCER):
+            shared.put(value)
+
+    def consume(_: int) -> None:
+        for _ in range(ITEMS_PER_PRODUCER):
+            shared.get()
+
+    return run(produce, consume, threads)
+
+
+def bench_blocking_batched(threads: int) -> float:
+    """BlockingQueue with put_many() and get_many() batches"""
+    shared: BlockingQueue = BlockingQueue(MAXSIZE)
+
+    def produce(_: int) -> None:
+        for start in range(0, ITEMS_PER_PRODUCER, BATCH_SIZE):
+            shared.put_many(range(start, min(start + BATCH_SIZE, ITEMS_PER_PRODUCER)))
+
+    def consume(_: int) -> None:
+        received = 0
+        while received < ITEMS_PER_PRODUCER:
+            received += len(
+                shared.get_many(min(BATCH_SIZE, ITEMS_PER_PRODUCER - received))
+            )
+
+    return run(produce, consume, threads)
+
+
+def main() -> None:
+    """Compare producer/consumer throughput for each queue and thread count"""
+    benchmarks = {
+        "queue.Queue": bench_stdlib,
+        "BlockingQueue": bench_blocking,
+        "BlockingQueue batched": bench_blocking_batched,
+    }
+    print(f"{'threads':>8} {'queue':>22} {'items/sec':>14}")
+    for threads in THREAD_COUNTS:
+        for name, bench in benchmarks.items():
+            seconds = bench(threads)
+            items_per_sec = threads * ITEMS_PER_PRODUCER / seconds
+            print(f"{threads:>8} {name:>22} {items_per_sec:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Benchmarks comparing the heap variants against each other
+
+Run with `python -m benchmarks.bench_heaps`
+
+Prints the seconds each heap takes for a workload at each size, and which heap won.
+Binary, 3-ary, 4-ary and 8-ary heaps show the trade-off between fewer levels and more
+comparisons per level, and the pairing heap shows where O(1) insert, merge and
+decrease_key pay off.
+"""
+
+import heapq
+import random
+import timeit
+from functools import partial
+from typing import Any, Callable
+
+from data_structures.d_ary_heap import DAryHeap
+from data_structures.min_heap import IndexedMinHeap, MinHeap
+from data_structures.pairing_heap import PairingHeap
+
+SIZES: list[int] = [1_000, 10_000, 100_000]
+
+HEAPS: dict[str, Callable[..., Any]] = {
+    "MinHeap": MinHeap,
+    "3-ary": lambda values=None: DAryHeap(values, arity=3),
+    "4-ary": lambda values=None: DAryHeap(values, arity=4),
+    "8-ary": lambda values=None: DAryHeap(values, arity=8),
+    "Pairing": PairingHeap,
+}
+
+
+def insert_all(make_heap: Callable[..., Any], values: list[int]) -> None:
+    """Insert every value one at a time"""
+    heap = make_heap()
+    for value in values:
+        heap.insert(value)
+
+
+def remove_all(make_heap: Callable[..., Any], values: list[int]) -> None:
+    """Build a heap from the values, then remove every one of them"""
+    heap = make_heap(values)
+    for _ in values:
+        heap.remove_min()
+
+
+def steady_state(make_heap: Callable[..., Any], values: list[int]) -> None:
+    """Alternate between inserting and removing on a heap of constant size"""
+    heap = make_heap(values)
+    for value in values:
+        heap.insert(value)
+        heap.remove_min()
+
+
+def merge_halves(make_heap: Callable[..., Any], values: list[int]) -> None:
+    """Build two heaps from each half of the values, then merge them"""
+    half = len(values) // 2
+    first = make_heap(values[:half])
+    first.merge(make_heap(values[half:]))
+
+
+def decrease_keys(make_heap: Callable[..., Any], values: list[int]) -> None:
+    """Decrease the priority of every value once, like Dijkstra's algorithm does"""
+    if make_heap is PairingHeap:
+        heap: PairingHeap[int] = PairingHeap()
+        nodes = [heap.insert(value) for value in values]
+        for node in nodes:
+            heap.decrease_key(node, node.key - len(values))
+    elif make_heap is IndexedMinHeap:
+        indexed_heap: IndexedMinHeap = IndexedMinHeap(values)
+        for value in values:
+            indexed_heap.decrease_key(value, indexed_heap.priority(value) - len(values))
+
+
+def heapq_insert_all(values: list[int]) -> None:
+    """insert_all() with heapq"""
+    heap: list[int] = []
+    for value in values:
+        heapq.heappush(heap, value)
+
+
+def heapq_remove_all(values: list[int]) -> None:
+    """remove_all() with heapq"""
+    heap = values.copy()
+    heapq.heapify(heap)
+    for _ in values:
+        heapq.heappop(heap)
+
+
+def heapq_steady_state(values: list[int]) -> None:
+    """steady_state() with heapq, pushing and popping separately like the heaps do"""
+    heap = values.copy()
+    heapq.heapify(heap)
+    for value in values:
+        heapq.heappush(heap, value)
+        heapq.heappop(heap)
+
+
+def pushpop(make_heap: Callable[..., Any], values: list[int]) -> None:
+    """Insert and remove the minimum in one fused step, on a heap of constant size"""
+    heap = make_heap(values)
+    for value in values:
+        heap.pushpop(value)
+
+
+def heapq_pushpop(values: list[int]) -> None:
+    """pushpop() with heapq.heappushpop()"""
+    heap = values.copy()
+    heapq.heapify(heap)
+    for value in values:
+        heapq.heappushpop(heap, value)
+
+
+def heapq_merge_halves(values: list[int]) -> None:
+    """merge_halves() with heapq, which has to heapify both halves together"""
+    half = len(values) // 2
+    first = values[:half]
+    heapq.heapify(first)
+    second = values[half:]
+    heapq.heapify(second)
+    first.extend(second)
+    heapq.heapify(first)
+
+
+# Name, workload, the same workload with heapq if it has one, and the heaps to run
+Workload = tuple[str, Callable, Callable | None, dict[str, Callable[..., Any]]]
+
+WORKLOADS: list[Workload] = [
+    ("insert", insert_all, heapq_insert_all, HEAPS),
+    ("remove_min", remove_all, heapq_remove_all, HEAPS),
+    ("steady state", steady_state, heapq_steady_state, HEAPS),
+    ("pushpop", pushpop, heapq_pushpop, HEAPS),
+    ("merge", merge_halves, heapq_merge_halves, HEAPS),
+    (
+        "decrease_key",
+        decrease_keys,
+        None,
+        {"Indexed": IndexedMinHeap, "Pairing": PairingHeap},
+    ),
+]
+
+
+def main() -> None:
+    """Time every workload on every heap, and report the fastest"""
+    for name, workload, heapq_workload, heaps in WORKLOADS:
+        columns = list(heaps) + (["heapq"] if heapq_workload else [])
+        print(f"\n{name}")
+        print(f"{'size':>10}" + "".join(f" {column:>10}" for column in columns))
+        for size in SIZES:
+            values = random.Random(size).sample(range(size * 10), size)
+            repeats = max(1, 100_000 // size)
+            runs: list[Callable[[], None]] = [
+                partial(workload, make_heap, values) for make_heap in heaps.values()
+            ]
+            if heapq_workload:
+                runs.append(partial(heapq_workload, values))
+            times = [
+                min(timeit.repeat(run, number=1, repeat=repeats)) for run in runs
+            ]
+            # heapq is in C, so the winner is picked among the pure Python heaps
+            python_times = times[: len(heaps)]
+            winner = columns[python_times.index(min(python_times))]
+            print(
+                f"{size:>10}"
+                + "".join(f" {seconds:>10.4f}" for seconds in times)
+                + f"  {winner} wins"
+            )
+
+
+if __name__ == "__main__":
+    main()
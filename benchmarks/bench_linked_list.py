@@ -0,0 +1,54 @@
+"""Benchmarks for linked_list.py and unrolled_linked_list.py
+
+Run with `python -m benchmarks.bench_linked_list`
+"""
+
+import random
+import timeit
+from typing import Any, Callable
+
+from data_structures.linked_list import DoublyLinkedList, LinkedList
+from data_structures.unrolled_linked_list import UnrolledLinkedList
+
+SIZES: list[int] = [100, 1_000, 10_000]
+
+IMPLEMENTATIONS: dict[str, Callable[[list[int]], Any]] = {
+    "LinkedList": LinkedList,
+    "DoublyLinkedList": DoublyLinkedList,
+    "UnrolledLinkedList": UnrolledLinkedList,
+}
+
+
+def indexed_scan(llst: Any) -> None:
+    """Read every value by index"""
+    for idx in range(len(llst)):
+        llst[idx]  # pylint: disable=pointless-statement
+
+
+def random_inserts(llst: Any, positions: list[int]) -> None:
+    """Insert a value at each of the given positions"""
+    for idx in positions:
+        llst.insert(idx, idx)
+
+
+def main() -> None:
+    """Compare indexed scans and random inserts across linked list layouts"""
+    print(f"{'size':>8} {'list':>20} {'indexed scan s':>15} {'inserts s':>10}")
+    for size in SIZES:
+        values = list(range(size))
+        positions = [random.randint(0, size + idx) for idx in range(1_000)]
+        for name, factory in IMPLEMENTATIONS.items():
+            llst = factory(values)
+            scan = min(timeit.repeat(lambda: indexed_scan(llst), number=1, repeat=3))
+            inserts = min(
+                timeit.repeat(
+                    lambda: random_inserts(factory(values), positions),
+                    number=1,
+                    repeat=3,
+                )
+            )
+            print(f"{size:>8} {name:>20} {scan:>15.4f} {inserts:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Per-element memory of every structure, measured with tracemalloc
+
+Run with `python -m benchmarks.bench_memory`
+"""
+
+import tracemalloc
+from typing import Any, Callable
+
+from data_structures.linked_list import DoublyLinkedList, LinkedList
+from data_structures.min_heap import MinHeap
+from data_structures.queue import Queue
+from data_structures.stack import Stack
+from data_structures.unrolled_linked_list import UnrolledLinkedList
+
+SIZE: int = 100_000
+
+# Each builder fills a structure with the given values one operation at a time
+BUILDERS: dict[str, Callable[[range], Any]] = {
+    "LinkedList": lambda values: _fill(LinkedList(), "append", values),
+    "DoublyLinkedList": lambda values: _fill(DoublyLinkedList(), "append", values),
+    "UnrolledLinkedList": lambda values: _fill(UnrolledLinkedList(), "append", values),
+    "Queue": lambda values: _fill(Queue(), "enqueue", values),
+    "Stack": lambda values: _fill(Stack(), "push", values),
+    "Stack('q')": lambda values: _fill(Stack(typecode="q"), "push", values),
+    "MinHeap": lambda values: _fill(MinHeap(), "insert", values),
+}
+
+
+def _fill(structure: Any, method: str, values: range) -> Any:
+    """Call the given method once per value"""
+    add = getattr(structure, method)
+    for value in values:
+        add(value)
+    return structure
+
+
+def bytes_per_element(build: Callable[[range], Any], size: int) -> float:
+    """Measure the memory a structure holds per element, excluding the values"""
+    # The values are created before tracing starts, so only the structure counts
+    values = list(range(1_000, 1_000 + size))
+    tracemalloc.start()
+    structure = build(values)  # type: ignore[arg-type]
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return used / size
+
+
+def main() -> None:
+    """Print the per-element overhead of every structure"""
+    print(f"{'structure':>20} {'bytes/element':>14}")
+    for name, build in BUILDERS.items():
+        print(f"{name:>20} {bytes_per_element(build, SIZE):>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmarks for min_heap.py
+
+Run with `python -m benchmarks.bench_min_heap`
+"""
+
+import heapq
+import random
+import timeit
+
+from data_structures.min_heap import BoundedMinHeap, MinHeap
+
+SIZES: list[int] = [1_000, 10_000, 100_000, 1_000_000]
+
+
+def build_by_insert(values: list[int]) -> MinHeap:
+    """Build a heap by inserting every value one at a time"""
+    heap: MinHeap = MinHeap()
+    for value in values:
+        heap.insert(value)
+    return heap
+
+
+def build_by_heapify(values: list[int]) -> MinHeap:
+    """Build a heap bottom-up from the whole batch"""
+    return MinHeap(values)
+
+
+def top_k_by_size_check(values: list[int], k: int) -> MinHeap:
+    """Keep the k largest values with a MinHeap and manual size checks"""
+    heap: MinHeap = MinHeap()
+    for value in values:
+        heap.insert(value)
+        if len(heap) > k:
+            heap.remove_min()
+    return heap
+
+
+def top_k_bounded(values: list[int], k: int) -> BoundedMinHeap:
+    """Keep the k largest values with a BoundedMinHeap"""
+    return BoundedMinHeap(values, capacity=k)
+
+
+def main() -> None:
+    """Compare ways of building a heap, and of keeping the top k values"""
+    print(f"{'size':>10} {'insert() s':>12} {'heapify s':>12} {'speedup':>8}")
+    for size in SIZES:
+        values = random.sample(range(size * 10), size)
+        repeats = max(1, 1_000_000 // size)
+        insert_time = min(
+            timeit.repeat(lambda: build_by_insert(values), number=1, repeat=repeats)
+        )
+        heapify_time = min(
+            timeit.repeat(lambda: build_by_heapify(values), number=1, repeat=repeats)
+        )
+        print(
+            f"{size:>10} {insert_time:>12.4f} {heapify_time:>12.4f}"
+            f" {insert_time / heapify_time:>7.2f}x"
+        )
+
+    print(f"\n{'size':>10} {'checks s':>12} {'bounded s':>12} {'nlargest s':>12}")
+    for size in SIZES:
+        values = random.sample(range(size * 10), size)
+        repeats = max(1, 100_000 // size)
+        times = [
+            min(timeit.repeat(lambda: run(values), number=1, repeat=repeats))
+            for run in [
+                lambda values: top_k_by_size_check(values, 100),
+                lambda values: top_k_bounded(values, 100),
+                lambda values: heapq.nlargest(100, values),
+            ]
+        ]
+        print(f"{size:>10}" + "".join(f" {seconds:>12.4f}" for seconds in times))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmarks for numeric_min_heap.py
+
+Run with `python -m benchmarks.bench_numeric_min_heap` (requires NumPy)
+"""
+
+import heapq
+import timeit
+from functools import partial
+from typing import Any, Callable
+
+import numpy as np
+
+from data_structures.min_heap import MinHeap
+from data_structures.numeric_min_heap import NumericMinHeap
+
+SIZES: list[int] = [1_000, 100_000, 1_000_000]
+
+
+def pop_many_heapq(values: list[float], k: int) -> list[float]:
+    """Heapify a copy of the values with heapq, then pop k of them"""
+    heap = values.copy()
+    heapq.heapify(heap)
+    return [heapq.heappop(heap) for _ in range(k)]
+
+
+def pop_many_min_heap(values: list[float], k: int) -> list[float]:
+    """Build a MinHeap from the values, then pop k of them"""
+    heap: MinHeap = MinHeap(values)
+    return [heap.remove_min() for _ in range(k)]
+
+
+def pop_many_numeric(values: np.ndarray, k: int) -> np.ndarray:
+    """Build a NumericMinHeap from the values, then pop k of them at once"""
+    return NumericMinHeap(values).pop_many(k)[0]
+
+
+def main() -> None:
+    """Compare building a heap and popping a tenth of it"""
+    print(f"{'size':>10} {'heapq s':>10} {'MinHeap s':>10} {'Numeric s':>10}")
+    for size in SIZES:
+        array = np.random.default_rng(size).random(size)
+        values = array.tolist()
+        k = size // 10
+        repeats = max(1, 100_000 // size)
+        runs: list[Callable[[], Any]] = [
+            partial(pop_many_heapq, values, k),
+            partial(pop_many_min_heap, values, k),
+            partial(pop_many_numeric, array, k),
+        ]
+        times = [min(timeit.repeat(run, number=1, repeat=repeats)) for run in runs]
+        print(f"{size:>10}" + "".join(f" {seconds:>10.4f}" for seconds in times))
+
+
+if __name__ == "__main__":
+    main()
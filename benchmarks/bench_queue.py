@@ -0,0 +1,106 @@
+"""Benchmarks for queue.py
+
+Run with `python -m benchmarks.bench_queue`
+"""
+
+import timeit
+import tracemalloc
+from collections import deque
+from functools import partial
+from typing import Any, Callable
+
+from data_structures.queue import Queue
+
+SIZES: list[int] = [1_000, 100_000, 1_000_000]
+
+
+class NodeQueue:
+    """The previous node-based queue, kept here as a baseline for comparison"""
+
+    class QueueNode:
+        """The node for each queue value"""
+
+        def __init__(self, value: Any) -> None:
+            self.value = value
+            self.prev: NodeQueue.QueueNode | None = None
+
+    def __init__(self) -> None:
+        self.head: NodeQueue.QueueNode | None = None
+        self.tail: NodeQueue.QueueNode | None = None
+        self.length = 0
+
+    def enqueue(self, value: Any) -> None:
+        """Enqueue a value"""
+        node = NodeQueue.QueueNode(value)
+        if self.head is None:
+            self.head = node
+            self.tail = node
+        else:
+            self.head.prev = node
+            self.head = node
+        self.length += 1
+
+    def dequeue(self) -> Any:
+        """Dequeue a value"""
+        if self.tail is None:
+            raise IndexError
+        node = self.tail
+        self.tail = self.tail.prev
+        self.length -= 1
+        if self.tail is None:
+            self.head = None
+        return node.value
+
+
+class DequeAdapter(deque):
+    """collections.deque with the Queue method names"""
+
+    enqueue = deque.append
+    dequeue = deque.popleft
+
+
+IMPLEMENTATIONS: dict[str, Callable[[], Any]] = {
+    "Queue": Queue,
+    "NodeQueue": NodeQueue,
+    "deque": DequeAdapter,
+}
+
+
+def fill_and_drain(factory: Callable[[], Any], size: int) -> None:
+    """Enqueue `size` values, then dequeue them all"""
+    queue = factory()
+    enqueue = queue.enqueue
+    dequeue = queue.dequeue
+    for value in range(size):
+        enqueue(value)
+    for _ in range(size):
+        dequeue()
+
+
+def bytes_per_item(factory: Callable[[], Any], size: int) -> float:
+    """Measure the memory held by a full queue, per item"""
+    values = list(range(size))
+    tracemalloc.start()
+    queue = factory()
+    for value in values:
+        queue.enqueue(value)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del queue
+    return used / size
+
+
+def main() -> None:
+    """Compare ops/sec and memory of the ring buffer, node-based queue and deque"""
+    print(f"{'size':>10} {'queue':>10} {'ops/sec':>14} {'bytes/item':>11}")
+    for size in SIZES:
+        for name, factory in IMPLEMENTATIONS.items():
+            run = partial(fill_and_drain, factory, size)
+            seconds = min(timeit.repeat(run, number=1, repeat=3))
+            ops_per_sec = 2 * size / seconds
+            memory = bytes_per_item(factory, size)
+            print(f"{size:>10} {name:>10} {ops_per_sec:>14,.0f} {memory:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Benchmarks for shared_queues.py
+
+Run with `python -m benchmarks.bench_shared_queues`
+
+Moves integers from producer processes to consumer processes, either through a
+`multiprocessing.Queue`, which pickles every item through a pipe, or through a
+SharedQueue, one at a time or in batches.
+"""
+
+import multiprocessing
+import time
+from typing import Any, Callable
+
+from data_structures.shared_queues import SharedQueue
+
+COUNT: int = 200_000
+BATCH: int = 1_000
+CAPACITY: int = 8_192
+PROCESS_COUNTS: list[int] = [1, 2, 4]
+# Consumers stop when they get this, so it is never produced as a value
+SENTINEL: int = -1
+
+
+def produce_each(queue: Any, start: int, stop: int) -> None:
+    """Put values one at a time"""
+    for value in range(start, stop):
+        queue.put(value)
+
+
+def consume_each(queue: Any) -> None:
+    """Get values one at a time until the sentinel"""
+    while queue.get() != SENTINEL:
+        pass
+
+
+def produce_lists(queue: Any, start: int, stop: int) -> None:
+    """Put values on a multiprocessing.Queue as lists of BATCH"""
+    for batch_start in range(start, stop, BATCH):
+        queue.put(list(range(batch_start, min(batch_start + BATCH, stop))))
+
+
+def consume_lists(queue: Any) -> None:
+    """Get lists of values from a multiprocessing.Queue until the sentinel"""
+    while queue.get() != SENTINEL:
+        pass
+
+
+def produce_batches(queue: SharedQueue, start: int, stop: int) -> None:
+    """Put values on a SharedQueue in batches of BATCH"""
+    for batch_start in range(start, stop, BATCH):
+        queue.put_many(range(batch_start, min(batch_start + BATCH, stop)))
+
+
+def consume_batches(queue: SharedQueue) -> None:
+    """Get values from a SharedQueue in batches until the sentinel"""
+    while True:
+        sentinels = queue.get_many(BATCH).count(SENTINEL)
+        if sentinels:
+            # Hand back any sentinels meant for the other consumers
+            queue.put_many([SENTINEL] * (sentinels - 1))
+            return
+
+
+def run_pool(
+    queue: Any,
+    producer: Callable[[Any, int, int], None],
+    consumer: Callable[[Any], None],
+    processes: int,
+) -> float:
+    """Run `processes` producers and consumers over COUNT values, returning seconds"""
+    step = COUNT // processes
+    producers = [
+        multiprocessing.Process(
+            target=producer, args=(queue, idx * step, (idx + 1) * step)
+        )
+        for idx in range(processes)
+    ]
+    consumers = [
+        multiprocessing.Process(target=consumer, args=(queue,))
+        for _ in range(processes)
+    ]
+    start = time.perf_counter()
+    for process in producers + consumers:
+        process.start()
+    for process in producers:
+        process.join()
+    # Each consumer stops at the first sentinel it sees, so one per consumer
+    for _ in consumers:
+        queue.put(SENTINEL)
+    for process in consumers:
+        process.join()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Compare the throughput of each way of passing values across process counts"""
+    print(f"{COUNT:,} values, in millions of values per second")
+    print(
+        f"{'processes':>10} {'mp.Queue':>10} {'mp lists':>10}"
+        f" {'shared':>10} {'batches':>10}"
+    )
+    for processes in PROCESS_COUNTS:
+        times = [
+            run_pool(
+                multiprocessing.Queue(CAPACITY), produce_each, consume_each, processes
+            ),
+            run_pool(multiprocessing.Queue(), produce_lists, consume_lists, processes),
+        ]
+        with SharedQueue(CAPACITY) as queue:
+            times.append(run_pool(queue, produce_each, consume_each, processes))
+        with SharedQueue(CAPACITY) as queue:
+            times.append(run_pool(queue, produce_batches, consume_batches, processes))
+        print(
+            f"{processes:>10}"
+            + "".join(f" {COUNT / seconds / 1e6:>10.2f}" for seconds in times)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Benchmarks for sorted_list.py
+
+Run with `python -m benchmarks.bench_sorted_list`
+
+Keeps a collection sorted as random values are added, then looks up the rank of
+values in it, comparing SortedList with a LinkedList searched by a linear scan and
+with a plain list kept sorted by `bisect.insort`.
+"""
+
+import bisect
+import random
+import timeit
+
+from data_structures.linked_list import LinkedList
+from data_structures.sorted_list import SortedList
+
+SIZES: list[int] = [1_000, 10_000, 100_000]
+# The linked list's linear scan is O(n^2) overall, so it stops at this size
+MAX_LINKED_LIST_SIZE: int = 10_000
+
+
+def linked_list_add_all(values: list[int]) -> LinkedList[int]:
+    """Insert every value into a LinkedList at the index found by a linear scan"""
+    llst: LinkedList[int] = LinkedList()
+    for value in values:
+        idx = 0
+        for existing in llst:
+            if existing > value:
+                break
+            idx += 1
+        llst.insert(idx, value)
+    return llst
+
+
+def insort_add_all(values: list[int]) -> list[int]:
+    """Insert every value into a plain list with bisect.insort"""
+    sorted_values: list[int] = []
+    for value in values:
+        bisect.insort(sorted_values, value)
+    return sorted_values
+
+
+def sorted_list_add_all(values: list[int]) -> SortedList[int]:
+    """Add every value to a SortedList"""
+    sorted_values: SortedList[int] = SortedList()
+    for value in values:
+        sorted_values.add(value)
+    return sorted_values
+
+
+def main() -> None:
+    """Time adding values one at a time, then finding every value's rank"""
+    print(
+        f"{'size':>10} {'LinkedList':>11} {'insort':>10} {'SortedList':>11}"
+        f" {'index()':>10} {'index_of()':>11}"
+    )
+    for size in SIZES:
+        values = random.Random(size).sample(range(size * 10), size)
+        linked_list_time = float("nan")
+        if size <= MAX_LINKED_LIST_SIZE:
+            linked_list_time = min(
+                timeit.repeat(lambda: linked_list_add_all(values), number=1, repeat=1)
+            )
+        insort_time = min(
+            timeit.repeat(lambda: insort_add_all(values), number=1, repeat=3)
+        )
+        sorted_list_time = min(
+            timeit.repeat(lambda: sorted_list_add_all(values), number=1, repeat=3)
+        )
+
+        probes = values[:1000]
+        plain = insort_add_all(values)
+        sorted_values = sorted_list_add_all(values)
+        index_time = min(
+            timeit.repeat(
+                lambda: [plain.index(value) for value in probes], number=1, repeat=3
+            )
+        )
+        index_of_time = min(
+            timeit.repeat(
+                lambda: [sorted_values.index_of(value) for value in probes],
+                number=1,
+                repeat=3,
+            )
+        )
+        print(
+            f"{size:>10} {linked_list_time:>11.4f} {insort_time:>10.4f}"
+            f" {sorted_list_time:>11.4f} {index_time:>10.4f} {index_of_time:>11.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
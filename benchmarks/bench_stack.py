@@ -0,0 +1,103 @@
+"""Benchmarks for stack.py
+
+Run with `python -m benchmarks.bench_stack`
+"""
+
+import timeit
+import tracemalloc
+from functools import partial
+from typing import Any, Callable
+
+from data_structures.stack import Stack
+
+SIZES: list[int] = [1_000, 100_000, 1_000_000]
+
+
+class NodeStack:
+    """The previous node-based stack, kept here as a baseline for comparison"""
+
+    class StackNode:
+        """The node for each stack value"""
+
+        def __init__(self, value: Any) -> None:
+            self.value = value
+            self.next: NodeStack.StackNode | None = None
+
+    def __init__(self) -> None:
+        self.head: NodeStack.StackNode | None = None
+        self.length = 0
+
+    def push(self, value: Any) -> None:
+        """Push a value"""
+        node = NodeStack.StackNode(value)
+        node.next = self.head
+        self.head = node
+        self.length += 1
+
+    def pop(self) -> Any:
+        """Pop a value"""
+        if self.head is None:
+            raise IndexError
+        node = self.head
+        self.head = node.next
+        self.length -= 1
+        return node.value
+
+
+IMPLEMENTATIONS: dict[str, Callable[[], Any]] = {
+    "Stack": Stack,
+    "Stack('q')": lambda: Stack(typecode="q"),
+    "NodeStack": NodeStack,
+}
+
+
+def push_and_pop(factory: Callable[[], Any], size: int) -> None:
+    """Push `size` values, then pop them all"""
+    stack = factory()
+    push = stack.push
+    pop = stack.pop
+    for value in range(size):
+        push(value)
+    for _ in range(size):
+        pop()
+
+
+def push_and_pop_many(size: int) -> None:
+    """Push and pop `size` values with the bulk operations"""
+    stack: Stack = Stack()
+    stack.push_many(range(size))
+    stack.pop_many(size)
+
+
+def bytes_per_item(factory: Callable[[], Any], size: int) -> float:
+    """Measure the memory held by a full stack, per item"""
+    # Use values outside the small int cache, so that boxing costs are counted
+    values = range(1_000, 1_000 + size)
+    tracemalloc.start()
+    stack = factory()
+    for value in values:
+        stack.push(value)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del stack
+    return used / size
+
+
+def main() -> None:
+    """Compare ops/sec and memory of the array-backed and node-based stacks"""
+    print(f"{'size':>10} {'stack':>12} {'ops/sec':>14} {'bytes/item':>11}")
+    for size in SIZES:
+        for name, factory in IMPLEMENTATIONS.items():
+            seconds = min(
+                timeit.repeat(partial(push_and_pop, factory, size), number=1, repeat=3)
+            )
+            memory = bytes_per_item(factory, size)
+            print(f"{size:>10} {name:>12} {2 * size / seconds:>14,.0f} {memory:>11.1f}")
+        seconds = min(
+            timeit.repeat(lambda: push_and_pop_many(size), number=1, repeat=3)
+        )
+        print(f"{size:>10} {'bulk':>12} {2 * size / seconds:>14,.0f} {'':>11}")
+
+
+if __name__ == "__main__":
+    main()
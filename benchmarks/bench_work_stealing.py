@@ -0,0 +1,107 @@
+"""Benchmarks for work_stealing_deque.py
+
+Run with `python -m benchmarks.bench_work_stealing`
+
+Runs a recursive tree of tasks on a thread pool, where each task spawns two
+children until the leaves, either with every worker sharing one BlockingQueue or
+with a WorkStealingDeque per worker.
+"""
+
+import random
+import threading
+import time
+
+from data_structures.blocking_queue import BlockingQueue, Empty
+from data_structures.work_stealing_deque import WorkStealingDeque
+
+DEPTH: int = 15
+WORKER_COUNTS: list[int] = [1, 2, 4, 8]
+LEAF_WORK: int = 100
+
+
+def run_task(depth: int) -> list[int]:
+    """Run one task of the tree, returning the depths of the tasks it spawns"""
+    if depth == 0:
+        sum(range(LEAF_WORK))
+        return []
+    return [depth - 1, depth - 1]
+
+
+def shared_queue_pool(workers: int, depth: int) -> None:
+    """Run the task tree with every worker getting and putting on one queue"""
+    tasks: BlockingQueue[int | None] = BlockingQueue()
+
+    def worker() -> None:
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+            tasks.put_many(run_task(task))
+            tasks.task_done()
+
+    threads = [threading.Thread(target=worker) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    tasks.put(depth)
+    tasks.join()
+    tasks.put_many([None] * workers)
+    for thread in threads:
+        thread.join()
+
+
+def work_stealing_pool(workers: int, depth: int) -> None:
+    """Run the task tree with a deque per worker, stealing from others when idle"""
+    total = 2 ** (depth + 1) - 1
+    deques: list[WorkStealingDeque[int]] = [
+        WorkStealingDeque() for _ in range(workers)
+    ]
+    # Each worker only writes its own count, so no lock is needed
+    completed = [0] * workers
+
+    def worker(idx: int) -> None:
+        own = deques[idx]
+        rng = random.Random(idx)
+        while True:
+            try:
+                task = own.pop()
+            except Empty:
+                try:
+                    task = deques[rng.randrange(workers)].steal()
+                except Empty:
+                    if sum(completed) == total:
+                        return
+                    # Let workers with tasks run instead of spinning
+                    time.sleep(0)
+                    continue
+            for child in run_task(task):
+                own.push(child)
+            completed[idx] += 1
+
+    deques[0].push(depth)
+    threads = [threading.Thread(target=worker, args=(idx,)) for idx in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def main() -> None:
+    """Compare the two pools across worker counts"""
+    total = 2 ** (DEPTH + 1) - 1
+    print(f"{total:,} tasks")
+    print(f"{'workers':>8} {'shared s':>10} {'stealing s':>11} {'speedup':>8}")
+    for workers in WORKER_COUNTS:
+        start = time.perf_counter()
+        shared_queue_pool(workers, DEPTH)
+        shared_time = time.perf_counter() - start
+        start = time.perf_counter()
+        work_stealing_pool(workers, DEPTH)
+        stealing_time = time.perf_counter() - start
+        print(
+            f"{workers:>8} {shared_time:>10.3f} {stealing_time:>11.3f}"
+            f" {shared_time / stealing_time:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,658 @@
+"""Benchmark suite covering every structure, with JSON output and regression checks
+
+Run all benchmarks and save the results:
+    python -m benchmarks.suite run --output results.json
+
+Fail (exit code 1) when a structure got slower or bigger than a saved baseline:
+    python -m benchmarks.suite compare baseline.json results.json --threshold 0.2
+"""
+
+import argparse
+import heapq
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+
+from data_structures.d_ary_heap import DAryHeap
+from data_structures.deque import Deque
+from data_structures.linked_list import LinkedList
+from data_structures.min_heap import MinHeap
+from data_structures.pairing_heap import PairingHeap
+from data_structures.queue import Queue
+from data_structures.stack import Stack
+
+DEFAULT_SIZES: list[int] = [10, 100, 1_000, 10_000, 100_000]
+
+# Operations which are O(n) each are only run this many times per measurement,
+# so that large sizes finish in a reasonable time
+LINEAR_OPS_LIMIT: int = 1_000
+
+# How many values the nsmallest() cases take from each heap
+NSMALLEST_K: int = 10
+
+# Keep repeating each measurement until at least this much time was measured, or
+# until it was repeated this many times (tiny sizes spend most of their time in setup)
+MIN_MEASURE_SECONDS: float = 0.05
+MAX_REPEATS: int = 1_000
+
+# tracemalloc slows everything down a lot, so memory is only measured up to here
+MAX_MEMORY_SIZE: int = 1_000_000
+
+
+@dataclass(frozen=True)
+class Case:
+    """A single operation on a single implementation of a structure"""
+
+    structure: str
+    operation: str
+    implementation: str
+    # Builds the state for a given size, outside of the measurement
+    setup: Callable[[int], Any]
+    # Runs the operation against the state, returning how many operations it did
+    run: Callable[[Any, int], int]
+
+
+@dataclass
+class Result:
+    """The measurements for one case at one size"""
+
+    structure: str
+    operation: str
+    implementation: str
+    size: int
+    ops_per_sec: float
+    peak_bytes: int | None
+
+
+def _values(size: int) -> list[int]:
+    """Shuffled values, the same ones for every implementation at a given size"""
+    values = list(range(size))
+    random.Random(size).shuffle(values)
+    return values
+
+
+def _positions(size: int) -> list[int]:
+    """Random in-bounds indices, at most LINEAR_OPS_LIMIT of them"""
+    rng = random.Random(size)
+    return [rng.randrange(size) for _ in range(min(size, LINEAR_OPS_LIMIT))]
+
+
+def _second_half(size: int) -> slice:
+    """The slice from the middle of a sequence to its end"""
+    return slice(size // 2, None)
+
+
+def _repeat(operation: Callable[[], Any], count: int) -> int:
+    """Call an operation count times"""
+    for _ in range(count):
+        operation()
+    return count
+
+
+def _once(operation: Callable[[], Any], count: int) -> int:
+    """Call an operation which does count operations in one go"""
+    operation()
+    return count
+
+
+def _each(operation: Callable[[Any], Any], values: list[Any]) -> int:
+    """Call an operation once per value"""
+    for value in values:
+        operation(value)
+    return len(values)
+
+
+def _min_heap_cases() -> list[Case]:
+    """MinHeap against heapq, and the other heap variants"""
+
+    def heapified(size: int) -> list[int]:
+        heap = _values(size)
+        heapq.heapify(heap)
+        return heap
+
+    # fmt: off
+    return [
+        Case("MinHeap", "insert", "MinHeap",
+             lambda n: (MinHeap(), _values(n)),
+             lambda s, n: _each(s[0].insert, s[1])),
+        Case("MinHeap", "insert", "heapq",
+             lambda n: ([], _values(n)),
+             lambda s, n: _each(lambda v: heapq.heappush(s[0], v), s[1])),
+        Case("MinHeap", "insert", "DAryHeap",
+             lambda n: (DAryHeap(), _values(n)),
+             lambda s, n: _each(s[0].insert, s[1])),
+        Case("MinHeap", "insert", "PairingHeap",
+             lambda n: (PairingHeap(), _values(n)),
+             lambda s, n: _each(s[0].insert, s[1])),
+        Case("MinHeap", "insert_many", "MinHeap",
+             lambda n: (MinHeap(_values(n)), _values(n)),
+             lambda s, n: _once(lambda: s[0].insert_many(s[1]), n)),
+        Case("MinHeap", "insert_many", "heapq",
+             lambda n: (heapified(n), _values(n)),
+             lambda s, n: _once(lambda: heapq.heapify(s[0] + s[1]), n)),
+        Case("MinHeap", "insert_many", "PairingHeap",
+             lambda n: (PairingHeap(_values(n)), _values(n)),
+             lambda s, n: _once(lambda: s[0].insert_many(s[1]), n)),
+        Case("MinHeap", "heapify", "MinHeap",
+             _values,
+             lambda s, n: _once(lambda: MinHeap(s), n)),
+        Case("MinHeap", "heapify", "heapq",
+             _values,
+             lambda s, n: _once(lambda: heapq.heapify(s), n)),
+        Case("MinHeap", "remove_min", "MinHeap",
+             lambda n: MinHeap(_values(n)),
+             lambda s, n: _repeat(s.remove_min, n)),
+        Case("MinHeap", "remove_min", "heapq",
+             heapified,
+             lambda s, n: _repeat(lambda: heapq.heappop(s), n)),
+        Case("MinHeap", "remove_min", "DAryHeap",
+             lambda n: DAryHeap(_values(n)),
+             lambda s, n: _repeat(s.remove_min, n)),
+        Case("MinHeap", "remove_min", "PairingHeap",
+             lambda n: PairingHeap(_values(n)),
+             lambda s, n: _repeat(s.remove_min, n)),
+        Case("MinHeap", "replace", "MinHeap",
+             lambda n: (MinHeap(_values(n)), _values(n)),
+             lambda s, n: _each(s[0].replace, s[1])),
+        Case("MinHeap", "replace", "heapq",
+             lambda n: (heapified(n), _values(n)),
+             lambda s, n: _each(lambda v: heapq.heapreplace(s[0], v), s[1])),
+        Case("MinHeap", "replace", "PairingHeap",
+             lambda n: (PairingHeap(_values(n)), _values(n)),
+             lambda s, n: _each(s[0].replace, s[1])),
+        Case("MinHeap", "pushpop", "MinHeap",
+             lambda n: (MinHeap(_values(n)), _values(n)),
+             lambda s, n: _each(s[0].pushpop, s[1])),
+        Case("MinHeap", "pushpop", "heapq",
+             lambda n: (heapified(n), _values(n)),
+             lambda s, n: _each(lambda v: heapq.heappushpop(s[0], v), s[1])),
+        Case("MinHeap", "pushpop", "PairingHeap",
+             lambda n: (PairingHeap(_values(n)), _values(n)),
+             lambda s, n: _each(s[0].pushpop, s[1])),
+        Case("MinHeap", "merge", "MinHeap",
+             lambda n: (MinHeap(_values(n)), MinHeap(_values(n))),
+             lambda s, n: _once(lambda: s[0].merge(s[1]), n)),
+        Case("MinHeap", "merge", "heapq",
+             lambda n: (heapified(n), heapified(n)),
+             lambda s, n: _once(lambda: heapq.heapify(s[0] + s[1]), n)),
+        Case("MinHeap", "merge", "DAryHeap",
+             lambda n: (DAryHeap(_values(n)), DAryHeap(_values(n))),
+             lambda s, n: _once(lambda: s[0].merge(s[1]), n)),
+        Case("MinHeap", "merge", "PairingHeap",
+             lambda n: (PairingHeap(_values(n)), PairingHeap(_values(n))),
+             lambda s, n: _once(lambda: s[0].merge(s[1]), n)),
+        Case("MinHeap", "peek", "MinHeap",
+             lambda n: MinHeap(_values(n)),
+             lambda s, n: _repeat(s.peek, n)),
+        Case("MinHeap", "peek", "heapq",
+             heapified,
+             lambda s, n: _repeat(lambda: s[0], n)),
+        Case("MinHeap", "nsmallest", "MinHeap",
+             lambda n: MinHeap(_values(n)),
+             lambda s, n: len(s.nsmallest(NSMALLEST_K))),
+        Case("MinHeap", "nsmallest", "heapq",
+             heapified,
+             lambda s, n: len(heapq.nsmallest(NSMALLEST_K, s))),
+        Case("MinHeap", "nsmallest", "PairingHeap",
+             lambda n: PairingHeap(_values(n)),
+             lambda s, n: len(s.nsmallest(NSMALLEST_K))),
+        Case("MinHeap", "iter_sorted", "MinHeap",
+             lambda n: MinHeap(_values(n)),
+             lambda s, n: len(list(s.iter_sorted()))),
+        Case("MinHeap", "iter_sorted", "heapq",
+             heapified,
+             lambda s, n: len(heapq.nsmallest(n, s))),
+    ]
+    # fmt: on
+
+
+def _linked_list_cases() -> list[Case]:
+    """LinkedList against list"""
+    # fmt: off
+    return [
+        Case("LinkedList", "append", "LinkedList",
+             lambda n: (LinkedList(), _values(n)),
+             lambda s, n: _each(s[0].append, s[1])),
+        Case("LinkedList", "append", "list",
+             lambda n: ([], _values(n)),
+             lambda s, n: _each(s[0].append, s[1])),
+        Case("LinkedList", "prepend", "LinkedList",
+             lambda n: (LinkedList(), _values(n)),
+             lambda s, n: _each(s[0].prepend, s[1])),
+        Case("LinkedList", "prepend", "list",
+             lambda n: ([], _values(n)[:LINEAR_OPS_LIMIT]),
+             lambda s, n: _each(lambda v: s[0].insert(0, v), s[1])),
+        Case("LinkedList", "extend", "LinkedList",
+             lambda n: (LinkedList(), _values(n)),
+             lambda s, n: _once(lambda: s[0].extend(s[1]), n)),
+        Case("LinkedList", "extend", "list",
+             lambda n: ([], _values(n)),
+             lambda s, n: _once(lambda: s[0].extend(s[1]), n)),
+        Case("LinkedList", "get", "LinkedList",
+             lambda n: (LinkedList(_values(n)), _positions(n)),
+             lambda s, n: _each(s[0].get, s[1])),
+        Case("LinkedList", "get", "list",
+             lambda n: (_values(n), _positions(n)),
+             lambda s, n: _each(s[0].__getitem__, s[1])),
+        Case("LinkedList", "set", "LinkedList",
+             lambda n: (LinkedList(_values(n)), _positions(n)),
+             lambda s, n: _each(lambda i: s[0].set(i, i), s[1])),
+        Case("LinkedList", "set", "list",
+             lambda n: (_values(n), _positions(n)),
+             lambda s, n: _each(lambda i: s[0].__setitem__(i, i), s[1])),
+        Case("LinkedList", "insert", "LinkedList",
+             lambda n: (LinkedList(_values(n)), _positions(n)),
+             lambda s, n: _each(lambda i: s[0].insert(i, i), s[1])),
+        Case("LinkedList", "insert", "list",
+             lambda n: (_values(n), _positions(n)),
+             lambda s, n: _each(lambda i: s[0].insert(i, i), s[1])),
+        Case("LinkedList", "remove", "LinkedList",
+             lambda n: (LinkedList(_values(2 * n)), _positions(n)),
+             lambda s, n: _each(s[0].remove, s[1])),
+        Case("LinkedList", "remove", "list",
+             lambda n: (_values(2 * n), _positions(n)),
+             lambda s, n: _each(s[0].pop, s[1])),
+        Case("LinkedList", "splice", "LinkedList",
+             lambda n: (LinkedList(_values(n)), LinkedList(_values(n))),
+             lambda s, n: _once(lambda: s[0].splice(n // 2, s[1]), 1)),
+        Case("LinkedList", "splice", "list",
+             lambda n: (_values(n), _values(n)),
+             lambda s, n: _once(lambda: s[0].__setitem__(slice(n // 2, n // 2), s[1]),
+                                1)),
+        Case("LinkedList", "concat", "LinkedList",
+             lambda n: (LinkedList(_values(n)), LinkedList(_values(n))),
+             lambda s, n: _once(lambda: s[0].concat(s[1]), 1)),
+        Case("LinkedList", "concat", "list",
+             lambda n: (_values(n), _values(n)),
+             lambda s, n: _once(lambda: s[0].extend(s[1]), 1)),
+        Case("LinkedList", "split_at", "LinkedList",
+             lambda n: LinkedList(_values(n)),
+             lambda s, n: _once(lambda: s.split_at(n // 2), 1)),
+        Case("LinkedList", "split_at", "list",
+             _values,
+             lambda s, n: _once(lambda: (s[n // 2 :], s.__delitem__(_second_half(n))),
+                                1)),
+        Case("LinkedList", "get slice", "LinkedList",
+             lambda n: LinkedList(_values(n)),
+             lambda s, n: _once(lambda: s[_second_half(n)], 1)),
+        Case("LinkedList", "get slice", "list",
+             _values,
+             lambda s, n: _once(lambda: s[_second_half(n)], 1)),
+        Case("LinkedList", "set slice", "LinkedList",
+             lambda n: (LinkedList(_values(n)), _values(n // 2)),
+             lambda s, n: _once(lambda: s[0].__setitem__(_second_half(n), s[1]), 1)),
+        Case("LinkedList", "set slice", "list",
+             lambda n: (_values(n), _values(n // 2)),
+             lambda s, n: _once(lambda: s[0].__setitem__(_second_half(n), s[1]), 1)),
+        Case("LinkedList", "delete slice", "LinkedList",
+             lambda n: LinkedList(_values(n)),
+             lambda s, n: _once(lambda: s.__delitem__(_second_half(n)), 1)),
+        Case("LinkedList", "delete slice", "list",
+             _values,
+             lambda s, n: _once(lambda: s.__delitem__(_second_half(n)), 1)),
+        Case("LinkedList", "iter", "LinkedList",
+             lambda n: LinkedList(_values(n)),
+             lambda s, n: sum(1 for _ in s)),
+        Case("LinkedList", "iter", "list",
+             _values,
+             lambda s, n: sum(1 for _ in s)),
+    ]
+    # fmt: on
+
+
+def _queue_cases() -> list[Case]:
+    """Queue against collections.deque"""
+    # fmt: off
+    return [
+        Case("Queue", "enqueue", "Queue",
+             lambda n: (Queue(), _values(n)),
+             lambda s, n: _each(s[0].enqueue, s[1])),
+        Case("Queue", "enqueue", "deque",
+             lambda n: (deque(), _values(n)),
+             lambda s, n: _each(s[0].append, s[1])),
+        Case("Queue", "dequeue", "Queue",
+             lambda n: Queue(_values(n)),
+             lambda s, n: _repeat(s.dequeue, n)),
+        Case("Queue", "dequeue", "deque",
+             lambda n: deque(_values(n)),
+             lambda s, n: _repeat(s.popleft, n)),
+        Case("Queue", "peek", "Queue",
+             lambda n: Queue(_values(n)),
+             lambda s, n: _repeat(s.peek, n)),
+        Case("Queue", "peek", "deque",
+             lambda n: deque(_values(n)),
+             lambda s, n: _repeat(lambda: s[0], n)),
+        Case("Queue", "extend", "Queue",
+             lambda n: (Queue(), _values(n)),
+             lambda s, n: _once(lambda: s[0].extend(s[1]), n)),
+        Case("Queue", "extend", "deque",
+             lambda n: (deque(), _values(n)),
+             lambda s, n: _once(lambda: s[0].extend(s[1]), n)),
+        Case("Queue", "iter", "Queue",
+             lambda n: Queue(_values(n)),
+             lambda s, n: sum(1 for _ in s)),
+        Case("Queue", "iter", "deque",
+             lambda n: deque(_values(n)),
+             lambda s, n: _drain_deque(s)),
+    ]
+    # fmt: on
+
+
+def _drain_deque(values: deque) -> int:
+    """Pop every value from the left of a deque, like Queue's draining iterator"""
+    count = 0
+    while values:
+        values.popleft()
+        count += 1
+    return count
+
+
+def _deque_cases() -> list[Case]:
+    """Deque against collections.deque"""
+    # fmt: off
+    return [
+        Case("Deque", "append", "Deque",
+             lambda n: (Deque(), _values(n)),
+             lambda s, n: _each(s[0].append, s[1])),
+        Case("Deque", "append", "deque",
+             lambda n: (deque(), _values(n)),
+             lambda s, n: _each(s[0].append, s[1])),
+        Case("Deque", "appendleft", "Deque",
+             lambda n: (Deque(), _values(n)),
+             lambda s, n: _each(s[0].appendleft, s[1])),
+        Case("Deque", "appendleft", "deque",
+             lambda n: (deque(), _values(n)),
+             lambda s, n: _each(s[0].appendleft, s[1])),
+        Case("Deque", "pop", "Deque",
+             lambda n: Deque(_values(n)),
+             lambda s, n: _repeat(s.pop, n)),
+        Case("Deque", "pop", "deque",
+             lambda n: deque(_values(n)),
+             lambda s, n: _repeat(s.pop, n)),
+        Case("Deque", "popleft", "Deque",
+             lambda n: Deque(_values(n)),
+             lambda s, n: _repeat(s.popleft, n)),
+        Case("Deque", "popleft", "deque",
+             lambda n: deque(_values(n)),
+             lambda s, n: _repeat(s.popleft, n)),
+        Case("Deque", "getitem", "Deque",
+             lambda n: (Deque(_values(n)), _positions(n)),
+             lambda s, n: _each(s[0].__getitem__, s[1])),
+        Case("Deque", "getitem", "deque",
+             lambda n: (deque(_values(n)), _positions(n)),
+             lambda s, n: _each(s[0].__getitem__, s[1])),
+    ]
+    # fmt: on
+
+
+def _stack_cases() -> list[Case]:
+    """Stack against list"""
+    # fmt: off
+    return [
+        Case("Stack", "push", "Stack",
+             lambda n: (Stack(), _values(n)),
+             lambda s, n: _each(s[0].push, s[1])),
+        Case("Stack", "push", "list",
+             lambda n: ([], _values(n)),
+             lambda s, n: _each(s[0].append, s[1])),
+        Case("Stack", "pop", "Stack",
+             lambda n: Stack(_values(n)),
+             lambda s, n: _repeat(s.pop, n)),
+        Case("Stack", "pop", "list",
+             _values,
+             lambda s, n: _repeat(s.pop, n)),
+        Case("Stack", "peek", "Stack",
+             lambda n: Stack(_values(n)),
+             lambda s, n: _repeat(s.peek, n)),
+        Case("Stack", "peek", "list",
+             _values,
+             lambda s, n: _repeat(lambda: s[-1], n)),
+        Case("Stack", "push_many", "Stack",
+             lambda n: (Stack(), _values(n)),
+             lambda s, n: _once(lambda: s[0].push_many(s[1]), n)),
+        Case("Stack", "push_many", "list",
+             lambda n: ([], _values(n)),
+             lambda s, n: _once(lambda: s[0].extend(s[1]), n)),
+        Case("Stack", "pop_many", "Stack",
+             lambda n: Stack(_values(n)),
+             lambda s, n: len(s.pop_many(n))),
+        Case("Stack", "pop_many", "list",
+             _values,
+             lambda s, n: len(_pop_slice(s, n))),
+        Case("Stack", "iter", "Stack",
+             lambda n: Stack(_values(n)),
+             lambda s, n: sum(1 for _ in s)),
+        Case("Stack", "iter", "list",
+             _values,
+             lambda s, n: _drain_list(s)),
+    ]
+    # fmt: on
+
+
+def _pop_slice(values: list, count: int) -> list:
+    """Pop count values from the end of a list at once, like Stack.pop_many()"""
+    popped = values[-count:]
+    del values[-count:]
+    popped.reverse()
+    return popped
+
+
+def _drain_list(values: list) -> int:
+    """Pop every value from the end of a list, like Stack's draining iterator"""
+    count = 0
+    while values:
+        values.pop()
+        count += 1
+    return count
+
+
+CASES: list[Case] = (
+    _min_heap_cases()
+    + _linked_list_cases()
+    + _queue_cases()
+    + _deque_cases()
+    + _stack_cases()
+)
+
+
+def measure_speed(case: Case, size: int) -> float:
+    """Measure a case's operations per second at a given size"""
+    total_ops = 0
+    total_seconds = 0.0
+    repeats = 0
+    # Each repetition needs a fresh state, since most operations consume it
+    while True:
+        state = case.setup(size)
+        start = time.perf_counter()
+        ops = case.run(state, size)
+        total_seconds += time.perf_counter() - start
+        total_ops += ops
+        repeats += 1
+        if total_seconds >= MIN_MEASURE_SECONDS or repeats >= MAX_REPEATS:
+            break
+    return total_ops / total_seconds
+
+
+def measure_peak_memory(case: Case, size: int) -> int:
+    """Measure the peak memory used while setting up and running a case"""
+    tracemalloc.start()
+    try:
+        state = case.setup(size)
+        case.run(state, size)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def scaling_exponent(sizes: list[int], ops_per_sec: list[float]) -> float:
+    """
+    Fit the time per operation to size^k, returning k
+
+    0 means constant time per operation, 1 means linear time per operation, and so
+    on. This is the slope of a least squares fit on a log-log scale.
+    """
+    if len(sizes) < 2:
+        return 0.0
+    xs = [math.log(size) for size in sizes]
+    ys = [-math.log(rate) for rate in ops_per_sec]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return covariance / variance
+
+
+def run(sizes: list[int], structures: list[str] | None = None) -> dict[str, Any]:
+    """Run every case at every size, returning JSON-serializable results"""
+    results: list[Result] = []
+    scaling: list[dict[str, Any]] = []
+    for case in CASES:
+        if structures and case.structure not in structures:
+            continue
+        case_results = []
+        for size in sizes:
+            peak = measure_peak_memory(case, size) if size <= MAX_MEMORY_SIZE else None
+            result = Result(
+                case.structure,
+                case.operation,
+                case.implementation,
+                size,
+                measure_speed(case, size),
+                peak,
+            )
+            case_results.append(result)
+            print(
+                f"{case.structure:>10} {case.operation:>11} {case.implementation:>10}"
+                f" {size:>10} {result.ops_per_sec:>14,.0f} ops/s"
+                f" {'-' if peak is None else f'{peak:,}':>14} B",
+                file=sys.stderr,
+            )
+        results += case_results
+        scaling.append(
+            {
+                "structure": case.structure,
+                "operation": case.operation,
+                "implementation": case.implementation,
+                "exponent": scaling_exponent(
+                    [result.size for result in case_results],
+                    [result.ops_per_sec for result in case_results],
+                ),
+            }
+        )
+    return {
+        "metadata": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+            "sizes": sizes,
+        },
+        "results": [asdict(result) for result in results],
+        "scaling": scaling,
+    }
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float
+) -> list[str]:
+    """
+    List every regression from the baseline to the current results
+
+    A regression is a drop in ops/sec, or a rise in peak memory, by more than the
+    threshold fraction. Cases missing from either side are ignored.
+    """
+
+    def by_key(data: dict[str, Any]) -> dict[tuple, dict[str, Any]]:
+        return {
+            (r["structure"], r["operation"], r["implementation"], r["size"]): r
+            for r in data["results"]
+        }
+
+    baseline_results = by_key(baseline)
+    regressions = []
+    for key, result in sorted(by_key(current).items()):
+        if key not in baseline_results:
+            continue
+        before = baseline_results[key]
+        name = "{} {} ({}) at size {}".format(*key)
+        if result["ops_per_sec"] < before["ops_per_sec"] * (1 - threshold):
+            regressions.append(
+                f"{name}: {before['ops_per_sec']:,.0f} -> "
+                f"{result['ops_per_sec']:,.0f} ops/s"
+            )
+        if (
+            before["peak_bytes"] is not None
+            and result["peak_bytes"] is not None
+            and result["peak_bytes"] > before["peak_bytes"] * (1 + threshold)
+        ):
+            regressions.append(
+                f"{name}: {before['peak_bytes']:,} -> {result['peak_bytes']:,} bytes"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    run_parser.add_argument(
+        "--max-size",
+        type=int,
+        help="use every power of 10 from 10 up to this size instead of --sizes",
+    )
+    run_parser.add_argument(
+        "--structure",
+        action="append",
+        choices=sorted({case.structure for case in CASES}),
+        help="only benchmark this structure (can be repeated)",
+    )
+    run_parser.add_argument("--output", help="write the JSON results to this file")
+
+    compare_parser = subparsers.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="allowed fractional slowdown or memory growth (default 0.2)",
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        sizes = args.sizes
+        if args.max_size is not None:
+            sizes = [10**exponent for exponent in range(1, len(str(args.max_size)))]
+        results = run(sizes, args.structure)
+        output = json.dumps(results, indent=2)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as file:
+                file.write(output)
+        else:
+            print(output)
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    with open(args.current, encoding="utf-8") as file:
+        current = json.load(file)
+    regressions = compare(baseline, current, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print("No regressions")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
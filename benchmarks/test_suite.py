@@ -0,0 +1,74 @@
+"""Tests for suite.py"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from benchmarks import suite
+
+
+def _results(ops_per_sec: float, peak_bytes: int | None) -> dict:
+    """A results document with a single measurement"""
+    return {
+        "results": [
+            {
+                "structure": "Queue",
+                "operation": "enqueue",
+                "implementation": "Queue",
+                "size": 100,
+                "ops_per_sec": ops_per_sec,
+                "peak_bytes": peak_bytes,
+            }
+        ]
+    }
+
+
+class SuiteTest(unittest.TestCase):
+    """Benchmark suite tests"""
+
+    def test_scaling_exponent(self):
+        """Test fitting the growth of the time per operation"""
+        sizes = [10, 100, 1000]
+        self.assertAlmostEqual(suite.scaling_exponent(sizes, [1e6, 1e6, 1e6]), 0)
+        self.assertAlmostEqual(suite.scaling_exponent(sizes, [1e6, 1e5, 1e4]), 1)
+        self.assertEqual(suite.scaling_exponent([10], [1e6]), 0)
+
+    def test_compare(self):
+        """Test that only changes past the threshold count as regressions"""
+        baseline = _results(1000, 1000)
+        self.assertEqual(suite.compare(baseline, _results(900, 1100), 0.2), [])
+        self.assertEqual(len(suite.compare(baseline, _results(700, 1000), 0.2)), 1)
+        self.assertEqual(len(suite.compare(baseline, _results(1000, 1300), 0.2)), 1)
+        self.assertEqual(suite.compare(baseline, _results(1000, None), 0.2), [])
+        self.assertEqual(suite.compare({"results": []}, _results(1, 1), 0.2), [])
+
+    @mock.patch.object(suite, "MIN_MEASURE_SECONDS", 0)
+    def test_run_and_compare(self):
+        """Test a small end to end run through the command line"""
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "results.json")
+            self.assertEqual(
+                suite.main(
+                    ["run", "--sizes", "10", "20", "--structure", "Stack"]
+                    + ["--output", output]
+                ),
+                0,
+            )
+            with open(output, encoding="utf-8") as file:
+                results = json.load(file)
+            self.assertEqual(
+                {result["structure"] for result in results["results"]}, {"Stack"}
+            )
+            self.assertTrue(all(r["ops_per_sec"] > 0 for r in results["results"]))
+            self.assertEqual(suite.main(["compare", output, output]), 0)
+
+            slower = dict(results)
+            slower["results"] = [
+                dict(result, ops_per_sec=result["ops_per_sec"] / 10)
+                for result in results["results"]
+            ]
+            slower_output = os.path.join(directory, "slower.json")
+            with open(slower_output, "w", encoding="utf-8") as file:
+                json.dump(slower, file)
+            self.assertEqual(suite.main(["compare", output, slower_output]), 1)
@@ -0,0 +1,189 @@
+"""asyncio queue implementations backed by Queue, Stack and MinHeap"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Generic, Iterable, TypeVar
+
+from data_structures.blocking_queue import Empty, Full
+from data_structures.min_heap import MinHeap
+from data_structures.queue import Queue
+from data_structures.stack import Stack
+
+T = TypeVar("T")  # pylint: disable=invalid-name
+
+
+class AsyncContainer(ABC, Generic[T]):
+    """
+    Awaitable put()/get() on top of a single-threaded container
+
+    Waiting producers and consumers park on futures, and each put or get wakes at
+    most one of them. A `maxsize` of 0 means unbounded. Iterating with `async for`
+    drains values forever, taking everything available after each wakeup, so a
+    burst of puts costs the consumer one wakeup rather than one per value.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.maxsize: int = maxsize
+        self.getters: deque[asyncio.Future] = deque()
+        self.putters: deque[asyncio.Future] = deque()
+
+    @abstractmethod
+    def _put(self, value: T) -> None:
+        """Add a value to the underlying container"""
+
+    @abstractmethod
+    def _get(self) -> T:
+        """Remove and return the next value from the underlying container"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    def empty(self) -> bool:
+        """Whether there are no values to get"""
+        return len(self) == 0
+
+    def full(self) -> bool:
+        """Whether putting a value would have to wait"""
+        return 0 < self.maxsize <= len(self)
+
+    async def put(self, value: T) -> None:
+        """Put a value, waiting for free space if the container is full"""
+        while self.full():
+            await self._wait(self.putters, self.full)
+        self.put_nowait(value)
+
+    async def put_many(self, iterable: Iterable[T]) -> None:
+        """Put all values from an iterable, waiting for free space as needed"""
+        for value in iterable:
+            while self.full():
+                await self._wait(self.putters, self.full)
+            self.put_nowait(value)
+
+    def put_nowait(self, value: T) -> None:
+        """Put a value, raising Full if there is no free space"""
+        if self.full():
+            raise Full
+        self._put(value)
+        self._wakeup_next(self.getters)
+
+    async def get(self) -> T:
+        """Remove and return the next value, waiting for one if there are none"""
+        while self.empty():
+            await self._wait(self.getters, self.empty)
+        return self.get_nowait()
+
+    def get_nowait(self) -> T:
+        """Remove and return the next value, raising Empty if there is none"""
+        if self.empty():
+            raise Empty
+        value = self._get()
+        self._wakeup_next(self.putters)
+        return value
+
+    def get_many_nowait(self, n: int) -> list[T]:
+        """Remove and return up to n of the values available right now"""
+        values = [self._get() for _ in range(min(n, len(self)))]
+        for _ in values:
+            if not self.putters:
+                break
+            self._wakeup_next(self.putters)
+        return values
+
+    async def drain(self) -> AsyncIterator[T]:
+        """Yield values forever, waiting only when none are left"""
+        while True:
+            while self.empty():
+                await self._wait(self.getters, self.empty)
+            for value in self.get_many_nowait(len(self)):
+                yield value
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self.drain()
+
+    @staticmethod
+    def _wakeup_next(waiters: deque[asyncio.Future]) -> None:
+        """Wake the first waiter that is still waiting"""
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _wait(
+        self, waiters: deque[asyncio.Future], still_blocked: Callable[[], bool]
+    ) -> None:
+        """Park on a new future until woken up"""
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                # The waiter had already been woken up and removed
+                pass
+            # If we were woken up but cancelled before acting on it, pass the
+            # wakeup on so that it isn't lost
+            if not still_blocked() and not waiter.cancelled():
+                self._wakeup_next(waiters)
+            raise
+
+
+class AsyncQueue(AsyncContainer[T]):
+    """FIFO asyncio queue"""
+
+    def __init__(self, maxsize: int = 0) -> None:
+        super().__init__(maxsize)
+        self.queue: Queue[T] = Queue()
+
+    def _put(self, value: T) -> None:
+        self.queue.enqueue(value)
+
+    def _get(self) -> T:
+        return self.queue.dequeue()
+
+    def __len__(self) -> int:
+        return len(self.queue)
+
+
+class AsyncStack(AsyncContainer[T]):
+    """LIFO asyncio queue"""
+
+    def __init__(self, maxsize: int = 0) -> None:
+        super().__init__(maxsize)
+        self.stack: Stack[T] = Stack()
+
+    def _put(self, value: T) -> None:
+        self.stack.push(value)
+
+    def _get(self) -> T:
+        return self.stack.pop()
+
+    def __len__(self) -> int:
+        return len(self.stack)
+
+
+class AsyncPriorityQueue(AsyncContainer[T]):
+    """asyncio priority queue, which gets the smallest value first"""
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        key: Callable[[T], Any] | None = None,
+        reverse: bool = False,
+    ) -> None:
+        super().__init__(maxsize)
+        self.heap: MinHeap = MinHeap(key=key, reverse=reverse)
+
+    def _put(self, value: T) -> None:
+        self.heap.insert(value)
+
+    def _get(self) -> T:
+        return self.heap.remove_min()
+
+    def __len__(self) -> int:
+        return len(self.heap)
@@ -0,0 +1,164 @@
+"""Thread-safe blocking queue implementation"""
+
+import multiprocessing.synchronize
+import threading
+import time
+from typing import Callable, Generic, Iterable, TypeVar
+
+from data_structures.queue import Queue
+
+T = TypeVar("T")  # pylint: disable=invalid-name
+
+
+class Empty(IndexError):
+    """Raised when getting from an empty queue without waiting long enough"""
+
+
+class Full(Exception):
+    """Raised when putting into a full queue without waiting long enough"""
+
+
+def wait_for(
+    condition: threading.Condition | multiprocessing.synchronize.Condition,
+    predicate: Callable[[], bool],
+    block: bool,
+    timeout: float | None,
+    error: type[Exception],
+) -> None:
+    """
+    Wait on a condition (whose lock is held) until the predicate is true
+
+    Raises `error` straight away if `block` is false, or once `timeout` runs out.
+    The shared-memory queues use this too, with multiprocessing conditions.
+    """
+    if not block:
+        raise error
+    if timeout is not None and timeout < 0:
+        raise ValueError("'timeout' must be a non-negative number")
+    if not condition.wait_for(predicate, timeout):
+        raise error
+
+
+class BlockingQueue(Generic[T]):
+    """
+    Thread-safe FIFO queue with an optional capacity limit
+
+    Producers block (or time out) while the queue holds `maxsize` values, which
+    pushes back on bursts instead of letting memory grow without bound. A `maxsize`
+    of 0 means unbounded. Values are stored in a ring-buffer `Queue`.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.maxsize: int = maxsize
+        self.queue: Queue[T] = Queue()
+        self.unfinished_tasks: int = 0
+
+        # All three conditions share one lock, so each operation takes it only once
+        self.mutex = threading.Lock()
+        self.not_empty = threading.Condition(self.mutex)
+        self.not_full = threading.Condition(self.mutex)
+        self.all_tasks_done = threading.Condition(self.mutex)
+
+    def put(self, value: T, block: bool = True, timeout: float | None = None) -> None:
+        """Put a value, waiting for free space if the queue is full"""
+        with self.not_full:
+            if 0 < self.maxsize <= self.queue.length:
+                wait_for(
+                    self.not_full,
+                    lambda: self.queue.length < self.maxsize,
+                    block,
+                    timeout,
+                    Full,
+                )
+            self.queue.enqueue(value)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+    def put_many(
+        self, iterable: Iterable[T], block: bool = True, timeout: float | None = None
+    ) -> None:
+        """
+        Put all values from an iterable, in as few lock acquisitions as possible
+
+        With a capacity limit, values are added in chunks as space frees up. If
+        waiting fails part way through, the values already added stay in the queue.
+        """
+        values = list(iterable)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        start = 0
+        while start < len(values):
+            with self.not_full:
+                if self.maxsize > 0:
+                    if self.queue.length >= self.maxsize:
+                        remaining = None
+                        if deadline is not None:
+                            remaining = max(0.0, deadline - time.monotonic())
+                        wait_for(
+                            self.not_full,
+                            lambda: self.queue.length < self.maxsize,
+                            block,
+                            remaining,
+                            Full,
+                        )
+                    stop = start + self.maxsize - self.queue.length
+                else:
+                    stop = len(values)
+                chunk = values[start:stop]
+                self.queue.extend(chunk)
+                self.unfinished_tasks += len(chunk)
+                self.not_empty.notify(len(chunk))
+                start = stop
+
+    def put_nowait(self, value: T) -> None:
+        """Put a value, raising Full immediately if there is no free space"""
+        self.put(value, block=False)
+
+    def get(self, block: bool = True, timeout: float | None = None) -> T:
+        """Remove and return the next value, waiting for one if the queue is empty"""
+        with self.not_empty:
+            if self.queue.length == 0:
+                wait_for(
+                    self.not_empty, lambda: self.queue.length > 0, block, timeout, Empty
+                )
+            value = self.queue.dequeue()
+            self.not_full.notify()
+            return value
+
+    def get_nowait(self) -> T:
+        """Remove and return the next value, raising Empty if there is none"""
+        return self.get(block=False)
+
+    def get_many(self, n: int, timeout: float | None = None) -> list[T]:
+        """
+        Remove and return up to n values under a single lock acquisition
+
+        Waits (up to `timeout`) only until at least one value is available, then
+        returns everything available up to n without waiting for more.
+        """
+        with self.not_empty:
+            if self.queue.length == 0:
+                wait_for(
+                    self.not_empty, lambda: self.queue.length > 0, True, timeout, Empty
+                )
+            dequeue = self.queue.dequeue
+            values = [dequeue() for _ in range(min(n, self.queue.length))]
+            self.not_full.notify(len(values))
+            return values
+
+    def task_done(self) -> None:
+        """Mark a previously retrieved value as fully processed"""
+        with self.all_tasks_done:
+            if self.unfinished_tasks <= 0:
+                raise ValueError("task_done() called too many times")
+            self.unfinished_tasks -= 1
+            if self.unfinished_tasks == 0:
+                self.all_tasks_done.notify_all()
+
+    def join(self) -> None:
+        """Block until every value put into the queue has been marked as done"""
+        with self.all_tasks_done:
+            self.all_tasks_done.wait_for(lambda: self.unfinished_tasks == 0)
+
+    def __len__(self) -> int:
+        with self.mutex:
+            return len(self.queue)
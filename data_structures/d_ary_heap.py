@@ -0,0 +1,85 @@
+"""d-ary min-heap implementation"""
+
+from typing import Any, Callable, Iterable, TypeVar
+from typing_protocols.protocols import Comparable
+
+from data_structures.min_heap import MinHeap
+
+T = TypeVar("T", bound=Comparable)  # pylint: disable=invalid-name
+
+
+class DAryHeap(MinHeap[T]):
+    """
+    Min-heap where every node has `arity` children instead of 2
+
+    A wider heap has log_d(n) levels instead of log_2(n), so inserts sift up through
+    fewer levels, and each level's children sit next to each other in the table.
+    Removals compare all d children on every level they sift down through, which in
+    CPython costs more than the levels saved, so wider heaps suit insert-heavy
+    workloads. `python -m benchmarks.bench_heaps` shows where each arity wins.
+    """
+
+    def __init__(
+        self,
+        iterable: Iterable[T] | None = None,
+        arity: int = 4,
+        key: Callable[[T], Any] | None = None,
+        reverse: bool = False,
+    ) -> None:
+        if arity < 2:
+            raise ValueError("The arity must be at least 2")
+        self.arity = arity
+        super().__init__(iterable, key=key, reverse=reverse)
+
+    def _sift_up(self, idx: int) -> int:
+        table = self.table
+        keys = self.keys
+        less = self._less
+        arity = self.arity
+        value = table[idx]
+        key = keys[idx]
+
+        # Same as MinHeap._sift_up(), with the parent found by the arity
+        while idx > 0:
+            parent_idx = (idx - 1) // arity
+            parent_key = keys[parent_idx]
+            if not less(key, parent_key):
+                break
+            table[idx] = table[parent_idx]
+            keys[idx] = parent_key
+            idx = parent_idx
+        table[idx] = value
+        keys[idx] = key
+        return idx
+
+    def _sift_down(self, idx: int) -> int:
+        table = self.table
+        keys = self.keys
+        less = self._less
+        arity = self.arity
+        length = self.length
+        value = table[idx]
+        key = keys[idx]
+
+        # Move the smallest of up to `arity` children into the hole while it is
+        # smaller than the value
+        first_child_idx = (idx * arity) + 1
+        while first_child_idx < length:
+            child_idx = first_child_idx
+            child_key = keys[child_idx]
+            for sibling_idx in range(
+                first_child_idx + 1, min(first_child_idx + arity, length)
+            ):
+                sibling_key = keys[sibling_idx]
+                if less(sibling_key, child_key):
+                    child_idx = sibling_idx
+                    child_key = sibling_key
+            if not less(child_key, key):
+                break
+            table[idx] = table[child_idx]
+            keys[idx] = child_key
+            idx = child_idx
+            first_child_idx = (idx * arity) + 1
+        table[idx] = value
+        keys[idx] = key
+        return idx
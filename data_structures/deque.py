@@ -0,0 +1,79 @@
+"""Double-ended queue implementation"""
+
+from typing import Iterable, TypeVar
+
+from data_structures.ring_buffer import RingBuffer
+
+T = TypeVar("T")  # pylint: disable=invalid-name
+
+
+class Deque(RingBuffer[T]):
+    """
+    Double-ended queue backed by a growable circular buffer
+
+    Like Queue, this is a RingBuffer, but values can be added and removed at both
+    ends in O(1), and any index can be read or written in O(1). Iterating and
+    views go from left to right, and iterating pops the values from the left.
+    """
+
+    def appendleft(self, value: T) -> None:
+        """Add a value to the left end"""
+        capacity = len(self.buffer)
+        if self.length == capacity:
+            self._resize(capacity * 2)
+            capacity *= 2
+        self.head = (self.head - 1) & (capacity - 1)
+        self.buffer[self.head] = value
+        self.length += 1
+
+    def pop(self) -> T:
+        """Remove and return the value at the right end"""
+        if self.length == 0:
+            raise IndexError
+
+        self.length -= 1
+        idx = (self.head + self.length) & (len(self.buffer) - 1)
+        value = self.buffer[idx]
+        self.buffer[idx] = None
+        if self.shrink:
+            self._maybe_shrink()
+        return value  # type: ignore[return-value]
+
+    def extendleft(self, iterable: Iterable[T]) -> None:
+        """Add all values from an iterable to the left end, so they end up reversed"""
+        values = list(iterable)
+        count = len(values)
+        if count == 0:
+            return
+
+        capacity = self._reserve(count)
+        values.reverse()
+        # The batch ends just before the head, and may wrap around the start
+        start = (self.head - count) & (capacity - 1)
+        first_part = min(count, capacity - start)
+        self.buffer[start : start + first_part] = values[:first_part]
+        self.buffer[: count - first_part] = values[first_part:]
+        self.head = start
+        self.length += count
+
+    def peek(self) -> T:
+        """Peek at the value at the right end"""
+        if self.length == 0:
+            raise IndexError
+        return self.buffer[  # type: ignore[return-value]
+            (self.head + self.length - 1) & (len(self.buffer) - 1)
+        ]
+
+    def _slot(self, idx: int) -> int:
+        """Get the buffer slot for an index, which may be negative like a list's"""
+        if idx < 0:
+            idx += self.length
+        if idx < 0 or idx >= self.length:
+            raise IndexError
+        return (self.head + idx) & (len(self.buffer) - 1)
+
+    def __getitem__(self, idx: int) -> T:
+        return self.buffer[self._slot(idx)]  # type: ignore[return-value]
+
+    def __setitem__(self, idx: int, value: T) -> None:
+        self.buffer[self._slot(idx)] = value
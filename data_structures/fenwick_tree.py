@@ -0,0 +1,62 @@
+"""Fenwick tree (binary indexed tree) implementation"""
+
+from typing import Iterable
+
+
+class FenwickTree:
+    """
+    Prefix sums over a list of counts, which can each be changed in O(log n)
+
+    The chunked lists keep one over their chunk lengths, which turns an index into
+    a chunk and a position within it (and back) without adding up every chunk
+    before it.
+    """
+
+    def __init__(self, counts: Iterable[int]) -> None:
+        # 1-based, so that tree[idx] sums the (idx & -idx) counts ending at idx
+        tree = [0, *counts]
+        for idx in range(1, len(tree)):
+            parent_idx = idx + (idx & -idx)
+            if parent_idx < len(tree):
+                tree[parent_idx] += tree[idx]
+        self.tree: list[int] = tree
+
+    def add(self, idx: int, delta: int) -> None:
+        """Add delta to the count at the given index"""
+        tree = self.tree
+        size = len(tree)
+        idx += 1
+        while idx < size:
+            tree[idx] += delta
+            idx += idx & -idx
+
+    def prefix_sum(self, idx: int) -> int:
+        """The sum of the counts before the given index"""
+        tree = self.tree
+        total = 0
+        while idx > 0:
+            total += tree[idx]
+            idx -= idx & -idx
+        return total
+
+    def locate(self, total: int) -> tuple[int, int]:
+        """
+        Find the index whose count holds the given total, and how far into it it is
+
+        The total must be less than the sum of every count.
+        """
+        # Walk down the tree, skipping every subtree of counts that ends before total
+        tree = self.tree
+        size = len(tree)
+        idx = 0
+        step = 1 << (size - 1).bit_length()
+        while step:
+            next_idx = idx + step
+            if next_idx < size and tree[next_idx] <= total:
+                idx = next_idx
+                total -= tree[next_idx]
+            step >>= 1
+        return idx, total
+
+    def __len__(self) -> int:
+        return len(self.tree) - 1
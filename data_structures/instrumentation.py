@@ -0,0 +1,226 @@
+"""Opt-in instrumentation for the data structures
+
+`instrumented(cls)` returns a subclass which records statistics in a `stats`
+attribute. The original classes are left untouched, so instrumentation costs nothing
+unless an instrumented class is used:
+
+    InstrumentedMinHeap = instrumented(MinHeap)
+    heap = InstrumentedMinHeap([3, 1, 2])
+    heap.remove_min()
+    heap.stats.counts["comparisons"]
+    heap.stats.histograms["latency_ns.remove_min"].percentile(99)
+"""
+
+import functools
+import inspect
+import time
+from collections import Counter, defaultdict
+from typing import Any, Callable, TypeVar, cast
+
+from data_structures.linked_list import LinkedList
+from data_structures.min_heap import MinHeap
+
+C = TypeVar("C", bound=type)  # pylint: disable=invalid-name
+
+# Special methods which are instrumented along with the public ones
+INSTRUMENTED_DUNDERS: set[str] = {"__iter__", "__getitem__", "__setitem__"}
+
+
+class Histogram:
+    """
+    Histogram with power-of-two buckets
+
+    Bucket b counts values in [2^(b-1), 2^b), with bucket 0 counting zeros, so any
+    non-negative integer can be recorded in O(1) with bounded memory.
+    """
+
+    def __init__(self) -> None:
+        self.buckets: list[int] = []
+        self.count: int = 0
+        self.total: int = 0
+        self.max: int = 0
+
+    def record(self, value: int) -> None:
+        """Record a non-negative integer value"""
+        bucket = value.bit_length()
+        if bucket >= len(self.buckets):
+            self.buckets.extend([0] * (bucket + 1 - len(self.buckets)))
+        self.buckets[bucket] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def mean(self) -> float:
+        """The mean of all recorded values"""
+        if self.count == 0:
+            raise ValueError("No values recorded")
+        return self.total / self.count
+
+    def percentile(self, percent: float) -> int:
+        """An upper bound for the given percentile, accurate to within a factor of 2"""
+        if self.count == 0:
+            raise ValueError("No values recorded")
+        rank = percent / 100 * self.count
+        seen = 0
+        for bucket, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                return min((1 << bucket) - 1, self.max)
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """A JSON-serializable summary"""
+        summary: dict[str, Any] = {"count": self.count, "max": self.max}
+        if self.count > 0:
+            summary["mean"] = self.mean()
+            for percent in (50, 90, 99):
+                summary[f"p{percent}"] = self.percentile(percent)
+        return summary
+
+
+class Stats:
+    """Operation counters and histograms for one instrumented structure"""
+
+    def __init__(self) -> None:
+        self.counts: Counter[str] = Counter()
+        self.histograms: defaultdict[str, Histogram] = defaultdict(Histogram)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Add to a counter"""
+        self.counts[name] += amount
+
+    def observe(self, name: str, value: int) -> None:
+        """Record a value in a histogram"""
+        self.histograms[name].record(value)
+
+    def reset(self) -> None:
+        """Clear all recorded statistics"""
+        self.counts.clear()
+        self.histograms.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """A JSON-serializable summary"""
+        return {
+            "counts": dict(self.counts),
+            "histograms": {
+                name: histogram.as_dict()
+                for name, histogram in self.histograms.items()
+            },
+        }
+
+
+def _heap_depth(idx: int, arity: int = 2) -> int:
+    """The level of a heap index, where the root is level 0"""
+    if arity == 2:
+        return (idx + 1).bit_length() - 1
+    level = 0
+    while idx > 0:
+        idx = (idx - 1) // arity
+        level += 1
+    return level
+
+
+def _timed(name: str, method: Callable) -> Callable:
+    """Wrap a method to count its calls and record their latency"""
+    if inspect.isgeneratorfunction(method):
+        # Generators run lazily, so there's no single latency to record
+
+        @functools.wraps(method)
+        def counted(self, *args, **kwargs):
+            self.stats.count(f"calls.{name}")
+            return method(self, *args, **kwargs)
+
+        return counted
+
+    @functools.wraps(method)
+    def timed(self, *args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.stats.observe(f"latency_ns.{name}", time.perf_counter_ns() - start)
+            self.stats.count(f"calls.{name}")
+
+    return timed
+
+
+def _heap_hooks(cls: type) -> dict[str, Any]:
+    """Count comparisons, moves and sift depths of a MinHeap"""
+
+    def get_less(self):
+        less = self.__dict__["_less"]
+        stats = self.stats
+
+        def counting_less(first, second):
+            stats.counts["comparisons"] += 1
+            return less(first, second)
+
+        return counting_less
+
+    def set_less(self, less):
+        self.__dict__["_less"] = less
+
+    def _sift_up(self, idx):
+        new_idx = cls._sift_up(self, idx)
+        levels = _heap_depth(idx, self.arity) - _heap_depth(new_idx, self.arity)
+        self.stats.observe("sift_up.depth", levels)
+        self.stats.count("moves", levels)
+        return new_idx
+
+    def _sift_down(self, idx):
+        new_idx = cls._sift_down(self, idx)
+        levels = _heap_depth(new_idx, self.arity) - _heap_depth(idx, self.arity)
+        self.stats.observe("sift_down.depth", levels)
+        self.stats.count("moves", levels)
+        return new_idx
+
+    return {
+        "_less": property(get_less, set_less),
+        "_sift_up": _sift_up,
+        "_sift_down": _sift_down,
+    }
+
+
+def _linked_list_hooks(cls: type) -> dict[str, Any]:
+    """Record how far each lookup in a LinkedList walks"""
+
+    def _get_node(self, idx):
+        if 0 <= idx < self.length:
+            self.stats.observe("walk.length", self._walk_length(idx))
+        return cls._get_node(self, idx)
+
+    return {"_get_node": _get_node}
+
+
+@functools.cache
+def instrumented(cls: C) -> C:
+    """
+    Create a subclass of a data structure which records statistics in `stats`
+
+    Every public method records its call count and latency in nanoseconds. Heaps
+    also count comparisons and moves and record sift depths, and linked lists
+    record how many links each lookup walks.
+    """
+    namespace: dict[str, Any] = {}
+    for name in dir(cls):
+        if name.startswith("_") and name not in INSTRUMENTED_DUNDERS:
+            continue
+        attribute = inspect.getattr_static(cls, name)
+        if isinstance(attribute, (staticmethod, classmethod)) or not callable(
+            attribute
+        ):
+            continue
+        namespace[name] = _timed(name, attribute)
+
+    if issubclass(cls, MinHeap):
+        namespace.update(_heap_hooks(cls))
+    if issubclass(cls, LinkedList):
+        namespace.update(_linked_list_hooks(cls))
+
+    def __init__(self, *args, **kwargs):
+        self.stats = Stats()
+        cls.__init__(self, *args, **kwargs)
+
+    namespace["__init__"] = __init__
+    namespace["__doc__"] = f"{cls.__name__} which records statistics in `stats`"
+    return cast(C, type(f"Instrumented{cls.__name__}", (cls,), namespace))
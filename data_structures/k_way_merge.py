@@ -0,0 +1,52 @@
+"""K-way merge of sorted iterables"""
+
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+from data_structures.min_heap import MinHeap
+
+T = TypeVar("T")  # pylint: disable=invalid-name
+
+
+def merge(
+    *iterables: Iterable[T],
+    key: Callable[[T], Any] | None = None,
+    reverse: bool = False,
+) -> Iterator[T]:
+    """
+    Lazily merge sorted iterables into a single sorted iterator
+
+    Only the current head of each iterable is kept, in a MinHeap of one entry per
+    source, so merging k iterables takes O(k) memory however long they are. Each
+    value replaces the one before it from the same source at the top of the heap in
+    a single sift. Equal values are yielded in the order of their iterables.
+    """
+    # Entries are [key, order, value, iterator]. The order is unique, so comparing
+    # entries never reaches the values, and it's negated when reversed to stay stable
+    direction = -1 if reverse else 1
+    entries: list[list] = []
+    for order, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for value in iterator:
+            first_key = value if key is None else key(value)
+            entries.append([first_key, order * direction, value, iterator])
+            break
+    heap: MinHeap[Any] = MinHeap(entries, reverse=reverse)
+
+    while heap.length > 1:
+        entry = heap.peek()
+        yield entry[2]
+        try:
+            value = next(entry[3])
+        except StopIteration:
+            heap.remove_min()
+            continue
+        # The entry is updated in place, then sifted down from the top
+        entry[0] = value if key is None else key(value)
+        entry[2] = value
+        heap.replace(entry)
+
+    # Once a single source is left, its values can be passed straight through
+    if heap.length == 1:
+        _, _, value, iterator = heap.remove_min()
+        yield value
+        yield from iterator
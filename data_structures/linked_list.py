@@ -1,6 +1,9 @@
 """Linked list implementation"""
 
-from typing import Iterable, Iterator, TypeVar, Generic
+from typing import Iterable, Iterator, TypeVar, Generic, overload
+
+from data_structures import snapshot
+from data_structures.views import View
 
 T = TypeVar("T")  # pylint: disable=invalid-name
 
@@ -8,18 +11,41 @@ T = TypeVar("T")  # pylint: disable=invalid-name
 class LinkedListNode(Generic[T]):
     """Raw linked list node"""
 
+    # Slots avoid a per-node __dict__, which would otherwise dominate the memory used
+    __slots__ = ("data", "next")
+
     def __init__(self, data: T) -> None:
         self.data: T = data
         self.next: LinkedListNode[T] | None = None
 
 
+class DoublyLinkedListNode(LinkedListNode[T]):
+    """Raw doubly linked list node"""
+
+    __slots__ = ("prev",)
+
+    # Only ever linked to other doubly linked nodes
+    next: "DoublyLinkedListNode[T] | None"
+
+    def __init__(self, data: T) -> None:
+        super().__init__(data)
+        self.prev: DoublyLinkedListNode[T] | None = None
+
+
 class LinkedList(Generic[T]):
-    """Full linked list implementation with all expected methods"""
+    """
+    Full linked list implementation with all expected methods
+
+    The most recently looked up node is cached as a cursor, so walking to an index
+    at or after it starts from the cursor instead of the head. This makes
+    sequential indexed access, such as `ll[i]` followed by `ll[i + 1]`, O(1).
+    """
 
     def __init__(self, iterable: Iterable | None = None) -> None:
         self.head: LinkedListNode[T] | None = None
         self.tail: LinkedListNode[T] | None = None
         self.length: int = 0
+        self._cursor: tuple[int, LinkedListNode[T]] | None = None
 
         if iterable:
             self.extend(iterable)
@@ -28,57 +54,29 @@ class LinkedList(Generic[T]):
         """Add all elements from a given iterable to the LinkedList"""
         iterator = iter(iterable)
 
-        # Handle the special case of adding the first node
-        if self.head is None:
-            try:
-                data = next(iterator)
-            except StopIteration:
-                return
-            node = LinkedListNode(data)
-            self.head = node
-            self.tail = node
-            self.length = 1
-        else:
-            # The tail is always set together with the head, so it cannot be None here
-            assert self.tail is not None
-            node = self.tail
-
-        # Append the rest of the data to the LinkedList
-        while True:
-            try:
-                data = next(iterator)
-            except StopIteration:
-                # Return once all the data has been added to the LinkedList
-                return
-            prev_node = node
-            node = LinkedListNode(data)
-            prev_node.next = node
-            self.tail = node
-            self.length += 1
+        # Chain up new nodes for the data, then link the whole chain in at once
+        try:
+            first = self._new_node(next(iterator))
+        except StopIteration:
+            return
+        last = first
+        count = 1
+        for data in iterator:
+            node = self._new_node(data)
+            self._chain(last, node)
+            last = node
+            count += 1
+        self._link(self.length, first, last, count)
 
     def append(self, data: T) -> None:
         """Add data to the end of the LinkedList"""
-        if self.head is None:
-            # Handle the special case of adding the first node
-            self.head = LinkedListNode(data)
-            self.tail = self.head
-        else:
-            # Handle the typical case
-            assert self.tail is not None
-            self.tail.next = LinkedListNode(data)
-            self.tail = self.tail.next
-        self.length += 1
+        node = self._new_node(data)
+        self._link(self.length, node, node, 1)
 
     def prepend(self, data: T) -> None:
         """Add data to the start of the LinkedList"""
-        # Handle the special case of adding the first node
-        if self.head is None:
-            return self.append(data)
-
-        prev_head = self.head
-        self.head = LinkedListNode(data)
-        self.head.next = prev_head
-        self.length += 1
+        node = self._new_node(data)
+        self._link(0, node, node, 1)
 
     def remove(self, idx: int) -> T:
         """Remove and return the element at the given index"""
@@ -86,29 +84,8 @@ class LinkedList(Generic[T]):
         if idx < 0 or idx > self.length - 1:
             raise IndexError
 
-        self.length -= 1
-
-        # Handle the special case of removing the head
-        if idx == 0:
-            assert self.head is not None  # Due to our bounds check
-            node = self.head
-            self.head = self.head.next
-            return node.data
-
-        node_before_idx = self._get_node(idx - 1)
-
-        # Retrieve the data and remove the node
-        assert node_before_idx is not None  # Due to bounds check in _get_node()
-        assert node_before_idx.next is not None  # Due to bounds check in _get_node()
-
-        # Handle the special case of removing the tail
-        if node_before_idx.next.next is None:
-            self.tail = node_before_idx
-
-        data = node_before_idx.next.data
-        node_before_idx.next = node_before_idx.next.next
-
-        return data
+        node, _ = self._unlink(idx, idx + 1)
+        return node.data
 
     def insert(self, idx: int, data: T) -> None:
         """Insert data at the given index"""
@@ -116,17 +93,8 @@ class LinkedList(Generic[T]):
         if idx < 0 or idx > self.length:
             raise IndexError
 
-        # Handle the special cases of inserting at the head or tail
-        if idx == 0:
-            return self.prepend(data)
-        elif idx == self.length:
-            return self.append(data)
-
-        node = self._get_node(idx - 1)
-        prev_next = node.next
-        node.next = LinkedListNode(data)
-        node.next.next = prev_next
-        self.length += 1
+        node = self._new_node(data)
+        self._link(idx, node, node, 1)
 
     def get(self, idx: int) -> T:
         """Get the value at the given index"""
@@ -138,26 +106,261 @@ class LinkedList(Generic[T]):
         node = self._get_node(idx)
         node.data = data
 
+    def splice(self, idx: int, other: "LinkedList[T]") -> None:
+        """Move all nodes of another LinkedList into this one at the given index"""
+        # Make sure the index is not out-of-bounds
+        if idx < 0 or idx > self.length:
+            raise IndexError
+        if other is self:
+            raise ValueError("Cannot splice a LinkedList into itself")
+        if not isinstance(other, type(self)):
+            raise TypeError(
+                f"Cannot splice a {type(other).__name__} into a {type(self).__name__}"
+            )
+        if other.head is None:
+            return
+
+        # Take the whole chain of nodes, leaving the other LinkedList empty
+        assert other.tail is not None  # The tail is always set together with the head
+        first, last, count = other.head, other.tail, other.length
+        other.head = None
+        other.tail = None
+        other.length = 0
+        other._cursor = None  # pylint: disable=protected-access
+        self._link(idx, first, last, count)
+
+    def concat(self, other: "LinkedList[T]") -> None:
+        """Move all nodes of another LinkedList onto the end of this one"""
+        self.splice(self.length, other)
+
+    def split_at(self, idx: int) -> "LinkedList[T]":
+        """Move all nodes from the given index onwards into a new LinkedList"""
+        # Make sure the index is not out-of-bounds
+        if idx < 0 or idx > self.length:
+            raise IndexError
+
+        new_list: LinkedList[T] = type(self)()
+        if idx < self.length:
+            count = self.length - idx
+            new_list.head, new_list.tail = self._unlink(idx, self.length)
+            new_list.length = count
+        return new_list
+
+    def view(self, drain: bool = False) -> View[T]:
+        """
+        Make a lazy view of the values, from the head
+
+        A draining view removes each value from the head as it's pulled through the
+        view. Otherwise the view walks the nodes in place, and the LinkedList must
+        not change while the view is being iterated.
+        """
+        return View(self._drain if drain else self.__iter__)
+
+    def _drain(self) -> Iterator[T]:
+        """Remove and yield values from the head until the LinkedList is empty"""
+        while self.length > 0:
+            yield self.remove(0)
+
+    def save(self, path: snapshot.StrPath) -> None:
+        """Save the LinkedList's values to a snapshot file, as one flat list"""
+        snapshot.write(path, self, list(self))
+
+    @classmethod
+    def load(cls, path: snapshot.StrPath) -> "LinkedList[T]":
+        """Load a LinkedList saved by save()"""
+        values, _ = snapshot.read(path, cls)
+        return cls(values)
+
+    @staticmethod
+    def _new_node(data: T) -> LinkedListNode[T]:
+        """Create a detached node"""
+        return LinkedListNode(data)
+
+    @staticmethod
+    def _chain(node: LinkedListNode[T], next_node: LinkedListNode[T]) -> None:
+        """Link two detached nodes together"""
+        node.next = next_node
+
+    def _link(
+        self, idx: int, first: LinkedListNode[T], last: LinkedListNode[T], count: int
+    ) -> None:
+        """Link a detached chain of nodes into the LinkedList at the given index"""
+        if self.head is None:
+            # Handle the special case of adding the first nodes
+            self.head = first
+            self.tail = last
+        elif idx == 0:
+            # Handle the special case of linking at the head
+            last.next = self.head
+            self.head = first
+        elif idx == self.length:
+            # Handle the special case of linking at the tail, without walking there
+            assert self.tail is not None  # Since the LinkedList isn't empty
+            self.tail.next = first
+            self.tail = last
+        else:
+            node_before_idx = self._get_node(idx - 1)
+            last.next = node_before_idx.next
+            node_before_idx.next = first
+        self.length += count
+        self._invalidate_cursor(idx)
+
+    def _unlink(
+        self, start: int, stop: int
+    ) -> tuple[LinkedListNode[T], LinkedListNode[T]]:
+        """Detach the nodes from start up to stop, returning the chain's ends"""
+        node_before_start = None if start == 0 else self._get_node(start - 1)
+        first = self.head if node_before_start is None else node_before_start.next
+
+        # Find the last node in the range
+        last = first
+        for _ in range(stop - start - 1):
+            assert last is not None  # Since stop is in bounds
+            last = last.next
+        assert first is not None and last is not None  # Since start < stop
+
+        # Close the gap, which may move the head and/or tail
+        if node_before_start is None:
+            self.head = last.next
+        else:
+            node_before_start.next = last.next
+        if last.next is None:
+            self.tail = node_before_start
+        last.next = None
+        self.length -= stop - start
+        self._invalidate_cursor(start)
+        return first, last
+
+    def _invalidate_cursor(self, idx: int) -> None:
+        """Drop the cursor if nodes were linked or unlinked at or before it"""
+        if self._cursor is not None and self._cursor[0] >= idx:
+            self._cursor = None
+
+    def _walk_start(self, idx: int) -> tuple[int, LinkedListNode[T]]:
+        """Get the index and node which _get_node(idx) walks from"""
+        # The tail is returned without walking there
+        if idx == self.length - 1:
+            assert self.tail is not None  # Since the LinkedList isn't empty
+            return idx, self.tail
+
+        # Start from the cursor if it's on the way, otherwise from the head
+        if self._cursor is not None and self._cursor[0] <= idx:
+            return self._cursor
+        assert self.head is not None  # Since the LinkedList isn't empty
+        return 0, self.head
+
+    def _walk_length(self, idx: int) -> int:
+        """How many links _get_node(idx) follows, used by instrumentation"""
+        return abs(idx - self._walk_start(idx)[0])
+
     def _get_node(self, idx: int) -> LinkedListNode[T]:
         """Get the node at the given index"""
         # Make sure the index is not out-of-bounds
         if idx < 0 or idx > self.length - 1:
             raise IndexError
 
+        node_idx, node = self._walk_start(idx)
+        if node_idx == idx:
+            # Keep the cursor where it was when no walking is needed
+            return node
+
         # Find the node at idx
-        node = self.head
-        for _ in range(idx):
-            assert node is not None  # This is guaranteed by our bounds check
+        for _ in range(idx - node_idx):
+            assert node.next is not None  # This is guaranteed by our bounds check
             node = node.next
 
-        assert node is not None  # This is guaranteed by our bounds check
+        self._cursor = (idx, node)
         return node
 
+    @overload
     def __getitem__(self, idx: int) -> T:
-        return self.get(idx)
-
+        ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> "LinkedList[T]":
+        ...
+
+    def __getitem__(self, idx):
+        if not isinstance(idx, slice):
+            return self.get(idx)
+
+        # Collect the sliced values in a single walk, in forward order
+        indices = range(*idx.indices(self.length))
+        forward = indices if indices.step > 0 else indices[::-1]
+        values = []
+        if forward:
+            node = self._get_node(forward.start)
+            for position in range(forward.start, forward[-1] + 1):
+                assert node is not None  # Since the range is in bounds
+                if (position - forward.start) % forward.step == 0:
+                    values.append(node.data)
+                node = node.next
+        if indices.step < 0:
+            values.reverse()
+        return type(self)(values)
+
+    @overload
     def __setitem__(self, idx: int, data: T) -> None:
-        return self.set(idx, data)
+        ...
+
+    @overload
+    def __setitem__(self, idx: slice, data: Iterable[T]) -> None:
+        ...
+
+    def __setitem__(self, idx, data):
+        if not isinstance(idx, slice):
+            return self.set(idx, data)
+
+        indices = range(*idx.indices(self.length))
+        if indices.step == 1:
+            # Replace a contiguous range by unlinking it and linking in the new nodes.
+            # The new nodes are built first, in case data is this list or raises
+            replacement = type(self)(data)
+            if indices:
+                self._unlink(indices.start, indices.stop)
+            self.splice(indices.start, replacement)
+            return None
+
+        # Extended slices keep their shape, so the values are assigned in place
+        values = list(data)
+        if len(values) != len(indices):
+            raise ValueError(
+                f"attempt to assign sequence of size {len(values)}"
+                f" to extended slice of size {len(indices)}"
+            )
+        assignments = list(zip(indices, values))
+        if indices.step < 0:
+            assignments.reverse()
+
+        # Assign the values in a single walk, in forward order
+        if assignments:
+            position = assignments[0][0]
+            node = self._get_node(position)
+            for target, value in assignments:
+                while position < target:
+                    assert node.next is not None  # Since the range is in bounds
+                    node = node.next
+                    position += 1
+                node.data = value
+        return None
+
+    def __delitem__(self, idx: int | slice) -> None:
+        if not isinstance(idx, slice):
+            self.remove(idx)
+            return
+
+        indices = range(*idx.indices(self.length))
+        if not indices:
+            return
+        if indices.step == 1:
+            self._unlink(indices.start, indices.stop)
+            return
+
+        # Remove the nodes of an extended slice in forward order. Each walk starts
+        # from the cursor left by the previous removal, so this is a single pass
+        forward = indices if indices.step > 0 else indices[::-1]
+        for removed, position in enumerate(forward):
+            self._unlink(position - removed, position - removed + 1)
 
     def __iter__(self) -> Iterator[T]:
         node = self.head
@@ -167,3 +370,134 @@ class LinkedList(Generic[T]):
 
     def __len__(self) -> int:
         return self.length
+
+    def __reduce__(self) -> tuple[type, tuple[list[T]]]:
+        """Pickle the values as a flat list, not as a chain of nodes to recurse into"""
+        return type(self), (list(self),)
+
+
+class DoublyLinkedList(LinkedList[T]):
+    """
+    Linked list whose nodes also link back to the previous node
+
+    Removing from either end is O(1), and walks to an index start from whichever of
+    the head, the tail or the cursor is nearest, going in either direction.
+    """
+
+    head: DoublyLinkedListNode[T] | None
+    tail: DoublyLinkedListNode[T] | None
+    _cursor: tuple[int, DoublyLinkedListNode[T]] | None
+
+    def pop(self) -> T:
+        """Remove and return the last element"""
+        if self.length == 0:
+            raise IndexError
+        return self.remove(self.length - 1)
+
+    def popleft(self) -> T:
+        """Remove and return the first element"""
+        if self.length == 0:
+            raise IndexError
+        return self.remove(0)
+
+    @staticmethod
+    def _new_node(data: T) -> DoublyLinkedListNode[T]:
+        return DoublyLinkedListNode(data)
+
+    @staticmethod
+    def _chain(  # type: ignore[override]
+        node: DoublyLinkedListNode[T], next_node: DoublyLinkedListNode[T]
+    ) -> None:
+        node.next = next_node
+        next_node.prev = node
+
+    def _link(  # type: ignore[override]
+        self,
+        idx: int,
+        first: DoublyLinkedListNode[T],
+        last: DoublyLinkedListNode[T],
+        count: int,
+    ) -> None:
+        if self.head is None:
+            # Handle the special case of adding the first nodes
+            self.head = first
+            self.tail = last
+        elif idx == 0:
+            # Handle the special case of linking at the head
+            self._chain(last, self.head)
+            self.head = first
+        elif idx == self.length:
+            # Handle the special case of linking at the tail
+            assert self.tail is not None  # Since the DoublyLinkedList isn't empty
+            self._chain(self.tail, first)
+            self.tail = last
+        else:
+            node_at_idx = self._get_node(idx)
+            assert node_at_idx.prev is not None  # Since idx isn't the head
+            self._chain(node_at_idx.prev, first)
+            self._chain(last, node_at_idx)
+        self.length += count
+        self._invalidate_cursor(idx)
+
+    def _unlink(
+        self, start: int, stop: int
+    ) -> tuple[DoublyLinkedListNode[T], DoublyLinkedListNode[T]]:
+        first = self._get_node(start)
+        last = self._get_node(stop - 1)
+        node_before_start = first.prev
+        node_after_stop = last.next
+
+        # Close the gap, which may move the head and/or tail
+        if node_before_start is None:
+            self.head = node_after_stop
+        else:
+            node_before_start.next = node_after_stop
+        if node_after_stop is None:
+            self.tail = node_before_start
+        else:
+            node_after_stop.prev = node_before_start
+        first.prev = None
+        last.next = None
+        self.length -= stop - start
+
+        # Keep a cursor next to the gap, so that nearby removals stay cheap
+        self._cursor = None
+        if node_before_start is not None:
+            self._cursor = (start - 1, node_before_start)
+        return first, last
+
+    def _walk_start(self, idx: int) -> tuple[int, DoublyLinkedListNode[T]]:
+        assert self.head is not None and self.tail is not None  # Not empty
+
+        # Start from whichever of the head, tail and cursor is nearest to idx
+        node_idx, node = 0, self.head
+        if self.length - 1 - idx < idx:
+            node_idx, node = self.length - 1, self.tail
+        if self._cursor is not None and abs(self._cursor[0] - idx) < abs(
+            node_idx - idx
+        ):
+            node_idx, node = self._cursor
+        return node_idx, node
+
+    def _get_node(self, idx: int) -> DoublyLinkedListNode[T]:
+        # Make sure the index is not out-of-bounds
+        if idx < 0 or idx > self.length - 1:
+            raise IndexError
+        node_idx, node = self._walk_start(idx)
+
+        # Find the node at idx, walking in whichever direction it is
+        for _ in range(idx - node_idx):
+            assert node.next is not None  # This is guaranteed by our bounds check
+            node = node.next
+        for _ in range(node_idx - idx):
+            assert node.prev is not None  # This is guaranteed by our bounds check
+            node = node.prev
+
+        self._cursor = (idx, node)
+        return node
+
+    def __reversed__(self) -> Iterator[T]:
+        node = self.tail
+        while node is not None:
+            yield node.data
+            node = node.prev
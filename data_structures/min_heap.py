@@ -1,38 +1,114 @@
 """Min-heap implementation"""
 
-from typing import Generic, Iterator, TypeVar
-from typing_protocols.protocols import Comparable
+import operator
+from itertools import islice
+from typing import Any, Callable, Generic, Iterable, Iterator, TypeVar
+from typing_protocols.protocols import Comparable, Heap
+
+from data_structures import snapshot
 
 T = TypeVar("T", bound=Comparable)  # pylint: disable=invalid-name
 
 
 class MinHeap(Generic[T]):
-    """Min-heap implementation"""
+    """
+    Min-heap implementation
+
+    Values are ordered by `key(value)` when a key function is given, and by the
+    values themselves otherwise. The key is computed once per value and cached in
+    `keys`, alongside `table`. With `reverse=True` the largest key is at the top.
+
+    Removed slots are cleared so they don't keep values alive, and the table is
+    shrunk once it falls below `shrink_threshold` of its size.
+    """
+
+    # Shrink the table to twice the heap's length once the heap uses less than this
+    # fraction of it. Shrinking to double leaves room to grow again without thrashing
+    shrink_threshold: float = 0.25
 
-    def __init__(self) -> None:
+    # Children per node. The sifts here are specialized for binary heaps, and
+    # DAryHeap overrides them for wider ones
+    arity: int = 2
+
+    def __init__(
+        self,
+        iterable: Iterable[T] | None = None,
+        key: Callable[[T], Any] | None = None,
+        reverse: bool = False,
+    ) -> None:
         self.length: int = 0
         self.table: list[T] = []
+        self.keys: list[Any] = []
+        self.key: Callable[[T], Any] | None = key
+        self.reverse: bool = reverse
+        self._less: Callable[[Any, Any], bool] = (
+            operator.gt if reverse else operator.lt
+        )
+
+        if iterable:
+            self.insert_many(iterable)
 
     def insert(self, value: T) -> None:
         """Insert a value into the min-heap"""
+        key = value if self.key is None else self.key(value)
+
         # Use empty space if we have (from removals), otherwise append
         if len(self.table) == self.length:
             self.table.append(value)
+            self.keys.append(key)
         else:
             self.table[self.length] = value
-        idx = self.length
+            self.keys[self.length] = key
         self.length += 1
+        self._sift_up(self.length - 1)
 
-        # Bubble up the value
-        parent_idx = (idx - 1) // 2
-        while idx > 0 and self.table[idx] < self.table[parent_idx]:
-            # Swap the value with its parent, then update the indices
-            self.table[idx], self.table[parent_idx] = (
-                self.table[parent_idx],
-                self.table[idx],
-            )
-            idx = parent_idx
-            parent_idx = (idx - 1) // 2
+    def insert_many(self, iterable: Iterable[T]) -> None:
+        """Insert all values from an iterable into the min-heap"""
+        values = list(iterable)
+
+        # When the batch is at least as large as the heap, rebuilding the whole heap
+        # bottom-up in O(n) is cheaper than sifting up every new value one at a time
+        if len(values) < self.length:
+            for value in values:
+                self.insert(value)
+            return
+
+        # Drop any empty space left over from removals, then rebuild the heap
+        del self.table[self.length :]
+        del self.keys[self.length :]
+        self.table.extend(values)
+        self.keys.extend(values if self.key is None else map(self.key, values))
+        self.length = len(self.table)
+        self._heapify()
+
+    def merge(self, other: Heap[T]) -> None:
+        """
+        Insert every value from another heap, which is left unchanged
+
+        A MinHeap's cached keys are reused, so both heaps must order their values
+        the same way. Like insert_many(), the heap is rebuilt in O(n + m) when the
+        other heap is at least as large, and the new values are sifted up otherwise.
+        Other heaps (like a PairingHeap) are read with iter_sorted().
+        """
+        if other.reverse != self.reverse:
+            raise ValueError("Can't merge heaps which are ordered in opposite ways")
+        if not isinstance(other, MinHeap) or len(other) != other.length:
+            # Some or all of its values live outside a table (like a
+            # SpillingMinHeap's spilled runs), so read them all back in order instead
+            self.insert_many(other.iter_sorted())
+            return
+        count = other.length
+        del self.table[self.length :]
+        del self.keys[self.length :]
+        self.table.extend(other.table[:count])
+        self.keys.extend(other.keys[:count])
+        if count < self.length:
+            for idx in range(self.length, self.length + count):
+                self.length += 1
+                self._sift_up(idx)
+        else:
+            self.length += count
+            self._heapify()
 
     def remove_min(self) -> T:
         """Remove and return the heap's minimum value"""
@@ -43,44 +119,40 @@ class MinHeap(Generic[T]):
         self.length -= 1
         removed_value = self.table[0]
 
-        # If this is the last element, then no shuffling is necessary
+        # Put the last element at the top, then bubble it down. If this is the last
+        # element, then no shuffling is necessary
+        if self.length > 0:
+            self.table[0] = self.table[self.length]
+            self.keys[0] = self.keys[self.length]
+            self._release_slot()
+            self._sift_down(0)
+        else:
+            self._release_slot()
+
+        return removed_value
+
+    def replace(self, value: T) -> T:
+        """Remove and return the minimum value and insert a new one, in a single sift"""
         if self.length == 0:
-            return removed_value
-
-        # Put the last element at the top, then bubble it down
-        self.table[0] = self.table[self.length]
-        idx = 0
-        left_child_idx = (idx * 2) + 1
-        right_child_idx = (idx * 2) + 2
-
-        # While there is at least one greater child, bubble it down
-        while left_child_idx < self.length:
-            if (
-                right_child_idx < self.length
-                and self.table[right_child_idx] < self.table[left_child_idx]
-                and self.table[right_child_idx] < self.table[idx]
-            ):
-                # If there is a right child which is smaller than the left child
-                # and smaller than the current value, bubble down right
-                self.table[idx], self.table[right_child_idx] = (
-                    self.table[right_child_idx],
-                    self.table[idx],
-                )
-                idx = right_child_idx
-            elif self.table[left_child_idx] < self.table[idx]:
-                # Otherwise, if there's a left child which is smaller than the current value,
-                # bubble down left
-                self.table[idx], self.table[left_child_idx] = (
-                    self.table[left_child_idx],
-                    self.table[idx],
-                )
-                idx = left_child_idx
-            else:
-                # If neither the right or left children are smaller, we're done bubbling
-                break
-            left_child_idx = (idx * 2) + 1
-            right_child_idx = (idx * 2) + 2
+            raise IndexError
 
+        removed_value = self.table[0]
+        self.table[0] = value
+        self.keys[0] = value if self.key is None else self.key(value)
+        self._sift_down(0)
+        return removed_value
+
+    def pushpop(self, value: T) -> T:
+        """Insert a value, then remove and return the minimum, in at most one sift"""
+        key = value if self.key is None else self.key(value)
+
+        # The new value comes straight back out unless the current minimum beats it
+        if self.length == 0 or not self._less(self.keys[0], key):
+            return value
+        removed_value = self.table[0]
+        self.table[0] = value
+        self.keys[0] = key
+        self._sift_down(0)
         return removed_value
 
     def peek(self) -> T:
@@ -89,10 +161,415 @@ class MinHeap(Generic[T]):
             raise IndexError
         return self.table[0]
 
+    def peek_key(self) -> Any:
+        """Return the cached key of the heap's minimum value"""
+        if self.length == 0:
+            raise IndexError
+        return self.keys[0]
+
+    def iter_sorted(self) -> Iterator[T]:
+        """
+        Iterate over all values in order without removing them
+
+        Only the frontier of the table is kept in an auxiliary heap of indices, so
+        reading the first k values costs O(k log k). The heap must not be modified
+        during iteration.
+        """
+        if self.length == 0:
+            return
+        table = self.table
+        length = self.length
+        arity = self.arity
+        frontier: MinHeap[int] = MinHeap(
+            key=self.keys.__getitem__, reverse=self.reverse
+        )
+        frontier.insert(0)
+        while frontier.length > 0:
+            idx = frontier.remove_min()
+            yield table[idx]
+            # The children of a yielded value are the only new candidates for the next
+            child_idx = (idx * arity) + 1
+            for child_idx in range(child_idx, min(child_idx + arity, length)):
+                frontier.insert(child_idx)
+
+    def nsmallest(self, k: int) -> list[T]:
+        """Return the first k values in heap order without removing them"""
+        return list(islice(self.iter_sorted(), k))
+
+    def save(self, path: snapshot.StrPath) -> None:
+        """
+        Save the heap to a snapshot file
+
+        The values and their cached keys are pickled as flat lists, so nothing is
+        recomputed on load. The key function isn't saved, so pass it to load().
+        """
+        state = {
+            name: value
+            for name, value in vars(self).items()
+            if name not in ("key", "_less", "table", "keys")
+        }
+        state["table"] = self.table[: self.length]
+        # When every key is its value, the values are only saved once. Without a key
+        # function that's usual, but explicit priorities (as in IndexedMinHeap) and
+        # updated keys still need saving
+        keys = self.keys[: self.length]
+        keys_are_values = self.key is None and not any(
+            map(operator.is_not, keys, state["table"])
+        )
+        state["keys"] = None if keys_are_values else keys
+        snapshot.write(path, self, state)
+
+    @classmethod
+    def load(
+        cls, path: snapshot.StrPath, key: Callable[[T], Any] | None = None
+    ) -> "MinHeap[T]":
+        """Load a heap saved by save(), given the key function it was built with"""
+        state, _ = snapshot.read(path, cls)
+        heap = cls.__new__(cls)
+        heap.__dict__.update(state)
+        if heap.keys is None:
+            heap.keys = heap.table.copy()
+        heap.key = key
+        heap._less = operator.gt if heap.reverse else operator.lt
+        return heap
+
+    def _release_slot(self) -> None:
+        """Clear the slot just past the end of the heap, shrinking the table if due"""
+        self.table[self.length] = None  # type: ignore[call-overload]
+        self.keys[self.length] = None
+        if self.length < len(self.table) * self.shrink_threshold:
+            del self.table[self.length * 2 :]
+            del self.keys[self.length * 2 :]
+
+    def _heapify(self) -> None:
+        """Restore the heap property for the whole table in O(n)"""
+        # Leaves are already valid heaps, so bubble down every parent, bottom-up
+        parents = (self.length + self.arity - 2) // self.arity
+        for idx in reversed(range(parents)):
+            self._sift_down(idx)
+
+    def _sift_up(self, idx: int) -> int:
+        """Bubble the value at the given index up to its place, returning its index"""
+        table = self.table
+        keys = self.keys
+        less = self._less
+        value = table[idx]
+        key = keys[idx]
+
+        # Move smaller parents down into the hole until the value's place is found
+        while idx > 0:
+            parent_idx = (idx - 1) // 2
+            parent_key = keys[parent_idx]
+            if not less(key, parent_key):
+                break
+            table[idx] = table[parent_idx]
+            keys[idx] = parent_key
+            idx = parent_idx
+        table[idx] = value
+        keys[idx] = key
+        return idx
+
+    def _sift_down(self, idx: int) -> int:
+        """Bubble the value at the given index down to its place, returning its index"""
+        table = self.table
+        keys = self.keys
+        less = self._less
+        length = self.length
+        value = table[idx]
+        key = keys[idx]
+
+        # Move the smaller child up into the hole while it is smaller than the value
+        child_idx = (idx * 2) + 1
+        while child_idx < length:
+            right_child_idx = child_idx + 1
+            if right_child_idx < length and less(
+                keys[right_child_idx], keys[child_idx]
+            ):
+                child_idx = right_child_idx
+            child_key = keys[child_idx]
+            if not less(child_key, key):
+                break
+            table[idx] = table[child_idx]
+            keys[idx] = child_key
+            idx = child_idx
+            child_idx = (idx * 2) + 1
+        table[idx] = value
+        keys[idx] = key
+        return idx
+
     def __iter__(self) -> Iterator[T]:
-        """Iterate over all values by removing them one at a time"""
+        """Iterate over all values by removing them one at a time (see iter_sorted())"""
         while self.length > 0:
             yield self.remove_min()
 
     def __len__(self):
         return self.length
+
+
+class MaxHeap(MinHeap[T]):
+    """Max-heap implementation, where `remove_max()` returns the largest value first"""
+
+    def __init__(
+        self,
+        iterable: Iterable[T] | None = None,
+        key: Callable[[T], Any] | None = None,
+    ) -> None:
+        super().__init__(iterable, key=key, reverse=True)
+
+    def remove_max(self) -> T:
+        """Remove and return the heap's maximum value"""
+        return self.remove_min()
+
+
+class BoundedMinHeap(MinHeap[T]):
+    """
+    Min-heap which keeps only the `capacity` largest values offered to it
+
+    The smallest kept value is at the top, so a candidate which is no better than
+    it is rejected in O(1), and a better one replaces it with a single sift. With
+    `reverse=True` the smallest values are kept instead.
+    """
+
+    def __init__(
+        self,
+        iterable: Iterable[T] | None = None,
+        *,
+        capacity: int,
+        key: Callable[[T], Any] | None = None,
+        reverse: bool = False,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("The capacity must be at least 1")
+        self.capacity: int = capacity
+        super().__init__(iterable, key=key, reverse=reverse)
+
+    def offer(self, value: T) -> bool:
+        """Keep a value if it is among the largest so far, returning whether it was"""
+        if self.length < self.capacity:
+            super().insert(value)
+            return True
+
+        key = value if self.key is None else self.key(value)
+        if not self._less(self.keys[0], key):
+            return False
+        self.table[0] = value
+        self.keys[0] = key
+        self._sift_down(0)
+        return True
+
+    def offer_many(self, iterable: Iterable[T]) -> None:
+        """Offer every value from an iterable"""
+        iterator = iter(iterable)
+        if self.length < self.capacity:
+            super().insert_many(islice(iterator, self.capacity - self.length))
+
+        # Same as offer(), with everything looked up once for the whole iterable
+        table = self.table
+        keys = self.keys
+        key_function = self.key
+        less = self._less
+        sift_down = self._sift_down
+        for value in iterator:
+            key = value if key_function is None else key_function(value)
+            if less(keys[0], key):
+                table[0] = value
+                keys[0] = key
+                sift_down(0)
+
+    def insert(self, value: T) -> None:
+        self.offer(value)
+
+    def merge(self, other: Heap[T]) -> None:
+        if not isinstance(other, MinHeap) or len(other) != other.length:
+            self.offer_many(other.iter_sorted())
+        else:
+            self.offer_many(other.table[: other.length])
+
+    def insert_many(self, iterable: Iterable[T]) -> None:
+        self.offer_many(iterable)
+
+    def result(self) -> list[T]:
+        """Return the kept values from best to worst, without removing them"""
+        keys = self.keys
+        order = sorted(
+            range(self.length), key=keys.__getitem__, reverse=not self.reverse
+        )
+        return [self.table[idx] for idx in order]
+
+
+class IndexedMinHeap(MinHeap[T]):
+    """
+    Min-heap which tracks the index of every value in `positions`
+
+    Values must be hashable and unique. Knowing where each value lives allows its
+    priority to be changed, or the value removed, in O(log n).
+    """
+
+    def __init__(
+        self,
+        iterable: Iterable[T] | None = None,
+        key: Callable[[T], Any] | None = None,
+        reverse: bool = False,
+    ) -> None:
+        self.positions: dict[T, int] = {}
+        super().__init__(iterable, key=key, reverse=reverse)
+
+    def insert(self, value: T, priority: Any = None) -> None:
+        """Insert a value, optionally with an explicit priority instead of its key"""
+        if value in self.positions:
+            raise ValueError(f"{value!r} is already in the heap")
+        if priority is None:
+            priority = value if self.key is None else self.key(value)
+
+        # Use empty space if we have (from removals), otherwise append
+        if len(self.table) == self.length:
+            self.table.append(value)
+            self.keys.append(priority)
+        else:
+            self.table[self.length] = value
+            self.keys[self.length] = priority
+        self.length += 1
+        self._sift_up(self.length - 1)
+
+    def insert_many(self, iterable: Iterable[T]) -> None:
+        values = list(iterable)
+        if len(set(values)) != len(values) or any(
+            value in self.positions for value in values
+        ):
+            raise ValueError("Values must be unique")
+        super().insert_many(values)
+
+    def merge(self, other: Heap[T]) -> None:
+        values = (
+            other.table[: other.length]
+            if isinstance(other, MinHeap)
+            else other.iter_sorted()
+        )
+        if any(value in self.positions for value in values):
+            raise ValueError("Values must be unique")
+        super().merge(other)
+
+    def remove_min(self) -> T:
+        value = super().remove_min()
+        del self.positions[value]
+        return value
+
+    def replace(self, value: T) -> T:
+        if value in self.positions:
+            raise ValueError(f"{value!r} is already in the heap")
+        removed_value = super().replace(value)
+        del self.positions[removed_value]
+        return removed_value
+
+    def pushpop(self, value: T) -> T:
+        if value in self.positions:
+            raise ValueError(f"{value!r} is already in the heap")
+        removed_value = super().pushpop(value)
+        if removed_value is not value:
+            del self.positions[removed_value]
+        return removed_value
+
+    def remove(self, value: T) -> T:
+        """Remove the given value from the heap"""
+        idx = self.positions.pop(value)
+        self.length -= 1
+
+        # Fill the hole with the last value, which may need to move either way
+        if idx != self.length:
+            self.table[idx] = self.table[self.length]
+            self.keys[idx] = self.keys[self.length]
+            self._release_slot()
+            self._sift_up(idx)
+            self._sift_down(self.positions[self.table[idx]])
+        else:
+            self._release_slot()
+        return value
+
+    def priority(self, value: T) -> Any:
+        """Return the priority a value is currently ordered by"""
+        return self.keys[self.positions[value]]
+
+    def update(self, value: T, priority: Any = None) -> None:
+        """Change the priority of a value, recomputing its key if none is given"""
+        idx = self.positions[value]
+        if priority is None:
+            priority = value if self.key is None else self.key(value)
+        old_priority = self.keys[idx]
+        self.keys[idx] = priority
+
+        if self._less(priority, old_priority):
+            self._sift_up(idx)
+        else:
+            self._sift_down(idx)
+
+    def decrease_key(self, value: T, priority: Any) -> None:
+        """Move a value closer to the top of the heap by giving it a better priority"""
+        idx = self.positions[value]
+        if self._less(self.keys[idx], priority):
+            raise ValueError("The new priority would move the value down the heap")
+        self.keys[idx] = priority
+        self._sift_up(idx)
+
+    def _heapify(self) -> None:
+        super()._heapify()
+        self.positions = {
+            value: idx for idx, value in enumerate(self.table[: self.length])
+        }
+
+    def _sift_up(self, idx: int) -> int:
+        table = self.table
+        keys = self.keys
+        positions = self.positions
+        less = self._less
+        value = table[idx]
+        key = keys[idx]
+
+        # Same as MinHeap._sift_up(), but every moved value gets its index updated
+        while idx > 0:
+            parent_idx = (idx - 1) // 2
+            parent_key = keys[parent_idx]
+            if not less(key, parent_key):
+                break
+            parent = table[parent_idx]
+            table[idx] = parent
+            keys[idx] = parent_key
+            positions[parent] = idx
+            idx = parent_idx
+        table[idx] = value
+        keys[idx] = key
+        positions[value] = idx
+        return idx
+
+    def _sift_down(self, idx: int) -> int:
+        table = self.table
+        keys = self.keys
+        positions = self.positions
+        less = self._less
+        length = self.length
+        value = table[idx]
+        key = keys[idx]
+
+        # Same as MinHeap._sift_down(), but every moved value gets its index updated
+        child_idx = (idx * 2) + 1
+        while child_idx < length:
+            right_child_idx = child_idx + 1
+            if right_child_idx < length and less(
+                keys[right_child_idx], keys[child_idx]
+            ):
+                child_idx = right_child_idx
+            child_key = keys[child_idx]
+            if not less(child_key, key):
+                break
+            child = table[child_idx]
+            table[idx] = child
+            keys[idx] = child_key
+            positions[child] = idx
+            idx = child_idx
+            child_idx = (idx * 2) + 1
+        table[idx] = value
+        keys[idx] = key
+        positions[value] = idx
+        return idx
+
+    def __contains__(self, value: object) -> bool:
+        return value in self.positions
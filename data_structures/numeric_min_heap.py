@@ -0,0 +1,311 @@
+"""NumPy-backed min-heap for numeric priorities
+
+Requires NumPy, which is an optional dependency of this package.
+"""
+
+from typing import Iterable, Iterator, cast
+
+import numpy as np
+import numpy.typing as npt
+
+from data_structures import snapshot
+
+
+class NumericMinHeap:
+    """
+    Min-heap of int or float priorities stored unboxed in a NumPy array
+
+    Every priority has an integer payload id in the parallel `ids` array. Ids
+    default to the number of values inserted before, so they can index a list of
+    payloads kept alongside the heap.
+
+    Single inserts and removals sift through memoryviews of the arrays, so every
+    comparison is between plain floats or ints. Batches run vectorized: heapify
+    sifts every node on a level of the tree at once, and pop_many() partitions the
+    arrays when it takes a large share of the heap.
+    """
+
+    MIN_CAPACITY: int = 8
+
+    # Shrink the arrays to twice the heap's length once it uses less than this
+    # fraction of them, like MinHeap
+    shrink_threshold: float = 0.25
+
+    # Vectorized heapify and partitioning touch every value in the heap, but cost so
+    # little per value that they beat sifting one value at a time in Python for any
+    # batch bigger than about these fractions of the heap. Inserts mostly sift up
+    # O(1) levels, while removals always sift down O(log n) levels
+    heapify_ratio: float = 1 / 32
+    partition_ratio: float = 1 / 256
+
+    def __init__(
+        self,
+        priorities: Iterable[float] | npt.ArrayLike | None = None,
+        ids: npt.ArrayLike | None = None,
+        dtype: npt.DTypeLike = np.float64,
+    ) -> None:
+        self.length: int = 0
+        self.next_id: int = 0
+        self.dtype: np.dtype = np.dtype(dtype)
+        self.keys: np.ndarray = np.empty(self.MIN_CAPACITY, self.dtype)
+        self.ids: np.ndarray = np.empty(self.MIN_CAPACITY, np.int64)
+        self._key_view: memoryview = self.keys.data
+        self._id_view: memoryview = self.ids.data
+
+        if priorities is not None:
+            self.push_many(priorities, ids)
+
+    def insert(self, priority: float, payload_id: int | None = None) -> None:
+        """Insert a priority, with the given payload id or the next one"""
+        if payload_id is None:
+            payload_id = self.next_id
+        self.next_id += 1
+        if self.length == len(self.keys):
+            self._resize(self.length * 2)
+        # Assigning through NumPy casts the priority to the heap's dtype
+        self.keys[self.length] = priority
+        self._id_view[self.length] = payload_id
+        self.length += 1
+        self._sift_up(self.length - 1)
+
+    def push_many(
+        self,
+        priorities: Iterable[float] | npt.ArrayLike,
+        ids: npt.ArrayLike | None = None,
+    ) -> None:
+        """Insert all priorities from an array or iterable, with optional payload ids"""
+        if not isinstance(priorities, np.ndarray):
+            # Anything other than an array is taken to be an iterable of numbers
+            priorities = np.fromiter(cast(Iterable[float], priorities), self.dtype)
+        new_keys = np.ravel(priorities).astype(self.dtype, copy=False)
+        count = len(new_keys)
+        if ids is None:
+            new_ids = np.arange(self.next_id, self.next_id + count, dtype=np.int64)
+        else:
+            new_ids = np.ravel(ids).astype(np.int64, copy=False)
+            if len(new_ids) != count:
+                raise ValueError("Expected one payload id per priority")
+
+        if count < self.length * self.heapify_ratio:
+            for priority, payload_id in zip(new_keys.tolist(), new_ids.tolist()):
+                self.insert(priority, payload_id)
+            return
+
+        if self.length + count > len(self.keys):
+            self._resize(self.length + count)
+        self.keys[self.length : self.length + count] = new_keys
+        self.ids[self.length : self.length + count] = new_ids
+        self.length += count
+        self.next_id += count
+        self._heapify()
+
+    def merge(self, other: "NumericMinHeap") -> None:
+        """Insert every priority and payload id from another heap, leaving it intact"""
+        self.push_many(other.keys[: other.length], other.ids[: other.length])
+
+    def remove_min(self) -> float:
+        """Remove and return the smallest priority"""
+        return self.remove_min_item()[0]
+
+    def remove_min_item(self) -> tuple[float, int]:
+        """Remove and return the smallest priority along with its payload id"""
+        if self.length == 0:
+            raise IndexError
+
+        keys = self._key_view
+        ids = self._id_view
+        item = (keys[0], ids[0])
+        self.length -= 1
+        if self.length > 0:
+            keys[0] = keys[self.length]
+            ids[0] = ids[self.length]
+            self._sift_down(0)
+        self._maybe_shrink()
+        return item
+
+    def pop_many(self, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Remove the k smallest priorities, returning them in order with their ids"""
+        if k < 0 or k > self.length:
+            raise IndexError
+
+        if k < self.length * self.partition_ratio:
+            items = [self.remove_min_item() for _ in range(k)]
+            return (
+                np.array([key for key, _ in items], self.dtype),
+                np.array([payload_id for _, payload_id in items], np.int64),
+            )
+
+        # Partition the k smallest priorities from the rest in O(n), sort them, then
+        # rebuild the heap from what's left
+        keys = self.keys[: self.length]
+        ids = self.ids[: self.length]
+        order = np.argpartition(keys, k - 1) if k < self.length else np.arange(k)
+        taken = order[:k]
+        taken = taken[np.argsort(keys[taken], kind="stable")]
+        kept = order[k:]
+        popped = (keys[taken], ids[taken])
+
+        remaining = len(kept)
+        keys[:remaining] = keys[kept]
+        ids[:remaining] = ids[kept]
+        self.length = remaining
+        self._heapify()
+        self._maybe_shrink()
+        return popped
+
+    def peek(self) -> float:
+        """Return the smallest priority without removing it"""
+        if self.length == 0:
+            raise IndexError
+        return self._key_view[0]
+
+    def peek_id(self) -> int:
+        """Return the payload id of the smallest priority without removing it"""
+        if self.length == 0:
+            raise IndexError
+        return self._id_view[0]
+
+    def save(self, path: snapshot.StrPath) -> None:
+        """Save the heap to a snapshot file, with priorities and ids as raw arrays"""
+        state = {
+            "length": self.length,
+            "next_id": self.next_id,
+            "dtype": self.dtype.str,
+        }
+        buffers = {
+            "keys": (self.dtype.str, self.keys[: self.length]),
+            "ids": (self.ids.dtype.str, self.ids[: self.length]),
+        }
+        snapshot.write(path, self, state, buffers)
+
+    @classmethod
+    def load(cls, path: snapshot.StrPath, mmap: bool = True) -> "NumericMinHeap":
+        """
+        Load a heap saved by save()
+
+        With `mmap`, the arrays are memory-mapped copy-on-write, so nothing is read
+        until it is touched and changes never reach the file. The heap moves into
+        ordinary memory the first time it grows or shrinks.
+        """
+        state, buffers = snapshot.read(path, cls)
+        heap = cls(dtype=state["dtype"])
+        heap.next_id = state["next_id"]
+        length = state["length"]
+        if length == 0:
+            return heap
+
+        arrays: list[np.ndarray] = []
+        for name, dtype in (("keys", heap.dtype), ("ids", np.dtype(np.int64))):
+            info = buffers[name]
+            if mmap:
+                arrays.append(np.memmap(path, dtype, "c", info.offset, (length,)))
+            else:
+                data = bytearray(snapshot.read_buffer(path, info))
+                arrays.append(np.frombuffer(data, dtype))
+        heap.keys, heap.ids = arrays
+        heap._key_view = heap.keys.data
+        heap._id_view = heap.ids.data
+        heap.length = length
+        return heap
+
+    def _resize(self, capacity: int) -> None:
+        """Move the heap into new arrays with room for the given number of values"""
+        capacity = max(capacity, self.MIN_CAPACITY)
+        keys = np.empty(capacity, self.dtype)
+        ids = np.empty(capacity, np.int64)
+        keys[: self.length] = self.keys[: self.length]
+        ids[: self.length] = self.ids[: self.length]
+        self.keys = keys
+        self.ids = ids
+        self._key_view = keys.data
+        self._id_view = ids.data
+
+    def _maybe_shrink(self) -> None:
+        """Shrink the arrays if the heap uses too little of them"""
+        capacity = len(self.keys)
+        if capacity > self.MIN_CAPACITY and (
+            self.length < capacity * self.shrink_threshold
+        ):
+            self._resize(self.length * 2)
+
+    def _heapify(self) -> None:
+        """Restore the heap property for the whole array in O(n) vectorized steps"""
+        keys = self.keys
+        ids = self.ids
+        length = self.length
+        parents = length // 2
+        if parents == 0:
+            return
+
+        # The subtrees rooted on one level don't overlap, so every node on a level
+        # can be sifted down together, one level of the tree per step
+        for level in reversed(range(parents.bit_length())):
+            idx = np.arange((1 << level) - 1, min((2 << level) - 1, parents))
+            while len(idx) > 0:
+                child_idx = idx * 2 + 1
+                has_child = child_idx < length
+                idx = idx[has_child]
+                child_idx = child_idx[has_child]
+                right_child_idx = child_idx + 1
+                use_right = right_child_idx < length
+                use_right[use_right] = (
+                    keys[right_child_idx[use_right]] < keys[child_idx[use_right]]
+                )
+                child_idx[use_right] += 1
+
+                moves = keys[child_idx] < keys[idx]
+                idx = idx[moves]
+                child_idx = child_idx[moves]
+                keys[idx], keys[child_idx] = keys[child_idx], keys[idx]
+                ids[idx], ids[child_idx] = ids[child_idx], ids[idx]
+                idx = child_idx
+
+    def _sift_up(self, idx: int) -> int:
+        """Bubble the value at the given index up to its place, returning its index"""
+        keys = self._key_view
+        ids = self._id_view
+        key = keys[idx]
+        payload_id = ids[idx]
+        while idx > 0:
+            parent_idx = (idx - 1) // 2
+            parent_key = keys[parent_idx]
+            if not key < parent_key:
+                break
+            keys[idx] = parent_key
+            ids[idx] = ids[parent_idx]
+            idx = parent_idx
+        keys[idx] = key
+        ids[idx] = payload_id
+        return idx
+
+    def _sift_down(self, idx: int) -> int:
+        """Bubble the value at the given index down to its place, returning its index"""
+        keys = self._key_view
+        ids = self._id_view
+        length = self.length
+        key = keys[idx]
+        payload_id = ids[idx]
+        child_idx = (idx * 2) + 1
+        while child_idx < length:
+            child_key = keys[child_idx]
+            right_child_idx = child_idx + 1
+            if right_child_idx < length and keys[right_child_idx] < child_key:
+                child_idx = right_child_idx
+                child_key = keys[child_idx]
+            if not child_key < key:
+                break
+            keys[idx] = child_key
+            ids[idx] = ids[child_idx]
+            idx = child_idx
+            child_idx = (idx * 2) + 1
+        keys[idx] = key
+        ids[idx] = payload_id
+        return idx
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate over all priorities by removing them one at a time"""
+        while self.length > 0:
+            yield self.remove_min()
@@ -0,0 +1,270 @@
+"""Pairing heap implementation"""
+
+import operator
+from itertools import islice
+from typing import Any, Callable, Generic, Iterable, Iterator, TypeVar
+from typing_protocols.protocols import Comparable, Heap
+
+from data_structures import snapshot
+from data_structures.min_heap import MinHeap
+
+T = TypeVar("T", bound=Comparable)  # pylint: disable=invalid-name
+
+
+class PairingHeapNode(Generic[T]):
+    """
+    The node for each pairing heap value
+
+    `prev` is the parent for a first child, and the previous sibling otherwise.
+    """
+
+    __slots__ = ("key", "value", "child", "sibling", "prev")
+
+    def __init__(self, key: Any, value: T) -> None:
+        self.key: Any = key
+        self.value: T = value
+        self.child: PairingHeapNode[T] | None = None
+        self.sibling: PairingHeapNode[T] | None = None
+        self.prev: PairingHeapNode[T] | None = None
+
+
+class PairingHeap(Generic[T]):
+    """
+    Pairing heap, with the MinHeap API plus O(1) merge() and decrease_key()
+
+    The heap is a tree where every node's key is no bigger than its children's.
+    Inserting and merging link two trees under the smaller root in O(1), and
+    remove_min() pairs up the root's children in two passes, in amortized
+    O(log n). insert() returns the value's node, which can be passed to
+    decrease_key().
+    """
+
+    def __init__(
+        self,
+        iterable: Iterable[T] | None = None,
+        key: Callable[[T], Any] | None = None,
+        reverse: bool = False,
+    ) -> None:
+        self.root: PairingHeapNode[T] | None = None
+        self.length: int = 0
+        self.key: Callable[[T], Any] | None = key
+        self.reverse: bool = reverse
+        self._less: Callable[[Any, Any], bool] = (
+            operator.gt if reverse else operator.lt
+        )
+
+        if iterable:
+            self.insert_many(iterable)
+
+    def insert(self, value: T) -> PairingHeapNode[T]:
+        """Insert a value, returning its node"""
+        node = PairingHeapNode(value if self.key is None else self.key(value), value)
+        self.root = node if self.root is None else self._link(self.root, node)
+        self.length += 1
+        return node
+
+    def insert_many(self, iterable: Iterable[T]) -> None:
+        """Insert all values from an iterable"""
+        for value in iterable:
+            self.insert(value)
+
+    def merge(self, other: Heap[T]) -> None:
+        """
+        Merge every value from another heap into this one
+
+        Another PairingHeap has all of its values moved over in O(1), which empties
+        it. Other heaps (like a MinHeap) are read with iter_sorted() and left
+        unchanged.
+        """
+        if other is self:
+            raise ValueError("Can't merge a heap into itself")
+        if other.reverse != self.reverse:
+            raise ValueError("Can't merge heaps which are ordered in opposite ways")
+        if not isinstance(other, PairingHeap):
+            self.insert_many(other.iter_sorted())
+            return
+        if other.root is not None:
+            self.root = (
+                other.root if self.root is None else self._link(self.root, other.root)
+            )
+            self.length += other.length
+        other.root = None
+        other.length = 0
+
+    def remove_min(self) -> T:
+        """Remove and return the heap's minimum value"""
+        root = self.root
+        if root is None:
+            raise IndexError
+
+        # First pass: link the root's children in pairs, from left to right
+        pairs = []
+        node = root.child
+        while node is not None:
+            second = node.sibling
+            node.sibling = node.prev = None
+            if second is None:
+                pairs.append(node)
+                break
+            next_node = second.sibling
+            second.sibling = second.prev = None
+            pairs.append(self._link(node, second))
+            node = next_node
+
+        # Second pass: link the pairs into one tree, from right to left
+        new_root = pairs.pop() if pairs else None
+        while pairs:
+            new_root = self._link(pairs.pop(), new_root)  # type: ignore[arg-type]
+
+        self.root = new_root
+        self.length -= 1
+        root.child = None
+        return root.value
+
+    def replace(self, value: T) -> T:
+        """Remove and return the minimum value, then insert a new one"""
+        removed_value = self.remove_min()
+        self.insert(value)
+        return removed_value
+
+    def pushpop(self, value: T) -> T:
+        """Insert a value, then remove and return the minimum"""
+        key = value if self.key is None else self.key(value)
+
+        # The new value comes straight back out unless the current minimum beats it
+        if self.root is None or not self._less(self.root.key, key):
+            return value
+        return self.replace(value)
+
+    def decrease_key(self, node: PairingHeapNode[T], priority: Any) -> None:
+        """Move a node closer to the top of the heap by giving it a better priority"""
+        if node is not self.root and node.prev is None:
+            raise ValueError("The node is not in the heap")
+        if self._less(node.key, priority):
+            raise ValueError("The new priority would move the value down the heap")
+        node.key = priority
+        prev = node.prev
+        if prev is None:
+            return
+
+        # Cut the node's subtree out of the tree, then link it back in at the root
+        if prev.child is node:
+            prev.child = node.sibling
+        else:
+            prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = prev
+        node.sibling = node.prev = None
+        self.root = self._link(self.root, node)  # type: ignore[arg-type]
+
+    def peek(self) -> T:
+        """Return the heap's minimum value without removing it"""
+        if self.root is None:
+            raise IndexError
+        return self.root.value
+
+    def peek_key(self) -> Any:
+        """Return the cached key of the heap's minimum value"""
+        if self.root is None:
+            raise IndexError
+        return self.root.key
+
+    def iter_sorted(self) -> Iterator[T]:
+        """
+        Iterate over all values in order without removing them
+
+        Only the frontier of the tree is kept in an auxiliary heap of nodes, which
+        takes in all of a node's children once the node is yielded. The heap must
+        not be modified during iteration.
+        """
+        if self.root is None:
+            return
+        # Ordered by their keys, so the nodes themselves are never compared
+        frontier: MinHeap[Any] = MinHeap(
+            [self.root], key=operator.attrgetter("key"), reverse=self.reverse
+        )
+        while frontier.length > 0:
+            node = frontier.remove_min()
+            yield node.value
+            child = node.child
+            while child is not None:
+                frontier.insert(child)
+                child = child.sibling
+
+    def nsmallest(self, k: int) -> list[T]:
+        """Return the first k values in heap order without removing them"""
+        return list(islice(self.iter_sorted(), k))
+
+    def save(self, path: snapshot.StrPath) -> None:
+        """
+        Save the heap to a snapshot file, as one flat list of (key, value) pairs
+
+        The key function isn't saved, so pass it to load(). Nodes returned by
+        insert() don't carry over to the loaded heap.
+        """
+        snapshot.write(path, self, {"reverse": self.reverse, "items": self._items()})
+
+    @classmethod
+    def load(
+        cls, path: snapshot.StrPath, key: Callable[[T], Any] | None = None
+    ) -> "PairingHeap[T]":
+        """Load a heap saved by save(), given the key function it was built with"""
+        state, _ = snapshot.read(path, cls)
+        heap: PairingHeap[T] = cls(key=key, reverse=state["reverse"])
+        heap._link_items(state["items"])
+        return heap
+
+    def _items(self) -> list[tuple[Any, T]]:
+        """Collect every (key, value) pair, walking the tree without recursion"""
+        items = []
+        nodes = [] if self.root is None else [self.root]
+        while nodes:
+            node = nodes.pop()
+            items.append((node.key, node.value))
+            if node.child is not None:
+                nodes.append(node.child)
+            if node.sibling is not None:
+                nodes.append(node.sibling)
+        return items
+
+    def _link_items(self, items: list[tuple[Any, T]]) -> None:
+        """Link a node for each (key, value) pair into the heap, keeping the keys"""
+        for key, value in items:
+            node = PairingHeapNode(key, value)
+            self.root = node if self.root is None else self._link(self.root, node)
+        self.length += len(items)
+
+    def _link(
+        self, first: PairingHeapNode[T], second: PairingHeapNode[T]
+    ) -> PairingHeapNode[T]:
+        """Make the root with the bigger key the first child of the other"""
+        if self._less(second.key, first.key):
+            first, second = second, first
+        child = first.child
+        second.sibling = child
+        if child is not None:
+            child.prev = second
+        second.prev = first
+        first.child = second
+        return first
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over all values by removing them one at a time"""
+        while self.root is not None:
+            yield self.remove_min()
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Pickling the nodes themselves would recurse once per level of the tree
+        state = vars(self).copy()
+        state["root"] = self._items()
+        state["length"] = 0
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        items = state.pop("root")
+        self.__dict__.update(state)
+        self.root = None
+        self._link_items(items)
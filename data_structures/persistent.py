@@ -0,0 +1,259 @@
+"""Persistent (immutable) stack and linked list implementations"""
+
+from typing import Any, Generic, Iterable, Iterator, Self, TypeVar
+
+from data_structures.linked_list import LinkedListNode
+
+T = TypeVar("T")  # pylint: disable=invalid-name
+
+# The hash of the empty chain, which every chain's hash is built up from
+EMPTY_HASH: int = hash(())
+
+
+class PersistentNode(LinkedListNode[T]):
+    """
+    Linked list node which is never changed once it is part of a version
+
+    Each node knows the length of the chain it starts, and caches the chain's hash
+    the first time it is needed, so that every version sharing the node shares the
+    work of hashing it.
+    """
+
+    __slots__ = ("length", "hash")
+
+    def __init__(self, data: T, next_node: "PersistentNode[T] | None") -> None:
+        super().__init__(data)
+        self.next: PersistentNode[T] | None = next_node
+        self.length: int = 1 if next_node is None else next_node.length + 1
+        self.hash: int | None = None
+
+
+def _chain(
+    values: Iterable[T], rest: PersistentNode[T] | None
+) -> PersistentNode[T] | None:
+    """Prepend nodes for the values onto a chain, so the last value ends up first"""
+    node = rest
+    for value in values:
+        node = PersistentNode(value, node)
+    return node
+
+
+class _PersistentChain(Generic[T]):
+    """
+    Immutable version of a singly linked chain of nodes
+
+    Versions share nodes with the versions they were made from, so equality only
+    walks up to the first node the two versions share.
+    """
+
+    def __init__(self, head: PersistentNode[T] | None = None) -> None:
+        self.head: PersistentNode[T] | None = head
+
+    @classmethod
+    def _from_head(cls, head: PersistentNode[T] | None) -> Self:
+        """Make a version around a chain of nodes, which may be shared"""
+        version = cls.__new__(cls)
+        version.head = head
+        return version
+
+    def _get_node(self, idx: int) -> PersistentNode[T]:
+        """Get the node at the given index"""
+        # Make sure the index is not out-of-bounds
+        if idx < 0 or idx > len(self) - 1:
+            raise IndexError
+
+        node = self.head
+        for _ in range(idx):
+            assert node is not None  # This is guaranteed by our bounds check
+            node = node.next
+        assert node is not None  # This is guaranteed by our bounds check
+        return node
+
+    def _replace_prefix(
+        self, count: int, values: list[T], rest: PersistentNode[T] | None
+    ) -> PersistentNode[T] | None:
+        """
+        Build a chain of the first count values' copies, then values, then rest
+
+        Only the nodes before the change are copied, and `rest` is shared.
+        """
+        prefix = []
+        node = self.head
+        for _ in range(count):
+            assert node is not None  # Callers check count against the length
+            prefix.append(node.data)
+            node = node.next
+        prefix += values
+        prefix.reverse()
+        return _chain(prefix, rest)
+
+    def __len__(self) -> int:
+        return 0 if self.head is None else self.head.length
+
+    def __iter__(self) -> Iterator[T]:
+        node = self.head
+        while node is not None:
+            yield node.data
+            node = node.next
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        assert isinstance(other, _PersistentChain)
+        if len(self) != len(other):
+            return False
+        node, other_node = self.head, other.head
+        # Once the chains reach a shared node, the rest is the same
+        while node is not other_node:
+            assert node is not None and other_node is not None  # Same lengths
+            if (
+                node.hash is not None
+                and other_node.hash is not None
+                and node.hash != other_node.hash
+            ):
+                return False
+            if node.data != other_node.data:
+                return False
+            node, other_node = node.next, other_node.next
+        return True
+
+    def __hash__(self) -> int:
+        # Hash the nodes that aren't hashed yet from the back, without recursion
+        unhashed = []
+        node = self.head
+        while node is not None and node.hash is None:
+            unhashed.append(node)
+            node = node.next
+        chain_hash = EMPTY_HASH if node is None else node.hash
+        for node in reversed(unhashed):
+            chain_hash = hash((node.data, chain_hash))
+            node.hash = chain_hash
+        return chain_hash  # type: ignore[return-value]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle the values as a flat list, not as a chain of nodes to recurse into"""
+        return _unpickle, (type(self), list(self))
+
+
+def _unpickle(cls: type[_PersistentChain[T]], values: list[T]) -> _PersistentChain[T]:
+    """Rebuild a pickled version from its values, in order from the head"""
+    return cls._from_head(_chain(reversed(values), None))
+
+
+class PersistentStack(_PersistentChain[T]):
+    """
+    Immutable stack whose versions share structure
+
+    push() and pop() return a new version in O(1), leaving the old one untouched
+    and sharing every node with it. Values are pushed in iteration order, so the
+    last one ends up on top. Iterating goes from the top down, without popping.
+    """
+
+    def __init__(self, iterable: Iterable[T] | None = None) -> None:
+        super().__init__(_chain(iterable or (), None))
+
+    def push(self, value: T) -> "PersistentStack[T]":
+        """Return a new version with the value pushed on top"""
+        return self._from_head(PersistentNode(value, self.head))
+
+    def push_many(self, iterable: Iterable[T]) -> "PersistentStack[T]":
+        """Return a new version with all values from an iterable pushed, in order"""
+        return self._from_head(_chain(iterable, self.head))
+
+    def pop(self) -> "PersistentStack[T]":
+        """Return a new version without the top value, which peek() returns"""
+        if self.head is None:
+            raise IndexError
+        return self._from_head(self.head.next)
+
+    def peek(self, depth: int = 0) -> T:
+        """Peek at the top value, or the value `depth` places below it"""
+        return self._get_node(depth).data
+
+
+class PersistentLinkedList(_PersistentChain[T]):
+    """
+    Immutable linked list whose versions share structure
+
+    Every change returns a new version, leaving the old one untouched. Changes at
+    an index copy the nodes before it and share every node after it with the old
+    version, so prepend() and rest() are O(1), and changes near the head are cheap.
+    """
+
+    def __init__(self, iterable: Iterable[T] | None = None) -> None:
+        super().__init__(_chain(reversed(list(iterable or ())), None))
+
+    def prepend(self, data: T) -> "PersistentLinkedList[T]":
+        """Return a new version with data added at the start"""
+        return self._from_head(PersistentNode(data, self.head))
+
+    def append(self, data: T) -> "PersistentLinkedList[T]":
+        """Return a new version with data added at the end, copying every node"""
+        return self._from_head(self._replace_prefix(len(self), [data], None))
+
+    def rest(self) -> "PersistentLinkedList[T]":
+        """Return the version without the first element, sharing all of its nodes"""
+        if self.head is None:
+            raise IndexError
+        return self._from_head(self.head.next)
+
+    def insert(self, idx: int, data: T) -> "PersistentLinkedList[T]":
+        """Return a new version with data inserted at the given index"""
+        # Make sure the index is not out-of-bounds
+        if idx < 0 or idx > len(self):
+            raise IndexError
+        rest = self._get_node(idx) if idx < len(self) else None
+        return self._from_head(self._replace_prefix(idx, [data], rest))
+
+    def remove(self, idx: int) -> "PersistentLinkedList[T]":
+        """Return a new version without the element at the given index"""
+        node = self._get_node(idx)
+        return self._from_head(self._replace_prefix(idx, [], node.next))
+
+    def set(self, idx: int, data: T) -> "PersistentLinkedList[T]":
+        """Return a new version with the value at the given index replaced"""
+        node = self._get_node(idx)
+        return self._from_head(self._replace_prefix(idx, [data], node.next))
+
+    def get(self, idx: int) -> T:
+        """Get the value at the given index"""
+        return self._get_node(idx).data
+
+    def __getitem__(self, idx: int) -> T:
+        return self.get(idx)
+
+
+class TransientLinkedList(Generic[T]):
+    """
+    Mutable builder for persistent linked lists
+
+    Values are appended to a plain list, and persistent() links them into nodes in
+    a single pass from the back, so building a list of n values is O(n) instead of
+    the O(n^2) of calling append() on each version. The builder can keep being
+    used after persistent(), since the versions it makes never share its list.
+    """
+
+    def __init__(self, iterable: Iterable[T] | None = None) -> None:
+        self.values: list[T] = list(iterable or ())
+
+    def append(self, data: T) -> None:
+        """Add data to the end"""
+        self.values.append(data)
+
+    def extend(self, iterable: Iterable[T]) -> None:
+        """Add all values from an iterable to the end"""
+        self.values.extend(iterable)
+
+    def persistent(
+        self, rest: PersistentLinkedList[T] | None = None
+    ) -> PersistentLinkedList[T]:
+        """
+        Make a persistent linked list of the values so far
+
+        If `rest` is given the values are prepended to it, sharing all of its nodes.
+        """
+        head = _chain(reversed(self.values), None if rest is None else rest.head)
+        return PersistentLinkedList._from_head(head)
+
+    def __len__(self) -> int:
+        return len(self.values)
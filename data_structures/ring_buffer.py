@@ -0,0 +1,140 @@
+"""Growable circular buffer, which Queue and Deque are built on"""
+
+from typing import Iterable, Iterator, TypeVar, Generic
+
+from data_structures import snapshot
+from data_structures.views import View
+
+T = TypeVar("T")  # pylint: disable=invalid-name
+
+
+class RingBuffer(Generic[T]):
+    """
+    Growable circular buffer, with values added at the back and removed at the front
+
+    Values live in one contiguous list whose capacity is always a power of two, so
+    wrapping around is a bitwise AND. The buffer doubles when full, and if `shrink`
+    is set it halves again once it drains below a quarter of its capacity.
+    """
+
+    MIN_CAPACITY: int = 8
+
+    def __init__(
+        self, iterable: Iterable[T] | None = None, shrink: bool = False
+    ) -> None:
+        # The values run from `head` for `length` slots, wrapping around the end
+        self.buffer: list[T | None] = [None] * RingBuffer.MIN_CAPACITY
+        self.head: int = 0
+        self.length: int = 0
+        self.shrink: bool = shrink
+
+        if iterable:
+            self.extend(iterable)
+
+    def append(self, value: T) -> None:
+        """Add a value at the back"""
+        capacity = len(self.buffer)
+        if self.length == capacity:
+            self._resize(capacity * 2)
+            capacity *= 2
+        self.buffer[(self.head + self.length) & (capacity - 1)] = value
+        self.length += 1
+
+    def popleft(self) -> T:
+        """Remove and return the value at the front"""
+        if self.length == 0:
+            raise IndexError
+
+        value = self.buffer[self.head]
+        # Clear the slot so the buffer doesn't keep the value alive
+        self.buffer[self.head] = None
+        self.head = (self.head + 1) & (len(self.buffer) - 1)
+        self.length -= 1
+        if self.shrink:
+            self._maybe_shrink()
+        return value  # type: ignore[return-value]
+
+    def extend(self, iterable: Iterable[T]) -> None:
+        """Add all values from an iterable at the back, in order"""
+        values = list(iterable)
+        count = len(values)
+        if count == 0:
+            return
+
+        capacity = self._reserve(count)
+        # Copy the batch in with at most two slice assignments, split at the wrap point
+        start = (self.head + self.length) & (capacity - 1)
+        first_part = min(count, capacity - start)
+        self.buffer[start : start + first_part] = values[:first_part]
+        self.buffer[: count - first_part] = values[first_part:]
+        self.length += count
+
+    def peekleft(self) -> T:
+        """Peek at the value at the front"""
+        if self.length == 0:
+            raise IndexError
+        return self.buffer[self.head]  # type: ignore[return-value]
+
+    def view(self, drain: bool = False) -> View[T]:
+        """
+        Make a lazy view of the values, from the front to the back
+
+        A draining view removes each value as it's pulled through the view, like
+        iterating does. Otherwise the view reads the buffer in place, and the values
+        must not change while the view is being iterated.
+        """
+        return View(self.__iter__ if drain else self._iter_in_place)
+
+    def save(self, path: snapshot.StrPath) -> None:
+        """Save the values to a snapshot file, as one flat list"""
+        snapshot.write(path, self, {"values": self._values(), "shrink": self.shrink})
+
+    @classmethod
+    def load(cls, path: snapshot.StrPath) -> "RingBuffer[T]":
+        """Load values saved by save() into a new instance of the same class"""
+        state, _ = snapshot.read(path, cls)
+        return cls(state["values"], shrink=state["shrink"])
+
+    def _iter_in_place(self) -> Iterator[T]:
+        """Yield the values in order, without removing them"""
+        buffer = self.buffer
+        mask = len(buffer) - 1
+        for idx in range(self.head, self.head + self.length):
+            yield buffer[idx & mask]  # type: ignore[misc]
+
+    def _reserve(self, count: int) -> int:
+        """Grow once to fit count more values, returning the capacity"""
+        capacity = len(self.buffer)
+        if self.length + count > capacity:
+            while self.length + count > capacity:
+                capacity *= 2
+            self._resize(capacity)
+        return capacity
+
+    def _maybe_shrink(self) -> None:
+        """Halve the buffer if it is mostly empty"""
+        capacity = len(self.buffer)
+        if capacity > RingBuffer.MIN_CAPACITY and self.length <= capacity // 4:
+            self._resize(capacity // 2)
+
+    def _values(self) -> list[T | None]:
+        """Copy the values out in order, without removing them"""
+        end = self.head + self.length
+        values = self.buffer[self.head : end]
+        if end > len(self.buffer):
+            # The values wrap around past the end of the buffer
+            values += self.buffer[: end - len(self.buffer)]
+        return values
+
+    def _resize(self, capacity: int) -> None:
+        """Move all values into a new buffer of the given capacity, starting at 0"""
+        self.buffer = self._values() + [None] * (capacity - self.length)
+        self.head = 0
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[T]:
+        """An iterator that removes values from the front as it iterates"""
+        while len(self) > 0:
+            yield self.popleft()
@@ -0,0 +1,462 @@
+"""Queue and min-heap in shared memory, for passing records between processes
+
+Records are packed with a `struct` format into a `multiprocessing.shared_memory`
+block, so moving a record between processes is a copy into and out of shared
+memory instead of a pickle and a pipe write. Instances can be passed to child
+processes as `Process` arguments or `Pool` initializer arguments. Pass a `context`
+from `multiprocessing.get_context()` to share one with processes started by a
+method other than the default. The process that created an instance unlinks its
+memory when it closes it.
+"""
+
+import multiprocessing
+import multiprocessing.context
+import os
+import struct
+import time
+from array import array, typecodes
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Iterable
+
+from data_structures.blocking_queue import Empty, Full, wait_for
+
+
+class _SharedStructure:
+    """
+    A block of shared memory, with a lock and conditions guarding it
+
+    Subclasses lay out their header and records in the block, and set up views of
+    it in `_attach()`.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        record_format: str,
+        capacity: int,
+        context: multiprocessing.context.BaseContext | None,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("The capacity must be at least 1")
+        self.capacity: int = capacity
+        self.record_format: str = record_format
+        self.shm = SharedMemory(create=True, size=size)
+        # Forked children inherit the object as is, so ownership goes by process
+        self.owner_pid: int = os.getpid()
+
+        # Both conditions share one lock, so each operation takes it only once
+        context = context or multiprocessing.get_context()
+        self.mutex = context.Lock()
+        self.not_empty = context.Condition(self.mutex)
+        self.not_full = context.Condition(self.mutex)
+        self._attach()
+
+    def _attach(self) -> None:
+        """Set up the record struct and the views of the shared memory"""
+        self.record = struct.Struct(self.record_format)
+        fields = self.record.unpack(bytes(self.record.size))
+        self._single_field: bool = len(fields) == 1
+        # A single native field packs the same as an array, which does it all in C
+        self._typecode: str | None = None
+        numeric_typecodes = typecodes.replace("u", "").replace("w", "")
+        if len(self.record_format) == 1 and self.record_format in numeric_typecodes:
+            self._typecode = self.record_format
+
+    def _pack(self, values: list[Any]) -> bytes:
+        """Pack values into consecutive records"""
+        if self._typecode:
+            return array(self._typecode, values).tobytes()
+        pack = self.record.pack
+        if self._single_field:
+            return b"".join(map(pack, values))
+        return b"".join(pack(*value) for value in values)
+
+    def _unpack(self, data: bytes | memoryview) -> list[Any]:
+        """Unpack consecutive records into values"""
+        if self._typecode:
+            return array(self._typecode, data).tolist()
+        if self._single_field:
+            return [value for (value,) in self.record.iter_unpack(data)]
+        return list(self.record.iter_unpack(data))
+
+    def _release_views(self) -> None:
+        """Release every view of the shared memory, so that it can be closed"""
+
+    def close(self) -> None:
+        """Detach from the shared memory, and free it if this process created it"""
+        self._release_views()
+        self.shm.close()
+        if os.getpid() == self.owner_pid:
+            self.shm.unlink()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = {
+            name: value
+            for name, value in self.__dict__.items()
+            if not isinstance(value, (memoryview, struct.Struct))
+        }
+        state["shm"] = self.shm.name
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.shm = SharedMemory(name=state["shm"])
+        self._attach()
+
+    def __enter__(self) -> Any:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class SharedQueue(_SharedStructure):
+    """
+    FIFO queue of fixed-size records in a circular buffer in shared memory
+
+    Every value is packed with `record_format`, as a tuple if the format has
+    several fields and as a plain value otherwise. Producers block (or time out)
+    while the queue is full, and consumers while it is empty. put_many() and
+    get_many() move as many records as fit per lock acquisition.
+    """
+
+    # head and length
+    HEADER = struct.Struct("qq")
+
+    def __init__(
+        self,
+        capacity: int,
+        record_format: str = "q",
+        context: multiprocessing.context.BaseContext | None = None,
+    ) -> None:
+        record_size = struct.calcsize(record_format)
+        super().__init__(
+            self.HEADER.size + capacity * record_size, record_format, capacity, context
+        )
+        self._header[0] = 0
+        self._header[1] = 0
+
+    def _attach(self) -> None:
+        super()._attach()
+        buf = self.shm.buf
+        assert buf is not None  # Only None once the shared memory is closed
+        self._header = buf[: self.HEADER.size].cast("q")
+        self._records = buf[
+            self.HEADER.size : self.HEADER.size + self.capacity * self.record.size
+        ]
+
+    def _release_views(self) -> None:
+        self._header.release()
+        self._records.release()
+
+    def put(self, value: Any, block: bool = True, timeout: float | None = None) -> None:
+        """Put a value, waiting for free space if the queue is full"""
+        data = self._pack([value])
+        with self.not_full:
+            if self._header[1] == self.capacity:
+                wait_for(
+                    self.not_full,
+                    lambda: self._header[1] < self.capacity,
+                    block,
+                    timeout,
+                    Full,
+                )
+            self._write(data, 1)
+            self.not_empty.notify()
+
+    def put_many(
+        self, iterable: Iterable[Any], block: bool = True, timeout: float | None = None
+    ) -> None:
+        """
+        Put all values from an iterable, as many at a time as there is space for
+
+        If waiting fails part way through, the values already added stay in the queue.
+        """
+        values = list(iterable)
+        data = self._pack(values)
+        record_size = self.record.size
+        deadline = None if timeout is None else time.monotonic() + timeout
+        start = 0
+        while start < len(values):
+            with self.not_full:
+                if self._header[1] == self.capacity:
+                    remaining = None
+                    if deadline is not None:
+                        remaining = max(0.0, deadline - time.monotonic())
+                    wait_for(
+                        self.not_full,
+                        lambda: self._header[1] < self.capacity,
+                        block,
+                        remaining,
+                        Full,
+                    )
+                count = min(len(values) - start, self.capacity - self._header[1])
+                self._write(
+                    data[start * record_size : (start + count) * record_size], count
+                )
+                self.not_empty.notify(count)
+                start += count
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Any:
+        """Remove and return the next value, waiting for one if the queue is empty"""
+        with self.not_empty:
+            if self._header[1] == 0:
+                wait_for(
+                    self.not_empty, lambda: self._header[1] > 0, block, timeout, Empty
+                )
+            data = self._read(1)
+            self.not_full.notify()
+        return self._unpack(data)[0]
+
+    def get_many(self, n: int, timeout: float | None = None) -> list[Any]:
+        """
+        Remove and return up to n values under a single lock acquisition
+
+        Waits (up to `timeout`) only until at least one value is available, then
+        returns everything available up to n without waiting for more.
+        """
+        with self.not_empty:
+            if self._header[1] == 0:
+                wait_for(
+                    self.not_empty, lambda: self._header[1] > 0, True, timeout, Empty
+                )
+            count = min(n, self._header[1])
+            data = self._read(count)
+            self.not_full.notify(count)
+        return self._unpack(data)
+
+    def _write(self, data: bytes, count: int) -> None:
+        """Copy packed records in after the last one, wrapping around (lock held)"""
+        head, length = self._header[0], self._header[1]
+        record_size = self.record.size
+        tail = (head + length) % self.capacity
+        first_part = min(count, self.capacity - tail) * record_size
+        self._records[tail * record_size : tail * record_size + first_part] = data[
+            :first_part
+        ]
+        self._records[: len(data) - first_part] = data[first_part:]
+        self._header[1] = length + count
+
+    def _read(self, count: int) -> bytes:
+        """Copy out and remove count packed records from the head (lock held)"""
+        head = self._header[0]
+        record_size = self.record.size
+        first_part = min(count, self.capacity - head) * record_size
+        first = self._records[head * record_size : head * record_size + first_part]
+        data = first.tobytes() + self._records[: count * record_size - first_part]
+        self._header[0] = (head + count) % self.capacity
+        self._header[1] -= count
+        return data
+
+    def __len__(self) -> int:
+        with self.mutex:
+            return self._header[1]
+
+
+class SharedMinHeap(_SharedStructure):
+    """
+    Min-heap of float keys with fixed-size payloads, in shared memory
+
+    Keys are stored as doubles, and payloads are packed with `payload_format` in a
+    parallel array of slots, as a tuple if the format has several fields and as a
+    plain value otherwise. push_many() and pop_many() move many records per lock
+    acquisition, and a big enough push_many() rebuilds the heap in O(n).
+    """
+
+    # length
+    HEADER = struct.Struct("q")
+
+    def __init__(
+        self,
+        capacity: int,
+        payload_format: str = "q",
+        context: multiprocessing.context.BaseContext | None = None,
+    ) -> None:
+        payload_size = struct.calcsize(payload_format)
+        super().__init__(
+            self.HEADER.size + capacity * (8 + payload_size),
+            payload_format,
+            capacity,
+            context,
+        )
+        self._header[0] = 0
+
+    def _attach(self) -> None:
+        super()._attach()
+        buf = self.shm.buf
+        assert buf is not None  # Only None once the shared memory is closed
+        keys_start = self.HEADER.size
+        payloads_start = keys_start + self.capacity * 8
+        self._header = buf[:keys_start].cast("q")
+        self._keys = buf[keys_start:payloads_start].cast("d")
+        self._payloads = buf[
+            payloads_start : payloads_start + self.capacity * self.record.size
+        ]
+
+    def _release_views(self) -> None:
+        self._header.release()
+        self._keys.release()
+        self._payloads.release()
+
+    def push(
+        self,
+        key: float,
+        payload: Any,
+        block: bool = True,
+        timeout: float | None = None,
+    ) -> None:
+        """Push a payload with a key, waiting for free space if the heap is full"""
+        self.push_many([(key, payload)], block, timeout)
+
+    def push_many(
+        self,
+        items: Iterable[tuple[float, Any]],
+        block: bool = True,
+        timeout: float | None = None,
+    ) -> None:
+        """
+        Push (key, payload) pairs, as many at a time as there is space for
+
+        If waiting fails part way through, the pairs already added stay in the heap.
+        """
+        items = list(items)
+        keys = array("d", [key for key, _ in items])
+        data = self._pack([payload for _, payload in items])
+        payload_size = self.record.size
+        deadline = None if timeout is None else time.monotonic() + timeout
+        start = 0
+        while start < len(items):
+            with self.not_full:
+                if self._header[0] == self.capacity:
+                    remaining = None
+                    if deadline is not None:
+                        remaining = max(0.0, deadline - time.monotonic())
+                    wait_for(
+                        self.not_full,
+                        lambda: self._header[0] < self.capacity,
+                        block,
+                        remaining,
+                        Full,
+                    )
+                length = self._header[0]
+                count = min(len(items) - start, self.capacity - length)
+                self._keys[length : length + count] = keys[start : start + count]
+                self._payloads[
+                    length * payload_size : (length + count) * payload_size
+                ] = data[start * payload_size : (start + count) * payload_size]
+                self._header[0] = length + count
+
+                # Rebuilding bottom-up beats sifting up once the batch is as big as
+                # the heap was
+                if count >= length:
+                    for idx in reversed(range((length + count) // 2)):
+                        self._sift_down(idx)
+                else:
+                    for idx in range(length, length + count):
+                        self._sift_up(idx)
+                self.not_empty.notify(count)
+                start += count
+
+    def pop(
+        self, block: bool = True, timeout: float | None = None
+    ) -> tuple[float, Any]:
+        """Remove and return the (key, payload) with the smallest key"""
+        with self.not_empty:
+            if self._header[0] == 0:
+                wait_for(
+                    self.not_empty, lambda: self._header[0] > 0, block, timeout, Empty
+                )
+            key, data = self._pop()
+            self.not_full.notify()
+        return key, self._unpack(data)[0]
+
+    def pop_many(self, n: int, timeout: float | None = None) -> list[tuple[float, Any]]:
+        """
+        Remove and return up to n (key, payload) pairs in order, under one lock
+
+        Waits (up to `timeout`) only until at least one pair is available, then
+        returns everything available up to n without waiting for more.
+        """
+        with self.not_empty:
+            if self._header[0] == 0:
+                wait_for(
+                    self.not_empty, lambda: self._header[0] > 0, True, timeout, Empty
+                )
+            popped = [self._pop() for _ in range(min(n, self._header[0]))]
+            self.not_full.notify(len(popped))
+        payloads = self._unpack(b"".join(data for _, data in popped))
+        return [(key, payload) for (key, _), payload in zip(popped, payloads)]
+
+    def peek(self) -> tuple[float, Any]:
+        """Return the (key, payload) with the smallest key without removing it"""
+        payload_size = self.record.size
+        with self.mutex:
+            if self._header[0] == 0:
+                raise Empty
+            return self._keys[0], self._unpack(self._payloads[:payload_size])[0]
+
+    def _pop(self) -> tuple[float, bytes]:
+        """Remove the top key and its packed payload (lock held, heap not empty)"""
+        keys = self._keys
+        payloads = self._payloads
+        payload_size = self.record.size
+        key = keys[0]
+        data = payloads[:payload_size].tobytes()
+        length = self._header[0] - 1
+        self._header[0] = length
+        if length > 0:
+            keys[0] = keys[length]
+            payloads[:payload_size] = payloads[
+                length * payload_size : (length + 1) * payload_size
+            ]
+            self._sift_down(0)
+        return key, data
+
+    def _sift_up(self, idx: int) -> None:
+        """Bubble the record at the given index up to its place (lock held)"""
+        keys = self._keys
+        payloads = self._payloads
+        size = self.record.size
+        key = keys[idx]
+        payload = payloads[idx * size : (idx + 1) * size].tobytes()
+        while idx > 0:
+            parent_idx = (idx - 1) // 2
+            parent_key = keys[parent_idx]
+            if not key < parent_key:
+                break
+            keys[idx] = parent_key
+            payloads[idx * size : (idx + 1) * size] = payloads[
+                parent_idx * size : (parent_idx + 1) * size
+            ]
+            idx = parent_idx
+        keys[idx] = key
+        payloads[idx * size : (idx + 1) * size] = payload
+
+    def _sift_down(self, idx: int) -> None:
+        """Bubble the record at the given index down to its place (lock held)"""
+        keys = self._keys
+        payloads = self._payloads
+        size = self.record.size
+        length = self._header[0]
+        key = keys[idx]
+        payload = payloads[idx * size : (idx + 1) * size].tobytes()
+        child_idx = (idx * 2) + 1
+        while child_idx < length:
+            right_child_idx = child_idx + 1
+            if right_child_idx < length and keys[right_child_idx] < keys[child_idx]:
+                child_idx = right_child_idx
+            child_key = keys[child_idx]
+            if not child_key < key:
+                break
+            keys[idx] = child_key
+            payloads[idx * size : (idx + 1) * size] = payloads[
+                child_idx * size : (child_idx + 1) * size
+            ]
+            idx = child_idx
+            child_idx = (idx * 2) + 1
+        keys[idx] = key
+        payloads[idx * size : (idx + 1) * size] = payload
+
+    def __len__(self) -> int:
+        with self.mutex:
+            return self._header[0]
@@ -0,0 +1,136 @@
+"""Binary snapshot files, for saving structures and loading them back
+
+A snapshot file holds a fixed magic string, a JSON header, a single pickle of the
+structure's flattened contents, and then any raw buffers, such as arrays of
+numbers. Each buffer starts on a 64-byte boundary, so it can be memory-mapped
+straight from the file instead of being read in element by element.
+
+The structures' save() and load() methods are built on write() and read() here.
+Like any pickle, a snapshot should only be loaded from a trusted source.
+"""
+
+import json
+import os
+import pickle
+import struct
+from dataclasses import dataclass
+from typing import Any
+
+MAGIC: bytes = b"DSSNAP\x00\x01"
+# The magic string is followed by the length of the JSON header
+PREFIX = struct.Struct(f"<{len(MAGIC)}sQ")
+ALIGNMENT: int = 64
+
+StrPath = str | os.PathLike[str]
+
+
+@dataclass(frozen=True)
+class BufferInfo:
+    """Where a raw buffer is in a snapshot file, and the format of its items"""
+
+    format: str
+    offset: int
+    nbytes: int
+
+
+def _class_name(cls: type) -> str:
+    """The name a class is recorded under in snapshot files"""
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _align(offset: int) -> int:
+    """Round an offset up to the next buffer boundary"""
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def write(
+    path: StrPath,
+    structure: object,
+    state: Any,
+    buffers: dict[str, tuple[str, Any]] | None = None,
+) -> None:
+    """
+    Write a snapshot of a structure, given its flattened state and raw buffers
+
+    `state` is pickled in one go, so it should be flat (like a list of values)
+    rather than a chain of nodes. `buffers` maps names to a format (such as an
+    `array` typecode or a NumPy dtype string) and an object supporting the buffer
+    protocol. The snapshot is written next to `path` and then moved over it, so a
+    crash part way through never leaves a truncated file behind.
+    """
+    buffers = buffers or {}
+    pickled = pickle.dumps(state, pickle.HIGHEST_PROTOCOL)
+    views = {
+        name: memoryview(buffer).cast("B") for name, (_, buffer) in buffers.items()
+    }
+
+    # The header records the buffers' offsets, which depend on the header's length.
+    # Offsets are relative to the end of the header until that is known
+    layout: dict[str, dict[str, Any]] = {}
+    offset = len(pickled)
+    for name, view in views.items():
+        offset = _align(offset)
+        layout[name] = {
+            "format": buffers[name][0],
+            "offset": offset,
+            "nbytes": view.nbytes,
+        }
+        offset += view.nbytes
+    header = {
+        "class": _class_name(type(structure)),
+        "state": len(pickled),
+        "buffers": layout,
+    }
+    # Pad the header so the data after it starts on a boundary
+    encoded = json.dumps(header).encode()
+    end = PREFIX.size + len(encoded)
+    encoded += b" " * (_align(end) - end)
+
+    temp_path = f"{os.fspath(path)}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(PREFIX.pack(MAGIC, len(encoded)))
+        file.write(encoded)
+        file.write(pickled)
+        position = len(pickled)
+        for name, view in views.items():
+            padding = layout[name]["offset"] - position
+            file.write(b"\x00" * padding)
+            file.write(view)
+            position += padding + view.nbytes
+    os.replace(temp_path, path)
+
+
+def read(path: StrPath, cls: type) -> tuple[Any, dict[str, BufferInfo]]:
+    """
+    Read the state of a structure from a snapshot, and find its raw buffers
+
+    Raises ValueError if the file isn't a snapshot, or is a snapshot of some class
+    other than `cls`. The buffers aren't read; their offsets are absolute, ready to
+    be passed to read_buffer() or a memory map.
+    """
+    with open(path, "rb") as file:
+        prefix = file.read(PREFIX.size)
+        if len(prefix) < PREFIX.size or prefix[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"{os.fspath(path)} is not a snapshot file")
+        _, header_size = PREFIX.unpack(prefix)
+        header = json.loads(file.read(header_size))
+        if header["class"] != _class_name(cls):
+            raise ValueError(
+                f"{os.fspath(path)} is a snapshot of {header['class']},"
+                f" not {_class_name(cls)}"
+            )
+        state = pickle.loads(file.read(header["state"]))
+
+    data_start = PREFIX.size + header_size
+    buffers = {
+        name: BufferInfo(info["format"], data_start + info["offset"], info["nbytes"])
+        for name, info in header["buffers"].items()
+    }
+    return state, buffers
+
+
+def read_buffer(path: StrPath, info: BufferInfo) -> bytes:
+    """Read one raw buffer from a snapshot file"""
+    with open(path, "rb") as file:
+        file.seek(info.offset)
+        return file.read(info.nbytes)
@@ -0,0 +1,233 @@
+"""Sorted list implementation"""
+
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain
+from typing import Generic, Iterable, Iterator, TypeVar
+from typing_protocols.protocols import Comparable
+
+from data_structures.fenwick_tree import FenwickTree
+
+T = TypeVar("T", bound=Comparable)  # pylint: disable=invalid-name
+
+
+class SortedList(Generic[T]):
+    """
+    List which keeps its values in sorted order, stored in chunks
+
+    Like UnrolledLinkedList, values live in chunks of up to `2 * chunk_size`, and
+    `maxes` holds the last (largest) value of every chunk, so finding a value is a
+    binary search of `maxes` and then of one chunk. Adding or removing a value
+    only shifts values within its chunk.
+
+    Rank and select (index_of() and kth()) go through a Fenwick tree of the chunk
+    lengths, which is updated in O(log n) as values come and go, and rebuilt lazily
+    when chunks are split or merged.
+    """
+
+    def __init__(
+        self, iterable: Iterable[T] | None = None, chunk_size: int = 256
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.chunk_size: int = chunk_size
+        self.chunks: list[list[T]] = []
+        self.maxes: list[T] = []
+        self.length: int = 0
+        # Fenwick tree over the chunk lengths, or None until it's rebuilt
+        self._tree: FenwickTree | None = None
+
+        if iterable:
+            self.add_many(iterable)
+
+    def add(self, value: T) -> None:
+        """Add a value, keeping the list sorted. Equal values go after existing ones"""
+        if not self.chunks:
+            self.chunks.append([value])
+            self.maxes.append(value)
+            self.length = 1
+            self._tree = None
+            return
+
+        chunk_idx = bisect_right(self.maxes, value)
+        if chunk_idx == len(self.maxes):
+            # The value is the new largest, so it goes on the end of the last chunk
+            chunk_idx -= 1
+            self.chunks[chunk_idx].append(value)
+            self.maxes[chunk_idx] = value
+        else:
+            insort(self.chunks[chunk_idx], value)
+        self.length += 1
+        self._tree_add(chunk_idx, 1)
+        if len(self.chunks[chunk_idx]) > 2 * self.chunk_size:
+            self._split(chunk_idx)
+
+    def add_many(self, iterable: Iterable[T]) -> None:
+        """Add all values from an iterable, re-sorting everything once"""
+        values = list(iterable)
+        if len(values) < self.length // 8:
+            for value in values:
+                self.add(value)
+            return
+
+        # sorted() merges the existing sorted run with the new values in about
+        # O(n + m log m), then the chunks are cut afresh
+        values = sorted(chain(self, values))
+        self.chunks = [
+            values[start : start + self.chunk_size]
+            for start in range(0, len(values), self.chunk_size)
+        ]
+        self.maxes = [chunk[-1] for chunk in self.chunks]
+        self.length = len(values)
+        self._tree = None
+
+    def remove(self, value: T) -> None:
+        """Remove one occurrence of a value, raising ValueError if it isn't there"""
+        chunk_idx = bisect_left(self.maxes, value)
+        if chunk_idx < len(self.maxes):
+            chunk = self.chunks[chunk_idx]
+            position = bisect_left(chunk, value)
+            if chunk[position] == value:
+                del chunk[position]
+                self.length -= 1
+                self._tree_add(chunk_idx, -1)
+                self._shrink(chunk_idx)
+                return
+        raise ValueError(f"{value!r} is not in the SortedList")
+
+    def discard(self, value: T) -> bool:
+        """Remove one occurrence of a value if there is one, returning whether it was"""
+        try:
+            self.remove(value)
+        except ValueError:
+            return False
+        return True
+
+    def bisect_left(self, value: T) -> int:
+        """The index where the value would be added before any equal values"""
+        chunk_idx = bisect_left(self.maxes, value)
+        if chunk_idx == len(self.maxes):
+            return self.length
+        return self._offset(chunk_idx) + bisect_left(self.chunks[chunk_idx], value)
+
+    def bisect_right(self, value: T) -> int:
+        """The index where the value would be added after any equal values"""
+        chunk_idx = bisect_right(self.maxes, value)
+        if chunk_idx == len(self.maxes):
+            return self.length
+        return self._offset(chunk_idx) + bisect_right(self.chunks[chunk_idx], value)
+
+    bisect = bisect_right
+
+    def index_of(self, value: T) -> int:
+        """The index of the first occurrence of a value, raising ValueError if none"""
+        chunk_idx = bisect_left(self.maxes, value)
+        if chunk_idx < len(self.maxes):
+            chunk = self.chunks[chunk_idx]
+            position = bisect_left(chunk, value)
+            if chunk[position] == value:
+                return self._offset(chunk_idx) + position
+        raise ValueError(f"{value!r} is not in the SortedList")
+
+    def kth(self, k: int) -> T:
+        """The value at index k in sorted order, so kth(0) is the smallest"""
+        chunk_idx, position = self._locate(k)
+        return self.chunks[chunk_idx][position]
+
+    def irange(
+        self,
+        lo: T | None = None,
+        hi: T | None = None,
+        inclusive: tuple[bool, bool] = (True, True),
+    ) -> Iterator[T]:
+        """
+        Iterate in order over the values from lo to hi
+
+        A bound of None leaves that end open, and `inclusive` says whether values
+        equal to lo and hi are included. The list must not be modified during
+        iteration.
+        """
+        start = 0
+        if lo is not None:
+            start = self.bisect_left(lo) if inclusive[0] else self.bisect_right(lo)
+        stop = self.length
+        if hi is not None:
+            stop = self.bisect_right(hi) if inclusive[1] else self.bisect_left(hi)
+        if start >= stop:
+            return
+
+        chunk_idx, position = self._locate(start)
+        remaining = stop - start
+        while remaining > 0:
+            part = self.chunks[chunk_idx][position : position + remaining]
+            yield from part
+            remaining -= len(part)
+            chunk_idx += 1
+            position = 0
+
+    def _split(self, chunk_idx: int) -> None:
+        """Split a chunk that grew too big in two"""
+        chunk = self.chunks[chunk_idx]
+        self.chunks.insert(chunk_idx + 1, chunk[self.chunk_size :])
+        del chunk[self.chunk_size :]
+        self.maxes.insert(chunk_idx, chunk[-1])
+        self._tree = None
+
+    def _shrink(self, chunk_idx: int) -> None:
+        """Drop or merge a chunk that a removal left empty or too small"""
+        chunk = self.chunks[chunk_idx]
+        if not chunk:
+            del self.chunks[chunk_idx]
+            del self.maxes[chunk_idx]
+            self._tree = None
+            return
+        self.maxes[chunk_idx] = chunk[-1]
+
+        # Merge small chunks into the next one, so that chunks don't dwindle into
+        # many tiny lists. The merged chunk is split again if it ends up too big
+        if len(chunk) < self.chunk_size // 2 and chunk_idx + 1 < len(self.chunks):
+            chunk.extend(self.chunks[chunk_idx + 1])
+            del self.chunks[chunk_idx + 1]
+            del self.maxes[chunk_idx]
+            self._tree = None
+            if len(chunk) > 2 * self.chunk_size:
+                self._split(chunk_idx)
+
+    def _build_tree(self) -> FenwickTree:
+        """Rebuild the Fenwick tree of chunk lengths in O(number of chunks)"""
+        self._tree = FenwickTree(map(len, self.chunks))
+        return self._tree
+
+    def _tree_add(self, chunk_idx: int, delta: int) -> None:
+        """Record that a chunk's length changed, if the tree is up to date"""
+        if self._tree is not None:
+            self._tree.add(chunk_idx, delta)
+
+    def _offset(self, chunk_idx: int) -> int:
+        """The index of the first value in the given chunk"""
+        tree = self._tree if self._tree is not None else self._build_tree()
+        return tree.prefix_sum(chunk_idx)
+
+    def _locate(self, idx: int) -> tuple[int, int]:
+        """Get the index of the chunk holding the given index, and its position there"""
+        # Make sure the index is not out-of-bounds
+        if idx < 0 or idx > self.length - 1:
+            raise IndexError
+
+        tree = self._tree if self._tree is not None else self._build_tree()
+        return tree.locate(idx)
+
+    def __contains__(self, value: object) -> bool:
+        chunk_idx = bisect_left(self.maxes, value)  # type: ignore[call-overload]
+        if chunk_idx == len(self.maxes):
+            return False
+        chunk = self.chunks[chunk_idx]
+        return chunk[bisect_left(chunk, value)] == value  # type: ignore[arg-type]
+
+    def __getitem__(self, idx: int) -> T:
+        return self.kth(idx)
+
+    def __iter__(self) -> Iterator[T]:
+        return chain.from_iterable(self.chunks)
+
+    def __len__(self) -> int:
+        return self.length
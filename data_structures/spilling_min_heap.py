@@ -0,0 +1,317 @@
+"""Min-heap which spills to disk once it outgrows a memory budget"""
+
+import pickle
+import sys
+import tempfile
+from itertools import islice
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Generic, Iterable, Iterator, TypeVar
+from typing_protocols.protocols import Comparable, Heap
+
+from data_structures import snapshot
+from data_structures.k_way_merge import merge
+from data_structures.min_heap import MinHeap
+
+T = TypeVar("T", bound=Comparable)  # pylint: disable=invalid-name
+
+# Spilled runs are written and read sequentially, through buffers this large
+IO_BUFFER_SIZE: int = 1 << 20
+
+# Values are pickled in blocks of this many, so reading a run back only holds one
+# block per run in memory
+BLOCK_ITEMS: int = 4096
+
+
+def _list_blocks(
+    keys: list[Any], values: list[T]
+) -> Iterator[tuple[list[Any], list[T]]]:
+    """Cut sorted lists of keys and values into blocks"""
+    for start in range(0, len(values), BLOCK_ITEMS):
+        block_values = values[start : start + BLOCK_ITEMS]
+        # When the values are their own keys, passing the same list lets pickle
+        # store it once
+        block_keys = (
+            block_values if keys is values else keys[start : start + BLOCK_ITEMS]
+        )
+        yield block_keys, block_values
+
+
+def _stream_blocks(
+    items: Iterable[tuple[Any, T]], keyed: bool
+) -> Iterator[tuple[list[Any], list[T]]]:
+    """Group a sorted stream of (key, value) pairs into blocks, like _list_blocks()"""
+    iterator = iter(items)
+    while block := list(islice(iterator, BLOCK_ITEMS)):
+        values = [value for _, value in block]
+        yield ([key for key, _ in block] if keyed else values), values
+
+
+class _Run(Generic[T]):
+    """A sorted run of values and their keys in a temporary file"""
+
+    def __init__(
+        self, blocks: Iterable[tuple[list[Any], list[T]]], directory: str | None
+    ) -> None:
+        self.file = tempfile.TemporaryFile(dir=directory, buffering=IO_BUFFER_SIZE)
+        self.remaining: int = 0
+        for block in blocks:
+            pickle.dump(block, self.file, pickle.HIGHEST_PROTOCOL)
+            self.remaining += len(block[1])
+        self.file.flush()
+
+        self.keys, self.values, self.offset = self._read_block(0)
+        self.position: int = 0
+        self.head_key: Any = self.keys[0]
+
+    def pop(self) -> T:
+        """Remove and return the first value, reading the next block if needed"""
+        value = self.values[self.position]
+        self.position += 1
+        self.remaining -= 1
+        if self.remaining == 0:
+            self.file.close()
+            return value
+
+        if self.position == len(self.values):
+            self.keys, self.values, self.offset = self._read_block(self.offset)
+            self.position = 0
+        self.head_key = self.keys[self.position]
+        return value
+
+    def peek(self) -> T:
+        """Return the first value without removing it"""
+        return self.values[self.position]
+
+    def iter_blocks(self) -> Iterator[tuple[list[Any], list[T]]]:
+        """Iterate over the keys and values left in the run, a block at a time"""
+        yield self.keys[self.position :], self.values[self.position :]
+        left = self.remaining - (len(self.values) - self.position)
+        offset = self.offset
+        while left > 0:
+            keys, values, offset = self._read_block(offset)
+            yield keys, values
+            left -= len(values)
+
+    def iter_remaining(self) -> Iterator[T]:
+        """Iterate over the values left in the run without removing them"""
+        for _, values in self.iter_blocks():
+            yield from values
+
+    def iter_items(self) -> Iterator[tuple[Any, T]]:
+        """Iterate over the (key, value) pairs left in the run without removing them"""
+        for keys, values in self.iter_blocks():
+            yield from zip(keys, values)
+
+    def _read_block(self, offset: int) -> tuple[list[Any], list[T], int]:
+        """Read the keys and values of the block at an offset, and the next offset"""
+        self.file.seek(offset)
+        keys, values = pickle.load(self.file)
+        return keys, values, self.file.tell()
+
+
+class SpillingMinHeap(MinHeap[T]):
+    """
+    Min-heap which writes its values to disk as sorted runs when memory runs low
+
+    Once the in-memory heap holds `max_items` values, or an estimated `max_bytes`
+    (from `sys.getsizeof()` of each value), it is sorted and pickled to a temporary
+    file in blocks, then emptied. remove_min() lazily merges the head of every run
+    with the in-memory heap, so only one block per run is read back at a time.
+    Values, and keys when a key function is given, must be picklable.
+
+    Each run keeps its file open until it is drained, so once there are more than
+    `max_runs` of them, the smallest half are merged into one run. That caps the
+    number of open files (and the number of runs remove_min() merges) however many
+    values are spilled. Since runs are only merged with others of similar size,
+    like the tiers of a log-structured merge tree, each value is rewritten
+    O(log(n / max_items)) times rather than once per merge.
+
+    Call close() (or use the heap as a context manager) to delete any spilled runs
+    before the heap is garbage collected.
+    """
+
+    def __init__(
+        self,
+        iterable: Iterable[T] | None = None,
+        key: Callable[[T], Any] | None = None,
+        reverse: bool = False,
+        max_items: int | None = 1_000_000,
+        max_bytes: int | None = None,
+        directory: str | None = None,
+        max_runs: int = 64,
+    ) -> None:
+        if max_runs < 2:
+            raise ValueError("max_runs must be at least 2")
+        self.max_items: int | None = max_items
+        self.max_runs: int = max_runs
+        self.max_bytes: int | None = max_bytes
+        self.directory: str | None = directory
+        # Only tracked when there is a byte budget
+        self.memory_bytes: int = 0
+        # Spilled runs, ordered by the key of their first value. Typed as Any, since
+        # the runs themselves are never compared
+        self.runs: MinHeap[Any] = MinHeap(key=attrgetter("head_key"), reverse=reverse)
+        self.spilled: int = 0
+        super().__init__(iterable, key=key, reverse=reverse)
+
+    def insert(self, value: T) -> None:
+        super().insert(value)
+        if self.max_bytes is not None:
+            self.memory_bytes += sys.getsizeof(value)
+        self._maybe_spill()
+
+    def insert_many(self, iterable: Iterable[T]) -> None:
+        # Take the values in batches no bigger than the budget, so that an iterable
+        # bigger than memory never has to be held all at once
+        iterator = iter(iterable)
+        batch_size = self.max_items or BLOCK_ITEMS
+        while batch := list(islice(iterator, batch_size)):
+            if len(batch) < self.length:
+                for value in batch:
+                    self.insert(value)
+                continue
+            super().insert_many(batch)
+            if self.max_bytes is not None:
+                self.memory_bytes += sum(map(sys.getsizeof, batch))
+            self._maybe_spill()
+
+    def merge(self, other: Heap[T]) -> None:
+        self.insert_many(other.iter_sorted())
+
+    def remove_min(self) -> T:
+        if self._run_is_next():
+            run = self.runs.peek()
+            value = run.pop()
+            self.spilled -= 1
+            if run.remaining > 0:
+                self.runs.replace(run)
+            else:
+                self.runs.remove_min()
+            return value
+
+        value = super().remove_min()
+        if self.max_bytes is not None:
+            self.memory_bytes -= sys.getsizeof(value)
+        return value
+
+    def replace(self, value: T) -> T:
+        if self._run_is_next():
+            removed_value = self.remove_min()
+            self.insert(value)
+            return removed_value
+
+        removed_value = super().replace(value)
+        if self.max_bytes is not None:
+            self.memory_bytes += sys.getsizeof(value) - sys.getsizeof(removed_value)
+            self._maybe_spill()
+        return removed_value
+
+    def pushpop(self, value: T) -> T:
+        key = value if self.key is None else self.key(value)
+        if len(self) == 0 or not self._less(self.peek_key(), key):
+            return value
+        return self.replace(value)
+
+    def peek(self) -> T:
+        if self._run_is_next():
+            return self.runs.peek().peek()
+        return super().peek()
+
+    def peek_key(self) -> Any:
+        if self._run_is_next():
+            return self.runs.peek_key()
+        return super().peek_key()
+
+    def iter_sorted(self) -> Iterator[T]:
+        """
+        Iterate over all values in order without removing them
+
+        Spilled runs are read back from disk without being consumed. The heap must
+        not be modified during iteration.
+        """
+        if self.runs.length == 0:
+            return super().iter_sorted()
+        runs = self.runs.table[: self.runs.length]
+        return merge(
+            super().iter_sorted(),
+            *(run.iter_remaining() for run in runs),
+            key=self.key,
+            reverse=self.reverse,
+        )
+
+    def save(self, path: snapshot.StrPath) -> None:
+        """Not supported, since the spilled runs only live in temporary files"""
+        raise TypeError("A SpillingMinHeap can't be saved to a snapshot")
+
+    def close(self) -> None:
+        """Delete every spilled run, along with the values left in them"""
+        for run in self.runs.table[: self.runs.length]:
+            run.file.close()
+        self.runs = MinHeap(key=attrgetter("head_key"), reverse=self.reverse)
+        self.spilled = 0
+
+    def _run_is_next(self) -> bool:
+        """Whether the minimum value is at the head of a spilled run, not in memory"""
+        return self.runs.length > 0 and (
+            self.length == 0 or self._less(self.runs.peek_key(), self.keys[0])
+        )
+
+    def _maybe_spill(self) -> None:
+        """Spill the in-memory heap to disk if it is over budget"""
+        if self.length == 0:
+            return
+        if (self.max_items is not None and self.length >= self.max_items) or (
+            self.max_bytes is not None and self.memory_bytes >= self.max_bytes
+        ):
+            self._spill()
+
+    def _spill(self) -> None:
+        """Write the in-memory heap to a new sorted run, then empty it"""
+        keys = self.keys
+        table = self.table
+        order = sorted(range(self.length), key=keys.__getitem__, reverse=self.reverse)
+        sorted_values = [table[idx] for idx in order]
+        sorted_keys = (
+            sorted_values if self.key is None else [keys[idx] for idx in order]
+        )
+        self.runs.insert(_Run(_list_blocks(sorted_keys, sorted_values), self.directory))
+        self.spilled += self.length
+        if self.runs.length > self.max_runs:
+            self._merge_runs()
+
+        self.table = []
+        self.keys = []
+        self.length = 0
+        self.memory_bytes = 0
+
+    def _merge_runs(self) -> None:
+        """Merge the smallest spilled runs into a new run, closing their files"""
+        runs = sorted(self.runs.table[: self.runs.length], key=attrgetter("remaining"))
+        # Leave half of max_runs alone, so the biggest runs are rarely rewritten
+        count = self.runs.length - self.max_runs // 2
+        smallest = runs[:count]
+        # Merge (key, value) pairs, so that keys are read back rather than recomputed
+        items = merge(
+            *(run.iter_items() for run in smallest),
+            key=itemgetter(0),
+            reverse=self.reverse,
+        )
+        merged = _Run(_stream_blocks(items, self.key is not None), self.directory)
+        for run in smallest:
+            run.file.close()
+        self.runs = MinHeap(key=attrgetter("head_key"), reverse=self.reverse)
+        self.runs.insert_many([*runs[count:], merged])
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over all values by removing them one at a time (see iter_sorted())"""
+        while len(self) > 0:
+            yield self.remove_min()
+
+    def __len__(self) -> int:
+        return self.length + self.spilled
+
+    def __enter__(self) -> "SpillingMinHeap[T]":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
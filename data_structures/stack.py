@@ -1,66 +1,108 @@
 """Stack implementation"""
 
-from typing import Iterable, Iterator, TypeVar, Generic
+from array import array
+from typing import Iterable, Iterator, MutableSequence, TypeVar, Generic, cast
+
+from data_structures import snapshot
+from data_structures.views import View
 
 T = TypeVar("T")  # pylint: disable=invalid-name
-IT = TypeVar("IT")  # pylint: disable=invalid-name
 
 
 class Stack(Generic[T]):
-    """Stack implementation"""
-
-    class StackNode(Generic[IT]):
-        """The node for each stack value"""
-
-        def __init__(self, value: IT) -> None:
-            self.value: IT = value
-            self.next: Stack.StackNode | None = None
-
-    def __init__(self, iterable: Iterable[T] | None = None) -> None:
-        # Items are added to the head and removed from the tail
-        self.head: Stack.StackNode | None = None
-        self.length = 0
+    """
+    Stack implementation backed by a contiguous array
+
+    The top of the stack is the end of `items`. Passing an `array` module typecode
+    (such as "q" or "d") stores numbers unboxed, rather than one object per value.
+    """
+
+    def __init__(
+        self, iterable: Iterable[T] | None = None, typecode: str | None = None
+    ) -> None:
+        self.typecode: str | None = typecode
+        self.items: MutableSequence[T] = []
+        if typecode is not None:
+            # A typecode means that T is the number type the array stores
+            self.items = cast(MutableSequence[T], array(typecode))
 
         if iterable:
             self.extend(iterable)
 
     def push(self, value: T) -> None:
         """Push a value"""
-
-        node = Stack.StackNode(value)
-        if self.head is None:
-            # Handle the special case of pushing the first element
-            self.head = node
-        else:
-            node.next = self.head
-            self.head = node
-        self.length += 1
+        self.items.append(value)
 
     def pop(self) -> T:
         """Pop a value"""
-        if self.head is None:
+        if not self.items:
             raise IndexError
-
-        node = self.head
-        self.head = self.head.next
-        self.length -= 1
-
-        return node.value
+        return self.items.pop()
 
     def extend(self, iterable: Iterable[T]) -> None:
         """Push all elements from an iterable"""
-        iterator = iter(iterable)
-        for value in iterator:
-            self.push(value)
+        self.push_many(iterable)
+
+    def push_many(self, iterable: Iterable[T]) -> None:
+        """Push all elements from an iterable, in order"""
+        self.items.extend(iterable)
 
-    def peek(self) -> T:
-        """Peek at the top item in the stack"""
-        if self.head is None:
+    def pop_many(self, n: int) -> MutableSequence[T]:
+        """Pop n values at once, returned in the order pop() would return them"""
+        if n < 0 or n > len(self.items):
             raise IndexError
-        return self.head.value
+        if n == 0:
+            return self.items[:0]
+        values = self.items[-n:]
+        del self.items[-n:]
+        values.reverse()
+        return values
+
+    def peek(self, depth: int = 0) -> T:
+        """Peek at the top item in the stack, or the item `depth` places below it"""
+        if depth < 0 or depth >= len(self.items):
+            raise IndexError
+        return self.items[-1 - depth]
+
+    def view(self, drain: bool = False) -> View[T]:
+        """
+        Make a lazy view of the values, from the top down
+
+        A draining view pops each value as it's pulled through the view, like
+        iterating over the stack does. Otherwise the view reads the items in place,
+        and the stack must not change while the view is being iterated.
+        """
+        return View(self.__iter__ if drain else lambda: reversed(self.items))
+
+    def save(self, path: snapshot.StrPath) -> None:
+        """
+        Save the stack to a snapshot file
+
+        Stacks with a typecode are saved as the array's raw bytes, and other stacks
+        as one flat list.
+        """
+        if self.typecode is None:
+            snapshot.write(path, self, {"typecode": None, "items": self.items})
+        else:
+            buffers = {"items": (self.typecode, self.items)}
+            snapshot.write(path, self, {"typecode": self.typecode}, buffers)
+
+    @classmethod
+    def load(cls, path: snapshot.StrPath) -> "Stack[T]":
+        """Load a Stack saved by save()"""
+        state, buffers = snapshot.read(path, cls)
+        stack: Stack[T] = cls(typecode=state["typecode"])
+        if state["typecode"] is None:
+            stack.items = state["items"]
+        else:
+            # Copy the raw bytes straight in, without unpickling any values
+            stack.items.frombytes(  # type: ignore[attr-defined]
+                snapshot.read_buffer(path, buffers["items"])
+            )
+        return stack
 
     def __len__(self) -> int:
-        return self.length
+        return len(self.items)
 
     def __iter__(self) -> Iterator[T]:
         """An iterator that pops items from the stack as it iterates"""
@@ -0,0 +1,125 @@
+"""Tests for async_queues.py"""
+
+import asyncio
+import unittest
+from data_structures.async_queues import AsyncPriorityQueue, AsyncQueue, AsyncStack
+from data_structures.blocking_queue import Empty, Full
+
+
+class AsyncQueuesTest(unittest.IsolatedAsyncioTestCase):
+    """asyncio queue tests"""
+
+    async def test_order(self):
+        """Test that each queue returns values in its own order"""
+        expected = {
+            AsyncQueue: [3, 1, 2],
+            AsyncStack: [2, 1, 3],
+            AsyncPriorityQueue: [1, 2, 3],
+        }
+        for queue_class, order in expected.items():
+            queue = queue_class()
+            await queue.put_many([3, 1, 2])
+            self.assertEqual(len(queue), 3)
+            self.assertEqual([await queue.get() for _ in range(3)], order)
+            self.assertTrue(queue.empty())
+
+    async def test_priority_key(self):
+        """Test that the priority queue passes its key through to the heap"""
+        queue = AsyncPriorityQueue(key=len, reverse=True)
+        await queue.put_many(["a", "ccc", "bb"])
+        self.assertEqual(await queue.get(), "ccc")
+
+    async def test_nowait(self):
+        """Test the non-waiting variants"""
+        queue = AsyncQueue(maxsize=1)
+        self.assertRaises(Empty, queue.get_nowait)
+        queue.put_nowait(1)
+        self.assertTrue(queue.full())
+        self.assertRaises(Full, lambda: queue.put_nowait(2))
+        self.assertEqual(queue.get_nowait(), 1)
+
+    async def test_get_waits(self):
+        """Test that get() waits until a value is put"""
+        queue = AsyncQueue()
+        getter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        self.assertFalse(getter.done())
+        await queue.put("value")
+        self.assertEqual(await asyncio.wait_for(getter, 1), "value")
+
+    async def test_put_waits(self):
+        """Test that put() waits for free space in a bounded queue"""
+        queue = AsyncQueue(maxsize=2)
+        await queue.put_many([1, 2])
+        putter = asyncio.create_task(queue.put(3))
+        await asyncio.sleep(0)
+        self.assertFalse(putter.done())
+        self.assertEqual(await queue.get(), 1)
+        await asyncio.wait_for(putter, 1)
+        self.assertEqual(queue.get_many_nowait(10), [2, 3])
+
+    async def test_cancelled_getter(self):
+        """Test that cancelling a woken getter passes the wakeup on"""
+        queue = AsyncQueue()
+        first = asyncio.create_task(queue.get())
+        second = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        queue.put_nowait("value")
+        first.cancel()
+        self.assertEqual(await asyncio.wait_for(second, 1), "value")
+        self.assertTrue(first.cancelled())
+        self.assertEqual(len(queue.getters), 0)
+
+    async def test_cancelled_putter(self):
+        """Test that a cancelled putter doesn't add its value"""
+        queue = AsyncQueue(maxsize=1)
+        queue.put_nowait(1)
+        putter = asyncio.create_task(queue.put(2))
+        await asyncio.sleep(0)
+        putter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await putter
+        self.assertEqual(queue.get_nowait(), 1)
+        self.assertTrue(queue.empty())
+        self.assertEqual(len(queue.putters), 0)
+
+    async def test_drain_batches_wakeups(self):
+        """Test that a burst of puts wakes a draining consumer only once"""
+        queue = AsyncQueue()
+        received = []
+        wakeups = 0
+
+        async def consume():
+            async for value in queue:
+                received.append(value)
+                if len(received) == 100:
+                    return
+
+        wake = queue._wakeup_next  # pylint: disable=protected-access
+
+        def counting_wakeup(waiters):
+            nonlocal wakeups
+            if waiters:
+                wakeups += 1
+            wake(waiters)
+
+        queue._wakeup_next = counting_wakeup  # pylint: disable=protected-access
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        for value in range(100):
+            queue.put_nowait(value)
+        await asyncio.wait_for(consumer, 1)
+        self.assertEqual(received, list(range(100)))
+        self.assertEqual(wakeups, 1)
+
+    async def test_drain_releases_putters(self):
+        """Test that draining a bounded queue lets blocked producers continue"""
+        queue = AsyncStack(maxsize=4)
+        producer = asyncio.create_task(queue.put_many(range(20)))
+        received = []
+        async for value in queue:
+            received.append(value)
+            if len(received) == 20:
+                break
+        await asyncio.wait_for(producer, 1)
+        self.assertEqual(sorted(received), list(range(20)))
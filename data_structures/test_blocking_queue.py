@@ -0,0 +1,140 @@
+"""Tests for blocking_queue.py"""
+
+import threading
+import time
+import unittest
+from data_structures.blocking_queue import BlockingQueue, Empty, Full
+
+
+class BlockingQueueTest(unittest.TestCase):
+    """Blocking queue tests"""
+
+    def test_put_and_get(self):
+        """Test putting and getting values in FIFO order"""
+        queue = BlockingQueue()
+        queue.put(1)
+        queue.put(2)
+        queue.put_nowait(3)
+        self.assertEqual(len(queue), 3)
+        self.assertEqual(queue.get(), 1)
+        self.assertEqual(queue.get_nowait(), 2)
+        self.assertEqual(queue.get(timeout=0.1), 3)
+        self.assertEqual(len(queue), 0)
+
+    def test_get_empty(self):
+        """Test that getting from an empty queue raises Empty instead of blocking"""
+        queue = BlockingQueue()
+        self.assertRaises(Empty, queue.get_nowait)
+        self.assertRaises(Empty, lambda: queue.get(timeout=0.01))
+        self.assertRaises(Empty, lambda: queue.get_many(5, timeout=0.01))
+        self.assertRaises(IndexError, queue.get_nowait)
+        self.assertRaises(ValueError, lambda: queue.get(timeout=-1))
+
+    def test_put_full(self):
+        """Test that putting into a full queue raises Full instead of blocking"""
+        queue = BlockingQueue(maxsize=2)
+        queue.put(1)
+        queue.put(2)
+        self.assertRaises(Full, lambda: queue.put_nowait(3))
+        self.assertRaises(Full, lambda: queue.put(3, timeout=0.01))
+        self.assertRaises(Full, lambda: queue.put_many([3], timeout=0.01))
+        self.assertEqual(queue.get(), 1)
+        queue.put_nowait(3)
+        self.assertEqual(queue.get_many(10), [2, 3])
+
+    def test_put_many_nowait(self):
+        """Test that a non-blocking put_many() fills free space before raising Full"""
+        queue = BlockingQueue(maxsize=3)
+        queue.put_many([1, 2], block=False)
+        self.assertRaises(Full, lambda: queue.put_many([3, 4], block=False))
+        self.assertEqual(queue.get_many(10), [1, 2, 3])
+
+    def test_blocking_get(self):
+        """Test that a blocked get() wakes up once a value is put"""
+        queue = BlockingQueue()
+        results = []
+        consumer = threading.Thread(target=lambda: results.append(queue.get()))
+        consumer.start()
+        time.sleep(0.01)
+        queue.put("value")
+        consumer.join(timeout=5)
+        self.assertEqual(results, ["value"])
+
+    def test_blocking_put(self):
+        """Test that a blocked put() waits for free space"""
+        queue = BlockingQueue(maxsize=1)
+        queue.put(1)
+        producer = threading.Thread(target=lambda: queue.put(2))
+        producer.start()
+        time.sleep(0.01)
+        self.assertTrue(producer.is_alive())
+        self.assertEqual(queue.get(), 1)
+        producer.join(timeout=5)
+        self.assertEqual(queue.get_nowait(), 2)
+
+    def test_get_many(self):
+        """Test draining several values at once"""
+        queue = BlockingQueue()
+        queue.put_many(range(10))
+        self.assertEqual(queue.get_many(4), [0, 1, 2, 3])
+        self.assertEqual(queue.get_many(100), [4, 5, 6, 7, 8, 9])
+
+    def test_put_many_bounded(self):
+        """Test that a bounded put_many() feeds values in as space frees up"""
+        queue = BlockingQueue(maxsize=3)
+        producer = threading.Thread(target=lambda: queue.put_many(range(20)))
+        producer.start()
+        results = []
+        while len(results) < 20:
+            results.extend(queue.get_many(20, timeout=5))
+            self.assertLessEqual(len(queue), 3)
+        producer.join(timeout=5)
+        self.assertEqual(results, list(range(20)))
+
+    def test_task_done_and_join(self):
+        """Test that join() waits for every value to be marked as done"""
+        queue = BlockingQueue()
+        queue.put_many(range(100))
+        processed = []
+
+        def worker():
+            while True:
+                try:
+                    value = queue.get(timeout=0.1)
+                except Empty:
+                    return
+                processed.append(value)
+                queue.task_done()
+
+        workers = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in workers:
+            thread.start()
+        queue.join()
+        self.assertEqual(sorted(processed), list(range(100)))
+        for thread in workers:
+            thread.join(timeout=5)
+        self.assertRaises(ValueError, queue.task_done)
+
+    def test_producers_and_consumers(self):
+        """Test that no values are lost or duplicated across many threads"""
+        queue = BlockingQueue(maxsize=8)
+        results = []
+        lock = threading.Lock()
+
+        def produce(start):
+            for value in range(start, start + 500):
+                queue.put(value)
+
+        def consume():
+            for _ in range(500):
+                value = queue.get(timeout=5)
+                with lock:
+                    results.append(value)
+
+        threads = [threading.Thread(target=produce, args=(i * 500,)) for i in range(4)]
+        threads += [threading.Thread(target=consume) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        self.assertEqual(sorted(results), list(range(2000)))
@@ -0,0 +1,49 @@
+"""Tests for d_ary_heap.py"""
+
+import random
+import unittest
+from data_structures.d_ary_heap import DAryHeap
+from data_structures.min_heap import MinHeap
+
+
+class DAryHeapTest(unittest.TestCase):
+    """d-ary heap tests"""
+
+    def assert_heap(self, heap):
+        """Assert that every parent is no bigger than its children"""
+        for idx in range(1, heap.length):
+            self.assertLessEqual(heap.keys[(idx - 1) // heap.arity], heap.keys[idx])
+
+    def test_arities(self):
+        """Test building, inserting into and draining heaps of several arities"""
+        rng = random.Random(0)
+        for arity in [2, 3, 4, 8]:
+            values = [rng.randrange(100) for _ in range(200)]
+            heap = DAryHeap(values[:150], arity)
+            self.assert_heap(heap)
+            for value in values[150:]:
+                heap.insert(value)
+            self.assert_heap(heap)
+            self.assertEqual(list(heap.iter_sorted()), sorted(values))
+            self.assertEqual(heap.nsmallest(5), sorted(values)[:5])
+            self.assertEqual(list(heap), sorted(values))
+
+    def test_key_and_reverse(self):
+        """Test ordering by a key, and largest first"""
+        heap = DAryHeap(["ccc", "a", "bb", "dddd"], arity=3, key=len, reverse=True)
+        self.assertEqual(heap.remove_min(), "dddd")
+        self.assertEqual(heap.replace("eeeee"), "ccc")
+        self.assertEqual(list(heap), ["eeeee", "bb", "a"])
+
+    def test_merge(self):
+        """Test merging in heaps of other arities"""
+        heap = DAryHeap(range(0, 100, 2), arity=4)
+        heap.merge(MinHeap(range(1, 100, 2)))
+        self.assert_heap(heap)
+        heap.merge(DAryHeap([-1, 200], arity=3))
+        self.assert_heap(heap)
+        self.assertEqual(list(heap), [-1] + list(range(100)) + [200])
+
+    def test_arity(self):
+        """Test that the arity must be at least 2"""
+        self.assertRaises(ValueError, lambda: DAryHeap(arity=1))
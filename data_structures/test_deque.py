@@ -0,0 +1,116 @@
+"""Tests for deque.py"""
+
+import os
+import random
+import tempfile
+import unittest
+from collections import deque
+from data_structures.deque import Deque
+
+
+class DequeTest(unittest.TestCase):
+    """Deque tests"""
+
+    def test_both_ends(self):
+        """Test adding and removing at both ends"""
+        values = Deque()
+        values.append(2)
+        values.appendleft(1)
+        values.append(3)
+        self.assertEqual(len(values), 3)
+        self.assertEqual(values.peekleft(), 1)
+        self.assertEqual(values.peek(), 3)
+        self.assertEqual(values.pop(), 3)
+        self.assertEqual(values.popleft(), 1)
+        self.assertEqual(values.pop(), 2)
+        self.assertRaises(IndexError, values.pop)
+        self.assertRaises(IndexError, values.popleft)
+        self.assertRaises(IndexError, values.peek)
+        self.assertRaises(IndexError, values.peekleft)
+
+    def test_extend(self):
+        """Test adding batches at both ends, wrapping around the buffer"""
+        values = Deque(range(5))
+        values.extendleft([-1, -2, -3, -4])
+        values.extend(range(5, 10))
+        values.extendleft([])
+        values.extend([])
+        self.assertEqual(len(values.buffer), 16)
+        self.assertEqual(list(values), list(range(-4, 10)))
+
+    def test_indexing(self):
+        """Test reading and writing by index"""
+        values = Deque(range(6))
+        values.appendleft(-1)
+        self.assertEqual(values[0], -1)
+        self.assertEqual(values[-1], 5)
+        values[3] = 30
+        values[-2] = 40
+        self.assertEqual(list(values), [-1, 0, 1, 30, 3, 40, 5])
+        self.assertRaises(IndexError, lambda: values[0])
+        self.assertRaises(IndexError, lambda: Deque([1])[-2])
+
+    def test_removed_slots_cleared(self):
+        """Test that removed values aren't kept alive by the buffer"""
+        values = Deque([1, 2, 3])
+        values.pop()
+        values.popleft()
+        self.assertEqual(values.buffer.count(None), len(values.buffer) - 1)
+
+    def test_shrink(self):
+        """Test that the buffer halves once it's mostly empty, if enabled"""
+        values = Deque(range(64), shrink=True)
+        for _ in range(60):
+            values.pop()
+        self.assertEqual(len(values.buffer), Deque.MIN_CAPACITY)
+        self.assertEqual(list(values), [0, 1, 2, 3])
+        values = Deque(range(64))
+        for _ in range(60):
+            values.popleft()
+        self.assertEqual(len(values.buffer), 64)
+
+    def test_random_operations(self):
+        """Test a random mix of operations against collections.deque"""
+        rng = random.Random(0)
+        values = Deque(shrink=True)
+        expected: deque = deque()
+        for step in range(3000):
+            operation = rng.randrange(6)
+            if operation == 0:
+                values.append(step)
+                expected.append(step)
+            elif operation == 1:
+                values.appendleft(step)
+                expected.appendleft(step)
+            elif operation == 2 and expected:
+                self.assertEqual(values.pop(), expected.pop())
+            elif operation == 3 and expected:
+                self.assertEqual(values.popleft(), expected.popleft())
+            elif operation == 4:
+                batch = range(step, step + rng.randrange(20))
+                values.extendleft(batch)
+                expected.extendleft(batch)
+            elif expected:
+                idx = rng.randrange(-len(expected), len(expected))
+                self.assertEqual(values[idx], expected[idx])
+            self.assertEqual(len(values), len(expected))
+        self.assertEqual(list(values), list(expected))
+
+    def test_save_and_load(self):
+        """Test saving a deque whose values wrap around, and loading it back"""
+        values = Deque([3, 4])
+        values.extendleft([2, 1])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "deque.snap")
+            values.save(path)
+            loaded = Deque.load(path)
+        self.assertFalse(loaded.shrink)
+        self.assertEqual(list(loaded), [1, 2, 3, 4])
+
+    def test_view(self):
+        """Test viewing a deque in place and draining it from the left"""
+        values = Deque([3, 4])
+        values.extendleft([2, 1])
+        self.assertEqual(list(values.view()), [1, 2, 3, 4])
+        self.assertEqual(list(values.view(drain=True).take(3)), [1, 2, 3])
+        self.assertEqual(list(values), [4])
@@ -0,0 +1,40 @@
+"""Tests for fenwick_tree.py"""
+
+import random
+import unittest
+from itertools import accumulate
+from data_structures.fenwick_tree import FenwickTree
+
+
+class FenwickTreeTest(unittest.TestCase):
+    """Fenwick tree tests"""
+
+    def test_prefix_sum_and_locate(self):
+        """Test prefix sums, and finding which count holds a total"""
+        tree = FenwickTree([3, 0, 2, 5])
+        self.assertEqual(len(tree), 4)
+        self.assertEqual([tree.prefix_sum(idx) for idx in range(5)], [0, 3, 3, 5, 10])
+        self.assertEqual(tree.locate(0), (0, 0))
+        self.assertEqual(tree.locate(2), (0, 2))
+        self.assertEqual(tree.locate(3), (2, 0))
+        self.assertEqual(tree.locate(9), (3, 4))
+        self.assertEqual(len(FenwickTree([])), 0)
+
+    def test_random_updates(self):
+        """Test a random run of updates against plain prefix sums"""
+        rng = random.Random(0)
+        counts = [rng.randrange(1, 10) for _ in range(100)]
+        tree = FenwickTree(counts)
+        for _ in range(500):
+            idx = rng.randrange(len(counts))
+            delta = rng.randint(-counts[idx] + 1, 5)
+            counts[idx] += delta
+            tree.add(idx, delta)
+
+            prefix_sums = list(accumulate(counts, initial=0))
+            probe = rng.randrange(len(counts) + 1)
+            self.assertEqual(tree.prefix_sum(probe), prefix_sums[probe])
+            total = rng.randrange(prefix_sums[-1])
+            found, remainder = tree.locate(total)
+            self.assertEqual(prefix_sums[found] + remainder, total)
+            self.assertLess(remainder, counts[found])
@@ -0,0 +1,128 @@
+"""Tests for instrumentation.py"""
+
+import unittest
+from data_structures.d_ary_heap import DAryHeap
+from data_structures.instrumentation import Histogram, Stats, instrumented
+from data_structures.linked_list import DoublyLinkedList, LinkedList
+from data_structures.min_heap import IndexedMinHeap, MinHeap
+from data_structures.queue import Queue
+from data_structures.stack import Stack
+
+
+class HistogramTest(unittest.TestCase):
+    """Histogram tests"""
+
+    def test_record(self):
+        """Test summarizing recorded values"""
+        histogram = Histogram()
+        for value in [0, 1, 2, 3, 5, 100]:
+            histogram.record(value)
+        self.assertEqual(histogram.count, 6)
+        self.assertEqual(histogram.max, 100)
+        self.assertAlmostEqual(histogram.mean(), 111 / 6)
+        self.assertEqual(histogram.percentile(0), 0)
+        self.assertEqual(histogram.percentile(50), 3)
+        self.assertEqual(histogram.percentile(99), 100)
+        self.assertEqual(histogram.as_dict()["p50"], 3)
+
+    def test_empty(self):
+        """Test that summarizing an empty histogram raises an error"""
+        histogram = Histogram()
+        self.assertRaises(ValueError, histogram.mean)
+        self.assertRaises(ValueError, lambda: histogram.percentile(50))
+        self.assertEqual(histogram.as_dict(), {"count": 0, "max": 0})
+
+
+class InstrumentedTest(unittest.TestCase):
+    """Instrumented structure tests"""
+
+    def test_original_classes_untouched(self):
+        """Test that instrumenting a class doesn't change the class itself"""
+        instrumented_class = instrumented(MinHeap)
+        self.assertIs(instrumented(MinHeap), instrumented_class)
+        self.assertTrue(issubclass(instrumented_class, MinHeap))
+        self.assertFalse(hasattr(MinHeap(), "stats"))
+        self.assertNotIn("_less", vars(MinHeap))
+
+    def test_heap(self):
+        """Test counting heap comparisons, moves and sift depths"""
+        heap = instrumented(MinHeap)(range(15, 0, -1))
+        heapify_comparisons = heap.stats.counts["comparisons"]
+        self.assertGreater(heapify_comparisons, 0)
+        heap.insert(0)
+        self.assertEqual(heap.stats.histograms["sift_up.depth"].max, 4)
+        self.assertEqual(heap.remove_min(), 0)
+        self.assertEqual(heap.stats.counts["calls.insert"], 1)
+        self.assertEqual(heap.stats.counts["calls.remove_min"], 1)
+        self.assertEqual(heap.stats.histograms["latency_ns.remove_min"].count, 1)
+        self.assertGreater(heap.stats.counts["moves"], 4)
+        self.assertEqual(list(heap), list(range(1, 16)))
+        self.assertEqual(heap.stats.counts["calls.__iter__"], 1)
+
+    def test_d_ary_heap(self):
+        """Test that sift depths are counted in levels of the heap's arity"""
+        heap = instrumented(DAryHeap)(range(1, 21), arity=4)
+        heap.insert(0)
+        self.assertEqual(heap.stats.histograms["sift_up.depth"].max, 2)
+
+    def test_indexed_heap(self):
+        """Test that instrumented subclasses keep their own behavior"""
+        heap = instrumented(IndexedMinHeap)()
+        heap.insert("a", 3)
+        heap.insert("b", 2)
+        heap.decrease_key("a", 1)
+        self.assertEqual(heap.peek(), "a")
+        self.assertEqual(heap.stats.counts["calls.decrease_key"], 1)
+        self.assertGreater(heap.stats.counts["comparisons"], 0)
+
+    def test_linked_list(self):
+        """Test recording how far linked list lookups walk"""
+        llst = instrumented(LinkedList)(range(100))
+        llst.get(50)
+        llst.get(60)
+        llst.get(99)
+        walks = llst.stats.histograms["walk.length"]
+        self.assertEqual(walks.count, 3)
+        self.assertEqual(walks.max, 50)
+        self.assertEqual(walks.total, 60)
+        self.assertEqual(llst[10], 10)
+        self.assertEqual(llst.stats.counts["calls.__getitem__"], 1)
+
+        dllst = instrumented(DoublyLinkedList)(range(100))
+        dllst.get(90)
+        self.assertEqual(dllst.stats.histograms["walk.length"].max, 9)
+
+    def test_queue_and_stack(self):
+        """Test recording call counts and latencies"""
+        queue = instrumented(Queue)([1, 2, 3])
+        queue.dequeue()
+        queue.dequeue()
+        self.assertEqual(queue.stats.counts["calls.dequeue"], 2)
+        self.assertEqual(queue.stats.counts["calls.extend"], 1)
+        latencies = queue.stats.histograms["latency_ns.dequeue"]
+        self.assertGreaterEqual(latencies.percentile(99), 0)
+        self.assertRaises(IndexError, instrumented(Stack)().pop)
+
+    def test_stats(self):
+        """Test summarizing and resetting statistics"""
+        stats = Stats()
+        stats.count("calls")
+        stats.observe("depth", 3)
+        self.assertEqual(
+            stats.as_dict(),
+            {
+                "counts": {"calls": 1},
+                "histograms": {
+                    "depth": {
+                        "count": 1,
+                        "max": 3,
+                        "mean": 3,
+                        "p50": 3,
+                        "p90": 3,
+                        "p99": 3,
+                    }
+                },
+            },
+        )
+        stats.reset()
+        self.assertEqual(stats.as_dict(), {"counts": {}, "histograms": {}})
@@ -0,0 +1,61 @@
+"""Tests for k_way_merge.py"""
+
+import heapq
+import random
+import unittest
+from data_structures.k_way_merge import merge
+
+
+class MergeTest(unittest.TestCase):
+    """K-way merge tests"""
+
+    def test_merge(self):
+        """Test merging sorted iterables of different lengths"""
+        self.assertEqual(
+            list(merge([1, 4, 7], iter([2, 5]), (), [0, 3, 6, 8, 9])), list(range(10))
+        )
+        self.assertEqual(list(merge()), [])
+        self.assertEqual(list(merge([], [])), [])
+        self.assertEqual(list(merge([3, 1, 2])), [3, 1, 2])
+
+    def test_key_and_reverse(self):
+        """Test merging by a key, and merging descending iterables"""
+        words = list(merge(["a", "ccc"], ["bb", "dddd"], ["eee"], key=len))
+        self.assertEqual(words, ["a", "bb", "ccc", "eee", "dddd"])
+        self.assertEqual(list(merge([5, 3, 1], [4, 2], reverse=True)), [5, 4, 3, 2, 1])
+
+    def test_stable(self):
+        """Test that equal values come out in the order of their iterables"""
+        first = [(1, "a"), (2, "a")]
+        second = [(1, "b"), (2, "b")]
+        pairs = list(merge(first, second, key=lambda pair: pair[0]))
+        self.assertEqual(pairs, [(1, "a"), (1, "b"), (2, "a"), (2, "b")])
+        pairs = list(
+            merge(first[::-1], second[::-1], key=lambda pair: pair[0], reverse=True)
+        )
+        self.assertEqual(pairs, [(2, "a"), (2, "b"), (1, "a"), (1, "b")])
+
+    def test_lazy(self):
+        """Test that values are only read from each iterable as they are needed"""
+        consumed = []
+
+        def source(name, values):
+            for value in values:
+                consumed.append((name, value))
+                yield value
+
+        merged = merge(source("a", [1, 3, 5]), source("b", [2, 4, 6]))
+        self.assertEqual(consumed, [])
+        self.assertEqual(next(merged), 1)
+        self.assertEqual(consumed, [("a", 1), ("b", 2)])
+        self.assertEqual(next(merged), 2)
+        self.assertEqual(consumed, [("a", 1), ("b", 2), ("a", 3)])
+
+    def test_matches_heapq(self):
+        """Test merging many random iterables against heapq.merge()"""
+        rng = random.Random(0)
+        iterables = [
+            sorted(rng.randrange(100) for _ in range(rng.randrange(20)))
+            for _ in range(50)
+        ]
+        self.assertEqual(list(merge(*iterables)), list(heapq.merge(*iterables)))
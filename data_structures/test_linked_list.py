@@ -1,17 +1,27 @@
 """Tests for linked_list.py"""
 
+import os
+import pickle
+import random
+import tempfile
 import unittest
-from data_structures.linked_list import LinkedList
+from data_structures.linked_list import (
+    DoublyLinkedList,
+    DoublyLinkedListNode,
+    LinkedList,
+    LinkedListNode,
+)
 
 
 class LinkedListTest(unittest.TestCase):
     """Tests for linked lists"""
 
+    list_class: type[LinkedList] = LinkedList
     test_sequence: list[int] = [1, 2, 4, 8, 16]
 
     def test_append(self):
         """Test appending to the linked list"""
-        llst = LinkedList()
+        llst = self.list_class()
         llst.append(1)
         llst.append(2)
         llst.append(4)
@@ -21,13 +31,13 @@ class LinkedListTest(unittest.TestCase):
 
     def test_from_iterable(self):
         """Test creating a linked list from an iterable"""
-        llst = LinkedList(self.test_sequence)
+        llst = self.list_class(self.test_sequence)
         self.assertEqual(list(llst), self.test_sequence)
         self.assertEqual(len(llst), len(self.test_sequence))
 
     def test_from_iterable_empty(self):
         """Test creating a linked list from an empty iterable"""
-        llst = LinkedList([])
+        llst = self.list_class([])
         self.assertEqual(list(llst), [])
         self.assertEqual(len(llst), 0)
         llst.append(1)
@@ -36,7 +46,7 @@ class LinkedListTest(unittest.TestCase):
 
     def test_from_iterable_single(self):
         """Test creating a linked list from an iterable with a single element"""
-        llst = LinkedList([1])
+        llst = self.list_class([1])
         self.assertEqual(list(llst), [1])
         self.assertEqual(len(llst), 1)
         llst.append(2)
@@ -45,7 +55,7 @@ class LinkedListTest(unittest.TestCase):
 
     def test_extend(self):
         """Test extending a linked list from an iterable"""
-        llst = LinkedList()
+        llst = self.list_class()
         llst.extend(self.test_sequence)
         self.assertEqual(list(llst), self.test_sequence)
         self.assertEqual(len(llst), len(self.test_sequence))
@@ -55,7 +65,7 @@ class LinkedListTest(unittest.TestCase):
 
     def test_extend_empty(self):
         """Test extending a linked list from an empty iterable"""
-        llst = LinkedList()
+        llst = self.list_class()
         llst.extend([])
         llst.extend([])
         llst.extend([])
@@ -67,7 +77,7 @@ class LinkedListTest(unittest.TestCase):
 
     def test_prepend(self):
         """Test prepending to a linked list"""
-        llst = LinkedList()
+        llst = self.list_class()
         llst.prepend(1)
         llst.prepend(2)
         llst.prepend(4)
@@ -77,13 +87,13 @@ class LinkedListTest(unittest.TestCase):
 
     def test_get(self):
         """Test retrieving a specific element from a linked list"""
-        llst = LinkedList(self.test_sequence)
+        llst = self.list_class(self.test_sequence)
         self.assertEqual(llst[2], 4)
         self.assertEqual(len(llst), len(self.test_sequence))
 
     def test_set(self):
         """Test setting a specific element from a linked list"""
-        llst = LinkedList(self.test_sequence)
+        llst = self.list_class(self.test_sequence)
         test_sequence = list(self.test_sequence)
         test_sequence[2] = 100
         llst[2] = 100
@@ -92,12 +102,12 @@ class LinkedListTest(unittest.TestCase):
 
     def test_len(self):
         """Test getting the length of a linked list"""
-        llst = LinkedList(self.test_sequence)
+        llst = self.list_class(self.test_sequence)
         self.assertEqual(len(llst), len(self.test_sequence))
 
     def test_remove(self):
         """Test removing an element from a linked list"""
-        llst = LinkedList(self.test_sequence)
+        llst = self.list_class(self.test_sequence)
         test_sequence = list(self.test_sequence)
         removed = llst.remove(2)
         self.assertEqual(removed, test_sequence[2])
@@ -107,7 +117,7 @@ class LinkedListTest(unittest.TestCase):
 
     def test_remove_from_head(self):
         """Test removing an element from the head of a linked list"""
-        llst = LinkedList(self.test_sequence)
+        llst = self.list_class(self.test_sequence)
         removed = llst.remove(0)
         test_sequence = list(self.test_sequence)
         self.assertEqual(removed, test_sequence[0])
@@ -117,7 +127,7 @@ class LinkedListTest(unittest.TestCase):
 
     def test_remove_from_tail(self):
         """Test removing an element from the tail of a linked list"""
-        llst = LinkedList(self.test_sequence)
+        llst = self.list_class(self.test_sequence)
         tail_idx = len(llst) - 1
         removed = llst.remove(tail_idx)
         test_sequence = list(self.test_sequence)
@@ -128,7 +138,7 @@ class LinkedListTest(unittest.TestCase):
 
     def test_insert(self):
         """Test inserting an element into a specific index in a linked list"""
-        llst = LinkedList(self.test_sequence)
+        llst = self.list_class(self.test_sequence)
         test_sequence = list(self.test_sequence)
         llst.insert(3, 100)
         test_sequence.insert(3, 100)
@@ -137,7 +147,7 @@ class LinkedListTest(unittest.TestCase):
 
     def test_insert_at_head(self):
         """Test inserting an element at the head of a linked list"""
-        llst = LinkedList(self.test_sequence)
+        llst = self.list_class(self.test_sequence)
         test_sequence = list(self.test_sequence)
         llst.insert(0, 100)
         test_sequence.insert(0, 100)
@@ -146,7 +156,7 @@ class LinkedListTest(unittest.TestCase):
 
     def test_insert_at_tail(self):
         """Test inserting an element at the tail of a linked list"""
-        llst = LinkedList(self.test_sequence)
+        llst = self.list_class(self.test_sequence)
         tail_idx = len(llst)
         test_sequence = list(self.test_sequence)
         llst.insert(tail_idx, 100)
@@ -156,7 +166,7 @@ class LinkedListTest(unittest.TestCase):
 
     def test_bounds_checks(self):
         """Test that errors are raised when attempting to do thing out-of-bounds"""
-        llst = LinkedList(self.test_sequence)
+        llst = self.list_class(self.test_sequence)
         self.assertRaises(IndexError, lambda ll_: ll_.remove(-1), llst)
         self.assertRaises(IndexError, lambda ll_: ll_.remove(len(ll_) + 1), llst)
         self.assertRaises(IndexError, lambda ll_: ll_.get(-1), llst)
@@ -168,6 +178,280 @@ class LinkedListTest(unittest.TestCase):
 
     def test_iter(self):
         """Test the linked list iterator"""
-        llst = LinkedList(self.test_sequence)
+        llst = self.list_class(self.test_sequence)
         self.assertEqual(list(iter(llst)), self.test_sequence)
         self.assertEqual(len(llst), len(self.test_sequence))
+
+    def test_remove_only_element(self):
+        """Test that removing the only element leaves the linked list reusable"""
+        llst = self.list_class([1])
+        llst.remove(0)
+        self.assertIsNone(llst.tail)
+        llst.append(2)
+        self.assertEqual(list(llst), [2])
+
+    def test_get_slice(self):
+        """Test reading slices of a linked list"""
+        test_sequence = list(range(10))
+        llst = self.list_class(test_sequence)
+        for idx in [
+            slice(2, 5),
+            slice(None),
+            slice(None, None, 3),
+            slice(8, 1, -2),
+            slice(None, None, -1),
+            slice(5, 2),
+            slice(-3, None),
+        ]:
+            sliced = llst[idx]
+            self.assertIsInstance(sliced, LinkedList)
+            self.assertEqual(list(sliced), test_sequence[idx])
+            self.assertEqual(len(sliced), len(test_sequence[idx]))
+        self.assertEqual(list(llst), test_sequence)
+
+    def test_set_slice(self):
+        """Test assigning to slices of a linked list"""
+        for idx, values in [
+            (slice(2, 5), [100, 101]),
+            (slice(0, 0), [100, 101]),
+            (slice(None), []),
+            (slice(7, None), [100, 101, 102, 103]),
+            (slice(None, None, 3), [100, 101, 102, 103]),
+            (slice(8, 1, -2), [100, 101, 102, 103]),
+        ]:
+            test_sequence = list(range(10))
+            llst = self.list_class(test_sequence)
+            llst[idx] = values
+            test_sequence[idx] = values
+            self.assertEqual(list(llst), test_sequence)
+            self.assertEqual(len(llst), len(test_sequence))
+            llst.append(-1)
+            self.assertEqual(llst[len(llst) - 1], -1)
+
+        llst = self.list_class(range(10))
+        self.assertRaises(ValueError, llst.__setitem__, slice(None, None, 2), [1])
+
+    def test_set_slice_from_itself(self):
+        """Test that a slice assignment reads all of the values before changing any"""
+        llst = self.list_class([1, 2, 3, 4])
+        llst[1:3] = llst
+        self.assertEqual(list(llst), [1, 1, 2, 3, 4, 4])
+        self.assertEqual(len(llst), 6)
+
+        def failing():
+            yield 100
+            raise RuntimeError
+
+        llst = self.list_class([1, 2, 3, 4])
+        self.assertRaises(RuntimeError, llst.__setitem__, slice(1, 3), failing())
+        self.assertEqual(list(llst), [1, 2, 3, 4])
+
+    def test_del_slice(self):
+        """Test deleting slices of a linked list"""
+        for idx in [
+            slice(2, 5),
+            slice(None),
+            slice(5, None),
+            slice(None, 3),
+            slice(None, None, 3),
+            slice(9, 0, -4),
+            slice(1, None, 2),
+            slice(5, 2),
+        ]:
+            test_sequence = list(range(10))
+            llst = self.list_class(test_sequence)
+            del llst[idx]
+            del test_sequence[idx]
+            self.assertEqual(list(llst), test_sequence)
+            self.assertEqual(len(llst), len(test_sequence))
+            llst.append(-1)
+            self.assertEqual(list(llst), test_sequence + [-1])
+
+        llst = self.list_class([1, 2])
+        del llst[0]
+        self.assertEqual(list(llst), [2])
+
+    def test_splice(self):
+        """Test moving the nodes of one linked list into another"""
+        for idx in [0, 2, 5]:
+            llst = self.list_class(self.test_sequence)
+            other = self.list_class([100, 101])
+            llst.splice(idx, other)
+            test_sequence = list(self.test_sequence)
+            test_sequence[idx:idx] = [100, 101]
+            self.assertEqual(list(llst), test_sequence)
+            self.assertEqual(len(llst), len(test_sequence))
+            self.assertEqual(list(other), [])
+            self.assertEqual(len(other), 0)
+            llst.append(-1)
+            self.assertEqual(list(llst), test_sequence + [-1])
+
+        llst = self.list_class()
+        llst.splice(0, self.list_class([1]))
+        llst.splice(1, self.list_class())
+        self.assertEqual(list(llst), [1])
+        self.assertRaises(IndexError, lambda: llst.splice(2, self.list_class([1])))
+        self.assertRaises(ValueError, lambda: llst.splice(0, llst))
+
+    def test_concat(self):
+        """Test moving the nodes of one linked list onto the end of another"""
+        llst = self.list_class([1, 2])
+        other = self.list_class([3, 4])
+        llst.concat(other)
+        self.assertEqual(list(llst), [1, 2, 3, 4])
+        self.assertEqual(len(other), 0)
+        other.concat(llst)
+        self.assertEqual(list(other), [1, 2, 3, 4])
+        self.assertEqual(list(llst), [])
+
+    def test_split_at(self):
+        """Test splitting a linked list in two"""
+        for idx in range(len(self.test_sequence) + 1):
+            llst = self.list_class(self.test_sequence)
+            rest = llst.split_at(idx)
+            self.assertEqual(list(llst), self.test_sequence[:idx])
+            self.assertEqual(list(rest), self.test_sequence[idx:])
+            self.assertEqual(len(llst), idx)
+            self.assertEqual(len(rest), len(self.test_sequence) - idx)
+            llst.append(-1)
+            rest.append(-2)
+            self.assertEqual(list(llst), self.test_sequence[:idx] + [-1])
+            self.assertEqual(list(rest), self.test_sequence[idx:] + [-2])
+        self.assertRaises(IndexError, lambda: self.list_class([1]).split_at(2))
+
+    def test_nodes_have_no_dict(self):
+        """Test that nodes use slots rather than a per-instance __dict__"""
+        for node in [LinkedListNode(1), DoublyLinkedListNode(1)]:
+            self.assertFalse(hasattr(node, "__dict__"))
+            self.assertRaises(AttributeError, setattr, node, "other", 1)
+
+    def test_cursor(self):
+        """Test that sequential indexed access walks from the cached cursor"""
+        llst = LinkedList(range(100))
+        self.assertEqual([llst[idx] for idx in range(100)], list(range(100)))
+        self.assertEqual(llst._cursor[0], 98)  # pylint: disable=protected-access
+        llst.insert(50, -1)
+        self.assertEqual(llst._cursor[0], 49)  # pylint: disable=protected-access
+        self.assertEqual(llst[60], 59)
+        llst.remove(55)
+        self.assertEqual(llst._cursor[0], 54)  # pylint: disable=protected-access
+        self.assertEqual(llst[60], 60)
+        self.assertEqual(llst[0], 0)
+
+    def test_random_operations(self):
+        """Test a random mix of operations against a plain list"""
+        rng = random.Random(0)
+        llst = self.list_class()
+        expected = []
+        for step in range(2000):
+            operation = rng.randrange(5)
+            if operation == 0 or not expected:
+                idx = rng.randint(0, len(expected))
+                llst.insert(idx, step)
+                expected.insert(idx, step)
+            elif operation == 1:
+                idx = rng.randrange(len(expected))
+                self.assertEqual(llst.remove(idx), expected.pop(idx))
+            elif operation == 2:
+                idx = rng.randrange(len(expected))
+                self.assertEqual(llst[idx], expected[idx])
+                llst[idx] = step
+                expected[idx] = step
+            elif operation == 3:
+                start = rng.randint(0, len(expected))
+                stop = rng.randint(start, len(expected))
+                step_size = rng.choice([1, 2, -1, -3])
+                if step_size < 0:
+                    start, stop = stop, start
+                del llst[start:stop:step_size]
+                del expected[start:stop:step_size]
+            else:
+                llst.append(step)
+                expected.append(step)
+            self.assertEqual(len(llst), len(expected))
+        self.assertEqual(list(llst), expected)
+
+    def test_save_and_load(self):
+        """Test saving a linked list to a snapshot and loading it back"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "list.snap")
+            self.list_class(self.test_sequence).save(path)
+            llst = self.list_class.load(path)
+            self.assertIsInstance(llst, self.list_class)
+            self.assertEqual(list(llst), self.test_sequence)
+            self.list_class().save(path)
+            self.assertEqual(len(self.list_class.load(path)), 0)
+
+    def test_pickle_long_chain(self):
+        """Test that pickling a long linked list doesn't recurse through its nodes"""
+        llst = self.list_class(range(100_000))
+        copy = pickle.loads(pickle.dumps(llst))
+        self.assertIsInstance(copy, self.list_class)
+        self.assertEqual(list(copy), list(range(100_000)))
+        self.assertEqual(copy[99_999], 99_999)
+
+    def test_view(self):
+        """Test viewing the nodes in place and draining from the head"""
+        llst = self.list_class(self.test_sequence)
+        self.assertEqual(list(llst.view().chunked(2)), [[1, 2], [4, 8], [16]])
+        self.assertEqual(len(llst), 5)
+        self.assertEqual(list(llst.view(drain=True).take(2)), [1, 2])
+        self.assertEqual(list(llst), [4, 8, 16])
+        self.assertEqual(list(llst.view(drain=True)), [4, 8, 16])
+        self.assertEqual(len(llst), 0)
+
+
+class DoublyLinkedListTest(LinkedListTest):
+    """Tests for doubly linked lists, which must also pass all linked list tests"""
+
+    list_class: type[LinkedList] = DoublyLinkedList
+
+    def assert_links(self, dllst):
+        """Assert that the prev links mirror the next links"""
+        self.assertEqual(list(reversed(dllst)), list(dllst)[::-1])
+        if dllst.head is not None:
+            self.assertIsNone(dllst.head.prev)
+            self.assertIsNone(dllst.tail.next)
+
+    def test_pop_and_popleft(self):
+        """Test removing from both ends"""
+        dllst = DoublyLinkedList(self.test_sequence)
+        self.assertEqual(dllst.pop(), 16)
+        self.assertEqual(dllst.popleft(), 1)
+        self.assert_links(dllst)
+        self.assertEqual(list(dllst), [2, 4, 8])
+        dllst.pop()
+        dllst.pop()
+        dllst.popleft()
+        self.assertRaises(IndexError, dllst.pop)
+        self.assertRaises(IndexError, dllst.popleft)
+        dllst.append(1)
+        self.assertEqual(list(dllst), [1])
+
+    def test_links(self):
+        """Test that the prev links stay correct through structural changes"""
+        dllst = DoublyLinkedList(range(20))
+        dllst.insert(5, -1)
+        dllst.prepend(-2)
+        dllst.remove(10)
+        del dllst[3:8]
+        del dllst[::3]
+        dllst[2:4] = [100, 101, 102]
+        dllst.splice(4, DoublyLinkedList([200, 201]))
+        self.assert_links(dllst)
+        rest = dllst.split_at(6)
+        self.assert_links(dllst)
+        self.assert_links(rest)
+
+    def test_walks_from_tail(self):
+        """Test that indexes near the end are reached from the tail"""
+        dllst = DoublyLinkedList(range(100))
+        self.assertEqual(dllst[97], 97)
+        self.assertEqual(dllst._cursor[0], 97)  # pylint: disable=protected-access
+        self.assertEqual(dllst[95], 95)
+        self.assertEqual(dllst[2], 2)
+
+    def test_splice_singly_linked(self):
+        """Test that a singly linked list can't be spliced into a doubly linked one"""
+        dllst = DoublyLinkedList([1])
+        self.assertRaises(TypeError, lambda: dllst.splice(0, LinkedList([2])))
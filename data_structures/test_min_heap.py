@@ -1,7 +1,11 @@
 """Tests for min_heap.py"""
 
+import os
+import random
+import tempfile
 import unittest
-from data_structures.min_heap import MinHeap
+import weakref
+from data_structures.min_heap import BoundedMinHeap, IndexedMinHeap, MaxHeap, MinHeap
 
 
 class MinHeapTest(unittest.TestCase):
@@ -61,3 +65,381 @@ class MinHeapTest(unittest.TestCase):
         heap.remove_min()
         self.assertRaises(IndexError, lambda h: h.peek(), heap)
         self.assertRaises(IndexError, lambda h: h.remove_min(), heap)
+
+    def test_from_iterable(self):
+        """Test creating a min-heap from an iterable"""
+        test_sequence = [5, 3, 8, 1, 9, 2, 7, 4, 6, 0]
+        heap = MinHeap(test_sequence)
+        self.assertEqual(len(heap), len(test_sequence))
+        self.assertEqual(list(heap), sorted(test_sequence))
+
+    def test_from_iterable_empty(self):
+        """Test creating a min-heap from an empty iterable"""
+        heap = MinHeap([])
+        self.assertEqual(len(heap), 0)
+        heap.insert(1)
+        self.assertEqual(list(heap), [1])
+
+    def test_insert_many(self):
+        """Test inserting batches both smaller and larger than the heap"""
+        heap = MinHeap(range(20, 0, -1))
+        heap.insert_many([15, 0])
+        self.assertEqual(len(heap), 22)
+        heap.insert_many(range(100, 30, -1))
+        self.assertEqual(len(heap), 92)
+        expected = sorted(list(range(1, 21)) + [15, 0] + list(range(31, 101)))
+        self.assertEqual(list(heap), expected)
+
+    def test_insert_many_reuses_removed_space(self):
+        """Test that a rebuild after removals doesn't resurrect removed values"""
+        heap = MinHeap([4, 2, 6])
+        heap.remove_min()
+        heap.remove_min()
+        heap.insert_many([5, 1, 3])
+        self.assertEqual(list(heap), [1, 3, 5, 6])
+
+    def test_key(self):
+        """Test ordering values by a key function"""
+        records = [("c", 3), ("a", 1), ("d", 4), ("b", 2)]
+        heap = MinHeap(records, key=lambda record: record[1])
+        self.assertEqual(heap.peek_key(), 1)
+        heap.insert(("z", 0))
+        self.assertEqual(heap.peek(), ("z", 0))
+        self.assertEqual([name for name, _ in heap], ["z", "a", "b", "c", "d"])
+
+    def test_key_computed_once(self):
+        """Test that the key function is called exactly once per value"""
+        calls = []
+
+        def key(value):
+            calls.append(value)
+            return value
+
+        heap = MinHeap(range(50, 0, -1), key=key)
+        heap.insert(0)
+        heap.insert_many([100, 101])
+        self.assertEqual(list(heap), list(range(0, 51)) + [100, 101])
+        self.assertEqual(len(calls), 53)
+
+    def test_reverse(self):
+        """Test that a reversed min-heap returns the largest values first"""
+        heap = MinHeap([3, 1, 4, 1, 5, 9, 2, 6], reverse=True)
+        heap.insert(7)
+        self.assertEqual(heap.peek(), 9)
+        self.assertEqual(list(heap), [9, 7, 6, 5, 4, 3, 2, 1, 1])
+
+    def test_max_heap(self):
+        """Test the max-heap variant"""
+        heap = MaxHeap([("a", 1), ("b", 3)], key=lambda record: record[1])
+        heap.insert(("c", 2))
+        self.assertEqual(heap.remove_max(), ("b", 3))
+        self.assertEqual(heap.remove_max(), ("c", 2))
+        self.assertEqual(heap.remove_max(), ("a", 1))
+        self.assertRaises(IndexError, lambda h: h.remove_max(), heap)
+        self.assertRaises(IndexError, lambda h: h.peek_key(), heap)
+
+    def test_removed_values_released(self):
+        """Test that removed values aren't kept alive by the table"""
+
+        class Payload:
+            """Weak-referenceable comparable value"""
+
+            def __init__(self, value):
+                self.value = value
+
+            def __lt__(self, other):
+                return self.value < other.value
+
+        payloads = [Payload(value) for value in range(8)]
+        refs = [weakref.ref(payload) for payload in payloads]
+        heap = MinHeap(payloads)
+        del payloads
+        heap.remove_min()
+        heap.remove_min()
+        self.assertIsNone(refs[0]())
+        self.assertIsNone(refs[1]())
+        self.assertIsNotNone(refs[2]())
+
+    def test_shrink(self):
+        """Test that the table shrinks once the heap drains below the threshold"""
+        heap = MinHeap(range(1000))
+        for _ in range(900):
+            heap.remove_min()
+        self.assertLessEqual(len(heap.table), 4 * len(heap))
+        self.assertEqual(len(heap.table), len(heap.keys))
+        heap.insert_many(range(2000, 999, -1))
+        self.assertEqual(list(heap), list(range(900, 2001)))
+        self.assertEqual(heap.table, [])
+
+    def test_shrink_disabled(self):
+        """Test that a zero shrink threshold keeps the table at its peak size"""
+        heap = MinHeap(range(100))
+        heap.shrink_threshold = 0
+        for _ in range(100):
+            heap.remove_min()
+        self.assertEqual(len(heap.table), 100)
+        self.assertEqual(heap.table, [None] * 100)
+
+    def test_iter_sorted(self):
+        """Test that sorted iteration leaves the heap untouched"""
+        test_sequence = [5, 3, 8, 1, 9, 2, 7, 4, 6, 0, 3]
+        heap = MinHeap(test_sequence)
+        table = list(heap.table)
+        self.assertEqual(list(heap.iter_sorted()), sorted(test_sequence))
+        self.assertEqual(heap.table, table)
+        self.assertEqual(len(heap), len(test_sequence))
+        self.assertEqual(list(MinHeap().iter_sorted()), [])
+
+    def test_nsmallest(self):
+        """Test reading the first k values without removing them"""
+        heap = MinHeap(range(100, 0, -1))
+        self.assertEqual(heap.nsmallest(3), [1, 2, 3])
+        self.assertEqual(heap.nsmallest(0), [])
+        self.assertEqual(len(heap.nsmallest(1000)), 100)
+        self.assertEqual(len(heap), 100)
+        self.assertEqual(MaxHeap(range(10)).nsmallest(2), [9, 8])
+
+
+    def test_replace(self):
+        """Test replacing the minimum value in a single step"""
+        heap = MinHeap([3, 1, 2])
+        self.assertEqual(heap.replace(5), 1)
+        self.assertEqual(heap.replace(0), 2)
+        self.assertEqual(list(heap), [0, 3, 5])
+        self.assertRaises(IndexError, lambda h: h.replace(1), heap)
+        heap = MinHeap(["bb", "a"], key=len)
+        self.assertEqual(heap.replace("ccc"), "a")
+        self.assertEqual(heap.peek_key(), 2)
+
+    def test_pushpop(self):
+        """Test inserting a value and removing the minimum in a single step"""
+        heap = MinHeap([3, 1, 2])
+        self.assertEqual(heap.pushpop(0), 0)
+        self.assertEqual(heap.pushpop(5), 1)
+        self.assertEqual(list(heap), [2, 3, 5])
+        self.assertEqual(heap.pushpop(4), 4)
+        self.assertEqual(MaxHeap([1, 3]).pushpop(2), 3)
+
+    def test_merge(self):
+        """Test merging in smaller and larger heaps, which are left unchanged"""
+        heap = MinHeap([5, 1, 9, 3])
+        small = MinHeap([4])
+        heap.merge(small)
+        self.assertEqual(len(small), 1)
+        heap.merge(MinHeap(range(10, 20)))
+        heap.merge(MinHeap())
+        self.assertEqual(list(heap), [1, 3, 4, 5, 9] + list(range(10, 20)))
+        self.assertRaises(ValueError, lambda h: h.merge(MaxHeap()), heap)
+
+        heap = MinHeap(["aaa", "b"], key=len)
+        heap.merge(MinHeap(["cc"], key=len))
+        self.assertEqual(list(heap), ["b", "cc", "aaa"])
+
+    def test_save_and_load(self):
+        """Test saving heaps to snapshots and loading them back"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "heap.snap")
+            values = random.Random(0).sample(range(1000), 100)
+            heap = MinHeap(values)
+            for _ in range(50):
+                heap.remove_min()
+            heap.save(path)
+            loaded = MinHeap.load(path)
+            self.assertEqual(loaded.table, heap.table[: heap.length])
+            self.assertEqual(list(loaded), sorted(values)[50:])
+
+            # The cached keys are restored rather than recomputed
+            calls = []
+            heap = MaxHeap(["aaa", "b", "cc"], key=len)
+            heap.save(path)
+            loaded = MaxHeap.load(
+                path, key=lambda value: calls.append(value) or len(value)
+            )
+            self.assertEqual(loaded.peek_key(), 3)
+            self.assertEqual(calls, [])
+            loaded.insert("dddd")
+            self.assertEqual(list(loaded), ["dddd", "aaa", "cc", "b"])
+            self.assertRaises(ValueError, lambda: MinHeap.load(path))
+
+            heap = IndexedMinHeap(["a", "b"])
+            heap.update("b", " ")
+            heap.save(path)
+            loaded = IndexedMinHeap.load(path)
+            self.assertEqual(loaded.priority("a"), "a")
+            loaded.remove("a")
+            self.assertEqual(list(loaded), ["b"])
+
+            # Explicit priorities are saved even without a key function
+            heap = IndexedMinHeap()
+            for value, priority in [("a", 2), ("b", 1), ("c", 3)]:
+                heap.insert(value, priority)
+            heap.save(path)
+            loaded = IndexedMinHeap.load(path)
+            self.assertEqual(loaded.priority("a"), 2)
+            loaded.insert("aa", 0)
+            self.assertEqual(list(loaded), ["aa", "b", "a", "c"])
+
+
+class BoundedMinHeapTest(unittest.TestCase):
+    """Bounded min-heap tests"""
+
+    def test_offer(self):
+        """Test that only the largest values are kept"""
+        heap = BoundedMinHeap(capacity=3)
+        self.assertTrue(heap.offer(5))
+        self.assertTrue(heap.offer(1))
+        self.assertTrue(heap.offer(3))
+        self.assertFalse(heap.offer(0))
+        self.assertFalse(heap.offer(1))
+        self.assertTrue(heap.offer(4))
+        self.assertEqual(len(heap), 3)
+        self.assertEqual(heap.peek(), 3)
+        self.assertEqual(heap.result(), [5, 4, 3])
+        self.assertEqual(len(heap), 3)
+
+    def test_offer_many(self):
+        """Test offering a stream of values"""
+        values = list(range(1000))
+        random.Random(0).shuffle(values)
+        heap = BoundedMinHeap(values[:5], capacity=10)
+        heap.offer_many(iter(values[5:]))
+        self.assertEqual(heap.result(), list(range(999, 989, -1)))
+        heap.insert_many([2000, 0])
+        heap.insert(1500)
+        self.assertEqual(heap.result()[:3], [2000, 1500, 999])
+        heap.merge(MinHeap([1200, 5]))
+        self.assertEqual(heap.result()[:4], [2000, 1500, 1200, 999])
+        self.assertEqual(len(heap), 10)
+
+    def test_key_and_reverse(self):
+        """Test keeping the smallest values, or the best values by a key"""
+        smallest = BoundedMinHeap(range(10), capacity=3, reverse=True)
+        self.assertEqual(smallest.result(), [0, 1, 2])
+        words = ["a", "bbbb", "cc", "ddd", "e"]
+        longest = BoundedMinHeap(words, capacity=2, key=len)
+        self.assertEqual(longest.result(), ["bbbb", "ddd"])
+
+    def test_capacity(self):
+        """Test that the capacity must be given by name, and be positive"""
+        self.assertRaises(ValueError, lambda: BoundedMinHeap(capacity=0))
+        self.assertRaises(TypeError, BoundedMinHeap)
+        self.assertRaises(TypeError, lambda: BoundedMinHeap([1, 2], 1))
+
+
+class IndexedMinHeapTest(unittest.TestCase):
+    """Indexed min-heap tests"""
+
+    def assert_positions(self, heap):
+        """Assert that every tracked position points at its value"""
+        self.assertEqual(len(heap.positions), len(heap))
+        for value, idx in heap.positions.items():
+            self.assertIs(heap.table[idx], value)
+
+    def test_insert_and_remove_min(self):
+        """Test that the positions are kept up to date while inserting and removing"""
+        heap = IndexedMinHeap()
+        for value in [5, 3, 8, 1, 9, 2]:
+            heap.insert(value)
+            self.assert_positions(heap)
+        self.assertEqual(heap.remove_min(), 1)
+        self.assert_positions(heap)
+        self.assertEqual(list(heap), [2, 3, 5, 8, 9])
+        self.assertEqual(heap.positions, {})
+        self.assertEqual(heap.table, [])
+
+    def test_from_iterable(self):
+        """Test creating an indexed min-heap from an iterable"""
+        heap = IndexedMinHeap(range(20, 0, -1))
+        self.assert_positions(heap)
+        heap.insert_many([0, -1])
+        self.assert_positions(heap)
+        self.assertEqual(list(heap), list(range(-1, 21)))
+
+    def test_duplicates(self):
+        """Test that inserting a value twice raises an error"""
+        heap = IndexedMinHeap([1, 2])
+        self.assertRaises(ValueError, lambda h: h.insert(1), heap)
+        self.assertRaises(ValueError, lambda h: h.insert_many([3, 3]), heap)
+        self.assertRaises(ValueError, lambda h: h.insert_many([2]), heap)
+
+    def test_contains(self):
+        """Test membership checks"""
+        heap = IndexedMinHeap(["a", "b"])
+        self.assertIn("a", heap)
+        heap.remove_min()
+        self.assertNotIn("a", heap)
+        self.assertIn("b", heap)
+
+    def test_decrease_key(self):
+        """Test moving a value to the top by decreasing its priority"""
+        heap = IndexedMinHeap()
+        for node, distance in [("a", 5), ("b", 3), ("c", 8), ("d", 7)]:
+            heap.insert(node, distance)
+        heap.decrease_key("c", 1)
+        self.assert_positions(heap)
+        self.assertEqual(heap.priority("c"), 1)
+        self.assertEqual(heap.peek(), "c")
+        self.assertRaises(ValueError, lambda h: h.decrease_key("a", 10), heap)
+        self.assertEqual(list(heap), ["c", "b", "a", "d"])
+
+    def test_update(self):
+        """Test changing priorities in both directions"""
+        heap = IndexedMinHeap()
+        for idx, value in enumerate("abcdefg"):
+            heap.insert(value, idx)
+        heap.update("a", 10)
+        self.assert_positions(heap)
+        heap.update("g", -1)
+        self.assert_positions(heap)
+        heap.update("d", 3)
+        self.assertEqual(list(heap), ["g", "b", "c", "d", "e", "f", "a"])
+
+    def test_update_recomputes_key(self):
+        """Test that update() without a priority recomputes the value's key"""
+        scores = {"a": 1, "b": 2, "c": 3}
+        heap = IndexedMinHeap(scores, key=scores.__getitem__)
+        scores["a"] = 4
+        heap.update("a")
+        self.assertEqual(list(heap), ["b", "c", "a"])
+
+    def test_remove(self):
+        """Test removing arbitrary values"""
+        heap = IndexedMinHeap(range(15))
+        self.assertEqual(heap.remove(14), 14)
+        self.assertEqual(heap.remove(3), 3)
+        self.assertEqual(heap.remove(0), 0)
+        self.assert_positions(heap)
+        self.assertNotIn(3, heap)
+        self.assertRaises(KeyError, lambda h: h.remove(3), heap)
+        self.assertEqual(list(heap), [1, 2] + list(range(4, 14)))
+
+    def test_reverse(self):
+        """Test that priorities follow the heap direction when reversed"""
+        heap = IndexedMinHeap([1, 2, 3], reverse=True)
+        heap.decrease_key(1, 10)
+        self.assertRaises(ValueError, lambda h: h.decrease_key(2, 0), heap)
+        self.assertEqual(list(heap), [1, 3, 2])
+
+    def test_replace_and_pushpop(self):
+        """Test that positions are kept up to date by replace() and pushpop()"""
+        heap = IndexedMinHeap(range(1, 10))
+        self.assertEqual(heap.replace(20), 1)
+        self.assert_positions(heap)
+        self.assertNotIn(1, heap)
+        self.assertEqual(heap.pushpop(0), 0)
+        self.assertEqual(heap.pushpop(30), 2)
+        self.assert_positions(heap)
+        self.assertRaises(ValueError, lambda h: h.replace(30), heap)
+        self.assertRaises(ValueError, lambda h: h.pushpop(3), heap)
+        self.assertEqual(list(heap), [3, 4, 5, 6, 7, 8, 9, 20, 30])
+
+    def test_merge(self):
+        """Test that positions are kept up to date when merging"""
+        heap = IndexedMinHeap(range(0, 20, 2))
+        heap.merge(IndexedMinHeap([7]))
+        self.assert_positions(heap)
+        heap.merge(IndexedMinHeap(range(21, 60, 2)))
+        self.assert_positions(heap)
+        self.assertRaises(ValueError, lambda h: h.merge(IndexedMinHeap([4])), heap)
+        expected = sorted([*range(0, 20, 2), 7, *range(21, 60, 2)])
+        self.assertEqual(list(heap), expected)
@@ -0,0 +1,152 @@
+"""Tests for numeric_min_heap.py"""
+
+import os
+import random
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+    from data_structures.numeric_min_heap import NumericMinHeap
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class NumericMinHeapTest(unittest.TestCase):
+    """Numeric min-heap tests"""
+
+    def assert_heap(self, heap):
+        """Assert that every parent is no bigger than its children"""
+        keys = heap.keys[: heap.length]
+        for idx in range(1, heap.length):
+            self.assertLessEqual(keys[(idx - 1) // 2], keys[idx])
+
+    def test_insert_and_remove_min(self):
+        """Test inserting and removing single priorities"""
+        heap = NumericMinHeap()
+        for priority in [5, 3.5, 8, 1]:
+            heap.insert(priority)
+        self.assertEqual(len(heap), 4)
+        self.assertEqual(heap.peek(), 1)
+        self.assertEqual(heap.peek_id(), 3)
+        self.assertEqual(heap.remove_min_item(), (1, 3))
+        self.assertEqual(heap.remove_min(), 3.5)
+        self.assertEqual(list(heap), [5, 8])
+        self.assertRaises(IndexError, heap.remove_min)
+        self.assertRaises(IndexError, heap.peek)
+        self.assertRaises(IndexError, heap.peek_id)
+
+    def test_payload_ids(self):
+        """Test that payload ids follow their priorities"""
+        tasks = ["c", "a", "b"]
+        heap = NumericMinHeap([3.0, 1.0, 2.0])
+        order = [tasks[heap.remove_min_item()[1]] for _ in tasks]
+        self.assertEqual(order, ["a", "b", "c"])
+        heap = NumericMinHeap([3, 1], ids=[30, 10], dtype=np.int64)
+        heap.insert(2, 20)
+        items = [heap.remove_min_item() for _ in range(3)]
+        self.assertEqual(items, [(1, 10), (2, 20), (3, 30)])
+        self.assertRaises(ValueError, lambda: NumericMinHeap([1, 2], ids=[1]))
+
+    def test_heapify(self):
+        """Test building heaps of every shape from a batch"""
+        for size in range(40):
+            priorities = np.random.default_rng(size).random(size)
+            heap = NumericMinHeap(priorities)
+            self.assert_heap(heap)
+            self.assertEqual(list(heap), sorted(priorities.tolist()))
+
+    def test_push_many(self):
+        """Test adding small and large batches to an existing heap"""
+        rng = np.random.default_rng(0)
+        heap = NumericMinHeap(rng.random(1000))
+        heap.push_many(rng.random(10))
+        self.assert_heap(heap)
+        heap.push_many(x / 10 for x in range(500))
+        self.assert_heap(heap)
+        self.assertEqual(len(heap), 1510)
+        self.assertEqual(heap.next_id, 1510)
+        self.assertEqual(sorted(heap.ids[: heap.length].tolist()), list(range(1510)))
+
+    def test_pop_many(self):
+        """Test popping with and without partitioning"""
+        priorities = np.random.default_rng(1).random(2000)
+        expected = np.sort(priorities)
+        heap = NumericMinHeap(priorities)
+        self.assertRaises(IndexError, lambda: heap.pop_many(-1))
+        self.assertRaises(IndexError, lambda: heap.pop_many(2001))
+        popped = []
+        for k in [0, 3, 1000, 997]:
+            keys, ids = heap.pop_many(k)
+            self.assertEqual(len(keys), k)
+            np.testing.assert_array_equal(priorities[ids], keys)
+            self.assert_heap(heap)
+            popped.extend(keys.tolist())
+        self.assertEqual(popped, expected.tolist())
+        self.assertEqual(len(heap), 0)
+        self.assertEqual(len(heap.keys), NumericMinHeap.MIN_CAPACITY)
+
+    def test_merge(self):
+        """Test merging two heaps"""
+        first = NumericMinHeap([4, 1, 7], dtype=np.int64)
+        second = NumericMinHeap([5, 2], ids=[50, 20], dtype=np.int64)
+        first.merge(second)
+        self.assertEqual(len(second), 2)
+        items = [first.remove_min_item() for _ in range(5)]
+        self.assertEqual(items, [(1, 1), (2, 20), (4, 0), (5, 50), (7, 2)])
+
+    def test_random_operations(self):
+        """Test a random mix of operations against a sorted list"""
+        rng = random.Random(2)
+        heap = NumericMinHeap()
+        expected: list[float] = []
+        for _ in range(500):
+            operation = rng.random()
+            if operation < 0.5:
+                priority = rng.random()
+                heap.insert(priority)
+                expected.append(priority)
+            elif operation < 0.6:
+                batch = [rng.random() for _ in range(rng.randrange(50))]
+                heap.push_many(batch)
+                expected.extend(batch)
+            elif operation < 0.7:
+                k = rng.randrange(len(heap) + 1)
+                expected.sort()
+                self.assertEqual(heap.pop_many(k)[0].tolist(), expected[:k])
+                del expected[:k]
+            elif expected:
+                expected.sort()
+                self.assertEqual(heap.remove_min(), expected.pop(0))
+            self.assertEqual(len(heap), len(expected))
+
+    def test_save_and_load(self):
+        """Test saving a heap and loading it back, memory-mapped or read in"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "heap.snap")
+            rng = random.Random(0)
+            heap = NumericMinHeap([rng.random() for _ in range(1000)], dtype=np.float32)
+            heap.pop_many(100)
+            heap.save(path)
+            expected = np.sort(heap.keys[: heap.length])
+            for mmap in (True, False):
+                loaded = NumericMinHeap.load(path, mmap=mmap)
+                self.assertIsInstance(loaded.keys, np.memmap if mmap else np.ndarray)
+                self.assertEqual(loaded.dtype, np.float32)
+                self.assertEqual(loaded.next_id, 1000)
+                loaded.insert(-1.0)
+                self.assertEqual(loaded.remove_min_item(), (-1.0, 1000))
+                keys, _ = loaded.pop_many(len(loaded))
+                np.testing.assert_array_equal(keys, expected)
+
+            # Changes to a memory-mapped heap never reach the file
+            loaded = NumericMinHeap.load(path)
+            loaded.remove_min()
+            self.assertEqual(len(NumericMinHeap.load(path)), 900)
+
+            NumericMinHeap().save(path)
+            loaded = NumericMinHeap.load(path)
+            self.assertEqual(len(loaded), 0)
+            loaded.insert(1.0)
+            self.assertEqual(loaded.peek(), 1.0)
@@ -0,0 +1,139 @@
+"""Tests for pairing_heap.py"""
+
+import os
+import pickle
+import random
+import tempfile
+import unittest
+from data_structures.min_heap import MinHeap
+from data_structures.pairing_heap import PairingHeap
+
+
+class PairingHeapTest(unittest.TestCase):
+    """Pairing heap tests"""
+
+    def test_insert_and_remove_min(self):
+        """Test inserting and removing values in order"""
+        heap = PairingHeap()
+        for value in [5, 3, 8, 1, 9, 2]:
+            heap.insert(value)
+        self.assertEqual(len(heap), 6)
+        self.assertEqual(heap.peek(), 1)
+        self.assertEqual(heap.remove_min(), 1)
+        self.assertEqual(list(heap), [2, 3, 5, 8, 9])
+        self.assertEqual(len(heap), 0)
+        self.assertRaises(IndexError, heap.remove_min)
+        self.assertRaises(IndexError, heap.peek)
+        self.assertRaises(IndexError, heap.peek_key)
+
+    def test_key_and_reverse(self):
+        """Test ordering by a key, and largest first"""
+        heap = PairingHeap(["ccc", "a", "bb"], key=len)
+        self.assertEqual(heap.peek_key(), 1)
+        self.assertEqual(list(heap), ["a", "bb", "ccc"])
+        self.assertEqual(list(PairingHeap(range(5), reverse=True)), [4, 3, 2, 1, 0])
+
+    def test_merge(self):
+        """Test moving every value from one heap into another"""
+        first = PairingHeap([5, 1, 9])
+        second = PairingHeap([4, 0, 7])
+        first.merge(second)
+        self.assertEqual(len(first), 6)
+        self.assertEqual(len(second), 0)
+        self.assertRaises(IndexError, second.peek)
+        first.merge(PairingHeap())
+        empty = PairingHeap()
+        empty.merge(first)
+        self.assertEqual(list(empty), [0, 1, 4, 5, 7, 9])
+        self.assertRaises(ValueError, lambda: empty.merge(empty))
+        self.assertRaises(ValueError, lambda: empty.merge(PairingHeap(reverse=True)))
+
+    def test_merge_other_heaps(self):
+        """Test merging with MinHeaps both ways, which leaves the other heap intact"""
+        heap = PairingHeap([5, 1])
+        other = MinHeap([4, 0, 7])
+        heap.merge(other)
+        self.assertEqual(len(other), 3)
+        min_heap = MinHeap([3])
+        min_heap.merge(heap)
+        self.assertEqual(len(heap), 5)
+        self.assertEqual(list(min_heap), [0, 1, 3, 4, 5, 7])
+        self.assertEqual(list(heap), [0, 1, 4, 5, 7])
+        self.assertRaises(ValueError, lambda: heap.merge(MinHeap(reverse=True)))
+
+    def test_sorted_iteration_and_replace(self):
+        """Test reading values in order without removing them, and replacing the top"""
+        values = random.Random(1).sample(range(500), 200)
+        heap = PairingHeap(values)
+        heap.remove_min()
+        self.assertEqual(list(heap.iter_sorted()), sorted(values)[1:])
+        self.assertEqual(heap.nsmallest(3), sorted(values)[1:4])
+        self.assertEqual(len(heap), 199)
+        self.assertEqual(list(PairingHeap().iter_sorted()), [])
+        longest_first = PairingHeap(["bb", "a"], key=len, reverse=True)
+        self.assertEqual(longest_first.nsmallest(1), ["bb"])
+
+        heap = PairingHeap([3, 1, 2])
+        self.assertEqual(heap.pushpop(0), 0)
+        self.assertEqual(heap.pushpop(5), 1)
+        self.assertEqual(heap.replace(0), 2)
+        self.assertEqual(list(heap), [0, 3, 5])
+        self.assertRaises(IndexError, lambda: heap.replace(1))
+        self.assertEqual(heap.pushpop(1), 1)
+
+    def test_decrease_key(self):
+        """Test moving values up by decreasing their priority"""
+        heap = PairingHeap()
+        nodes = {value: heap.insert(value) for value in range(10, 20)}
+        heap.remove_min()
+        heap.decrease_key(nodes[15], 1)
+        self.assertEqual(heap.peek(), 15)
+        heap.decrease_key(nodes[15], 0)
+        heap.decrease_key(nodes[19], 2)
+        self.assertRaises(ValueError, lambda: heap.decrease_key(nodes[12], 20))
+        self.assertRaises(ValueError, lambda: heap.decrease_key(nodes[10], 0))
+        self.assertEqual(list(heap), [15, 19, 11, 12, 13, 14, 16, 17, 18])
+
+    def test_random_operations(self):
+        """Test a random mix of operations against a sorted list"""
+        rng = random.Random(0)
+        heap = PairingHeap(key=lambda item: item[0])
+        nodes = []
+        for _ in range(2000):
+            operation = rng.random()
+            if operation < 0.4:
+                nodes.append(heap.insert([rng.randrange(1000), len(nodes)]))
+            elif operation < 0.6 and heap:
+                node = rng.choice([node for node in nodes if node.value is not None])
+                priority = node.key - rng.randrange(100)
+                node.value[0] = priority
+                heap.decrease_key(node, priority)
+            elif operation < 0.65:
+                other = PairingHeap(key=lambda item: item[0])
+                for _ in range(5):
+                    nodes.append(other.insert([rng.randrange(1000), len(nodes)]))
+                heap.merge(other)
+            elif heap:
+                expected = min(node.key for node in nodes if node.value is not None)
+                self.assertEqual(heap.peek_key(), expected)
+                nodes[heap.remove_min()[1]].value = None
+            self.assertEqual(len(heap), sum(node.value is not None for node in nodes))
+
+    def test_save_and_load(self):
+        """Test that saving and loading keeps decreased keys"""
+        heap = PairingHeap(["aaa", "b", "cc"], key=len)
+        node = heap.insert("dddd")
+        heap.decrease_key(node, 0)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "heap.snap")
+            heap.save(path)
+            loaded = PairingHeap.load(path, key=len)
+        self.assertEqual(len(loaded), 4)
+        self.assertEqual(list(loaded), ["dddd", "b", "cc", "aaa"])
+
+    def test_pickle_deep_tree(self):
+        """Test pickling a heap whose tree is far deeper than the recursion limit"""
+        heap = PairingHeap(range(100_000, 0, -1))
+        copy = pickle.loads(pickle.dumps(heap))
+        self.assertEqual(len(copy), 100_000)
+        self.assertEqual(list(copy), list(range(1, 100_001)))
@@ -0,0 +1,101 @@
+"""Tests for persistent.py"""
+
+import pickle
+import unittest
+from data_structures.persistent import (
+    PersistentLinkedList,
+    PersistentStack,
+    TransientLinkedList,
+)
+
+
+class PersistentStackTest(unittest.TestCase):
+    """Persistent stack tests"""
+
+    def test_push_and_pop(self):
+        """Test that pushing and popping leave the old versions untouched"""
+        empty = PersistentStack()
+        one = empty.push(1)
+        two = one.push(2)
+        self.assertEqual(list(empty), [])
+        self.assertEqual(list(one), [1])
+        self.assertEqual(list(two), [2, 1])
+        self.assertEqual(len(two), 2)
+        self.assertEqual(two.peek(), 2)
+        self.assertEqual(two.peek(1), 1)
+        self.assertIs(two.pop().head, one.head)
+        self.assertRaises(IndexError, empty.pop)
+        self.assertRaises(IndexError, empty.peek)
+        self.assertRaises(IndexError, lambda: two.peek(2))
+
+    def test_push_many(self):
+        """Test that values are pushed in order, so the last ends up on top"""
+        stack = PersistentStack([1, 2])
+        self.assertEqual(list(stack.push_many([3, 4])), [4, 3, 2, 1])
+        self.assertEqual(list(stack), [2, 1])
+
+    def test_equality_and_hash(self):
+        """Test equality and hashing across shared and separate versions"""
+        base = PersistentStack(range(1000))
+        first = base.push("a")
+        second = base.push("a")
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertEqual(first, PersistentStack([*range(1000), "a"]))
+        self.assertNotEqual(first, base.push("b"))
+        self.assertNotEqual(first, base)
+        self.assertNotEqual(PersistentStack([1]), PersistentLinkedList([1]))
+        self.assertEqual(len({first, second, base}), 2)
+        reordered = PersistentStack([2, 1])
+        self.assertNotEqual(hash(PersistentStack([1, 2])), hash(reordered))
+
+    def test_long_chains(self):
+        """Test hashing and pickling chains far longer than the recursion limit"""
+        stack = PersistentStack(range(100_000))
+        self.assertEqual(hash(stack), hash(PersistentStack(range(100_000))))
+        copy = pickle.loads(pickle.dumps(stack))
+        self.assertIsInstance(copy, PersistentStack)
+        self.assertEqual(copy, stack)
+
+
+class PersistentLinkedListTest(unittest.TestCase):
+    """Persistent linked list tests"""
+
+    def test_changes_share_the_rest(self):
+        """Test that changes copy only the nodes before the change"""
+        llst = PersistentLinkedList([1, 2, 3, 4])
+        changed = llst.set(1, 20)
+        self.assertEqual(list(changed), [1, 20, 3, 4])
+        self.assertEqual(list(llst), [1, 2, 3, 4])
+        self.assertIs(changed.head.next.next, llst.head.next.next)
+
+        self.assertEqual(list(llst.insert(0, 0)), [0, 1, 2, 3, 4])
+        self.assertEqual(list(llst.insert(4, 5)), [1, 2, 3, 4, 5])
+        self.assertEqual(list(llst.remove(3)), [1, 2, 3])
+        self.assertEqual(list(llst.append(5)), [1, 2, 3, 4, 5])
+        self.assertIs(llst.prepend(0).rest().head, llst.head)
+        self.assertEqual(llst[2], 3)
+        self.assertEqual(len(llst), 4)
+        self.assertRaises(IndexError, lambda: llst.insert(5, 5))
+        self.assertRaises(IndexError, lambda: llst.remove(4))
+        self.assertRaises(IndexError, lambda: llst.get(-1))
+        self.assertRaises(IndexError, PersistentLinkedList().rest)
+
+    def test_transient(self):
+        """Test building persistent lists in bulk with a transient builder"""
+        builder = TransientLinkedList([1, 2])
+        builder.append(3)
+        builder.extend([4, 5])
+        self.assertEqual(len(builder), 5)
+        llst = builder.persistent()
+        self.assertEqual(llst, PersistentLinkedList([1, 2, 3, 4, 5]))
+
+        # Building onto an existing list shares all of its nodes
+        extended = TransientLinkedList([-1, 0]).persistent(rest=llst)
+        self.assertEqual(list(extended), [-1, 0, 1, 2, 3, 4, 5])
+        self.assertIs(extended.rest().rest().head, llst.head)
+
+        # The builder keeps working, without changing what it already built
+        builder.append(6)
+        self.assertEqual(len(llst), 5)
+        self.assertEqual(len(builder.persistent()), 6)
@@ -1,5 +1,7 @@
 """Tests for queue.py"""
 
+import os
+import tempfile
 import unittest
 from data_structures.queue import Queue
 
@@ -74,3 +76,85 @@ class QueueTest(unittest.TestCase):
         queue.extend(test_sequence)
         self.assertEqual(list(queue), test_sequence)
         self.assertEqual(list(queue), [])
+
+    def test_wrap_around(self):
+        """Test interleaving enqueues and dequeues so the buffer wraps around"""
+        queue = Queue()
+        expected = []
+        for value in range(100):
+            queue.enqueue(value)
+            expected.append(value)
+            if value % 3 == 0:
+                self.assertEqual(queue.dequeue(), expected.pop(0))
+        self.assertEqual(len(queue), len(expected))
+        self.assertEqual(list(queue), expected)
+
+    def test_extend_wrap_around(self):
+        """Test extending when the free space wraps past the end of the buffer"""
+        queue = Queue(range(6))
+        for value in range(4):
+            self.assertEqual(queue.dequeue(), value)
+        queue.extend([6, 7, 8, 9])
+        self.assertEqual(len(queue.buffer), Queue.MIN_CAPACITY)
+        queue.extend(range(10, 30))
+        self.assertEqual(list(queue), list(range(4, 30)))
+
+    def test_extend_empty(self):
+        """Test that extending with an empty iterable changes nothing"""
+        queue = Queue([1])
+        queue.extend([])
+        self.assertEqual(list(queue), [1])
+
+    def test_growth(self):
+        """Test that the buffer capacity stays a power of two as it grows"""
+        queue = Queue()
+        for value in range(1000):
+            queue.enqueue(value)
+        capacity = len(queue.buffer)
+        self.assertGreaterEqual(capacity, 1000)
+        self.assertEqual(capacity & (capacity - 1), 0)
+        self.assertEqual(list(queue), list(range(1000)))
+
+    def test_dequeued_slots_cleared(self):
+        """Test that dequeued values aren't kept alive by the buffer"""
+        queue = Queue(["a", "b", "c"])
+        queue.dequeue()
+        self.assertNotIn("a", queue.buffer)
+
+    def test_shrink(self):
+        """Test that the buffer shrinks after draining only when asked to"""
+        queue = Queue(range(1000), shrink=True)
+        for value in range(995):
+            self.assertEqual(queue.dequeue(), value)
+        self.assertLessEqual(len(queue.buffer), 4 * Queue.MIN_CAPACITY)
+        self.assertEqual(list(queue), list(range(995, 1000)))
+        self.assertEqual(len(queue.buffer), Queue.MIN_CAPACITY)
+
+        queue = Queue(range(1000))
+        for _ in range(1000):
+            queue.dequeue()
+        self.assertGreaterEqual(len(queue.buffer), 1000)
+
+    def test_save_and_load(self):
+        """Test saving a queue whose values wrap around, and loading it back"""
+        queue = Queue(range(8), shrink=True)
+        for value in range(8, 12):
+            queue.dequeue()
+            queue.enqueue(value)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "queue.snap")
+            queue.save(path)
+            loaded = Queue.load(path)
+        self.assertTrue(loaded.shrink)
+        self.assertEqual(list(loaded), list(range(4, 12)))
+
+    def test_view(self):
+        """Test viewing a wrapped-around queue in place and draining it"""
+        queue = Queue(range(8))
+        for value in range(8, 12):
+            queue.dequeue()
+            queue.enqueue(value)
+        self.assertEqual(list(queue.view().map(str)), [str(v) for v in range(4, 12)])
+        self.assertEqual(len(queue), 8)
+        self.assertEqual(list(queue.view(drain=True).take(5)), [4, 5, 6, 7, 8])
+        self.assertEqual(list(queue.view()), [9, 10, 11])
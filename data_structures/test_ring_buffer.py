@@ -0,0 +1,29 @@
+"""Tests for ring_buffer.py"""
+
+import unittest
+from data_structures.deque import Deque
+from data_structures.queue import Queue
+from data_structures.ring_buffer import RingBuffer
+
+
+class RingBufferTest(unittest.TestCase):
+    """Ring buffer tests"""
+
+    def test_append_and_popleft(self):
+        """Test adding at the back and removing from the front across wrap-arounds"""
+        ring = RingBuffer(range(5))
+        for value in range(5, 100):
+            self.assertEqual(ring.popleft(), value - 5)
+            ring.append(value)
+        self.assertEqual(ring.peekleft(), 95)
+        self.assertEqual(list(ring.view()), list(range(95, 100)))
+        self.assertEqual(list(ring), list(range(95, 100)))
+        self.assertRaises(IndexError, ring.popleft)
+        self.assertRaises(IndexError, ring.peekleft)
+
+    def test_shared_by_queue_and_deque(self):
+        """Test that Queue and Deque name the shared operations their own way"""
+        self.assertIs(Queue.enqueue, RingBuffer.append)
+        self.assertIs(Queue.dequeue, RingBuffer.popleft)
+        self.assertIs(Queue.peek, RingBuffer.peekleft)
+        self.assertIs(Deque.popleft, RingBuffer.popleft)
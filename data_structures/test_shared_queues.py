@@ -0,0 +1,176 @@
+"""Tests for shared_queues.py"""
+
+import multiprocessing
+import random
+import unittest
+from data_structures.blocking_queue import Empty, Full
+from data_structures.shared_queues import SharedMinHeap, SharedQueue
+
+
+def produce(queue, start, stop):
+    """Put a range of numbers on a shared queue from another process"""
+    queue.put_many(range(start, stop))
+    queue.close()
+
+
+def consume(queue, results, count):
+    """Get numbers off a shared queue in another process, and report their sum"""
+    total = 0
+    received = 0
+    while received < count:
+        values = queue.get_many(100, timeout=10)
+        total += sum(values)
+        received += len(values)
+    queue.close()
+    results.put(total)
+
+
+def drain_heap(heap, results):
+    """Pop everything off a shared heap in another process"""
+    results.put(heap.pop_many(len(heap)))
+    heap.close()
+
+
+class SharedQueueTest(unittest.TestCase):
+    """Shared-memory queue tests"""
+
+    def test_put_and_get(self):
+        """Test putting and getting values in FIFO order"""
+        with SharedQueue(4) as queue:
+            queue.put(1)
+            queue.put(2)
+            self.assertEqual(len(queue), 2)
+            self.assertEqual(queue.get(), 1)
+            queue.put_many([3, 4, 5])
+            self.assertEqual(queue.get_many(10), [2, 3, 4, 5])
+            self.assertEqual(len(queue), 0)
+
+    def test_wrap_around(self):
+        """Test batches that wrap around the end of the buffer"""
+        with SharedQueue(5) as queue:
+            expected = []
+            for start in range(0, 40, 4):
+                queue.put_many(range(start, start + 4))
+                expected += queue.get_many(3)
+                expected += queue.get_many(1)
+            self.assertEqual(expected, list(range(40)))
+
+    def test_empty_and_full(self):
+        """Test that Empty and Full are raised instead of blocking forever"""
+        with SharedQueue(2) as queue:
+            self.assertRaises(Empty, lambda: queue.get(block=False))
+            self.assertRaises(Empty, lambda: queue.get_many(5, timeout=0.01))
+            queue.put_many([1, 2])
+            self.assertRaises(Full, lambda: queue.put(3, block=False))
+            self.assertRaises(Full, lambda: queue.put_many([3], timeout=0.01))
+            self.assertEqual(len(queue), 2)
+
+    def test_record_format(self):
+        """Test records with several fields, which come back as tuples"""
+        with SharedQueue(3, "qd") as queue:
+            queue.put((1, 0.5))
+            queue.put_many([(2, 1.5), (3, 2.5)])
+            self.assertEqual(queue.get(), (1, 0.5))
+            self.assertEqual(queue.get_many(2), [(2, 1.5), (3, 2.5)])
+
+        # Formats spelled like a run of array typecodes still pack field by field
+        with SharedQueue(2, "qQ") as queue:
+            queue.put_many([(-1, 2), (3, 4)])
+            self.assertEqual(queue.get_many(2), [(-1, 2), (3, 4)])
+
+    def test_single_field_format(self):
+        """Test a single field which isn't an array typecode, packed with struct"""
+        with SharedQueue(3, "<q") as queue:
+            queue.put(-1)
+            queue.put_many([2**40, 3])
+            self.assertEqual(queue.get(), -1)
+            self.assertEqual(queue.get_many(2), [2**40, 3])
+
+    def test_invalid_capacity(self):
+        """Test that a queue needs room for at least one record"""
+        self.assertRaises(ValueError, lambda: SharedQueue(0))
+
+    def test_processes(self):
+        """Test producers and consumers in separate processes"""
+        count = 10_000
+        results = multiprocessing.Queue()
+        with SharedQueue(256) as queue:
+            processes = [
+                multiprocessing.Process(target=produce, args=(queue, 0, count // 2)),
+                multiprocessing.Process(
+                    target=produce, args=(queue, count // 2, count)
+                ),
+                multiprocessing.Process(target=consume, args=(queue, results, count)),
+            ]
+            for process in processes:
+                process.start()
+            total = results.get(timeout=30)
+            for process in processes:
+                process.join()
+            self.assertEqual(total, sum(range(count)))
+            self.assertEqual(len(queue), 0)
+
+
+    def test_spawned_process(self):
+        """Test passing a queue to a spawned process, which pickles it"""
+        context = multiprocessing.get_context("spawn")
+        with SharedQueue(100, context=context) as queue:
+            process = context.Process(target=produce, args=(queue, 0, 50))
+            process.start()
+            process.join()
+            self.assertEqual(process.exitcode, 0)
+            self.assertEqual(queue.get_many(100), list(range(50)))
+
+
+class SharedMinHeapTest(unittest.TestCase):
+    """Shared-memory min-heap tests"""
+
+    def test_push_and_pop(self):
+        """Test that pairs come out in key order"""
+        with SharedMinHeap(8) as heap:
+            heap.push(3.0, 30)
+            heap.push(1.0, 10)
+            heap.push(2.0, 20)
+            self.assertEqual(len(heap), 3)
+            self.assertEqual(heap.peek(), (1.0, 10))
+            self.assertEqual(heap.pop(), (1.0, 10))
+            self.assertEqual(heap.pop_many(5), [(2.0, 20), (3.0, 30)])
+
+    def test_push_many(self):
+        """Test batches small enough to sift up and big enough to heapify"""
+        rng = random.Random(1)
+        keys = [rng.random() for _ in range(500)]
+        with SharedMinHeap(500) as heap:
+            heap.push_many((key, idx) for idx, key in enumerate(keys[:300]))
+            heap.push_many((key, idx + 300) for idx, key in enumerate(keys[300:]))
+            popped = heap.pop_many(500)
+        self.assertEqual([key for key, _ in popped], sorted(keys))
+        self.assertTrue(all(keys[idx] == key for key, idx in popped))
+
+    def test_empty_and_full(self):
+        """Test that Empty and Full are raised instead of blocking forever"""
+        with SharedMinHeap(1) as heap:
+            self.assertRaises(Empty, lambda: heap.pop(block=False))
+            self.assertRaises(Empty, heap.peek)
+            heap.push(1.0, 1)
+            self.assertRaises(Full, lambda: heap.push(2.0, 2, timeout=0.01))
+            self.assertRaises(Full, lambda: heap.push_many([(2.0, 2)], block=False))
+
+    def test_payload_format(self):
+        """Test payloads with several fields"""
+        with SharedMinHeap(4, "qq") as heap:
+            heap.push_many([(2.0, (2, 20)), (1.0, (1, 10))])
+            self.assertEqual(heap.pop_many(2), [(1.0, (1, 10)), (2.0, (2, 20))])
+
+    def test_processes(self):
+        """Test draining a heap in a separate process"""
+        results = multiprocessing.Queue()
+        with SharedMinHeap(100) as heap:
+            heap.push_many((float(100 - idx), idx) for idx in range(100))
+            process = multiprocessing.Process(target=drain_heap, args=(heap, results))
+            process.start()
+            popped = results.get(timeout=30)
+            process.join()
+            expected = [(float(100 - idx), idx) for idx in range(99, -1, -1)]
+            self.assertEqual(popped, expected)
+            self.assertEqual(len(heap), 0)
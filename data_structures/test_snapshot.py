@@ -0,0 +1,53 @@
+"""Tests for snapshot.py"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from array import array
+from data_structures import snapshot
+from data_structures.queue import Queue
+from data_structures.stack import Stack
+
+
+class SnapshotTest(unittest.TestCase):
+    """Snapshot file tests"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "structure.snap")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_state_and_buffers(self):
+        """Test that the state and aligned raw buffers come back"""
+        numbers = array("q", range(10))
+        snapshot.write(
+            self.path,
+            Stack(),
+            {"name": "x" * 5},
+            {"numbers": ("q", numbers), "empty": ("d", array("d"))},
+        )
+        state, buffers = snapshot.read(self.path, Stack)
+        self.assertEqual(state, {"name": "xxxxx"})
+        self.assertEqual(buffers["numbers"].format, "q")
+        self.assertEqual(buffers["numbers"].offset % snapshot.ALIGNMENT, 0)
+        self.assertEqual(buffers["empty"].nbytes, 0)
+        data = snapshot.read_buffer(self.path, buffers["numbers"])
+        self.assertEqual(array("q", data), numbers)
+        self.assertEqual(os.listdir(self.directory), ["structure.snap"])
+
+    def test_wrong_file(self):
+        """Test that loading anything but a snapshot of the same class fails"""
+        with open(self.path, "wb") as file:
+            file.write(b"not a snapshot")
+        self.assertRaises(ValueError, lambda: Stack.load(self.path))
+        Queue([1]).save(self.path)
+        self.assertRaises(ValueError, lambda: Stack.load(self.path))
+
+    def test_overwrite(self):
+        """Test that saving over a snapshot replaces it"""
+        Stack([1, 2]).save(self.path)
+        Stack([3]).save(self.path)
+        self.assertEqual(list(Stack.load(self.path)), [3])
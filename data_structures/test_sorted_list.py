@@ -0,0 +1,95 @@
+"""Tests for sorted_list.py"""
+
+import bisect
+import random
+import unittest
+from data_structures.sorted_list import SortedList
+
+
+class SortedListTest(unittest.TestCase):
+    """Sorted list tests"""
+
+    def test_add_and_remove(self):
+        """Test that values stay sorted as they are added and removed"""
+        values = SortedList([5, 1, 3])
+        values.add(2)
+        values.add(3)
+        self.assertEqual(list(values), [1, 2, 3, 3, 5])
+        values.remove(3)
+        self.assertEqual(list(values), [1, 2, 3, 5])
+        self.assertEqual(len(values), 4)
+        self.assertRaises(ValueError, lambda: values.remove(4))
+        self.assertFalse(values.discard(4))
+        self.assertTrue(values.discard(5))
+        self.assertRaises(ValueError, lambda: SortedList().remove(1))
+        self.assertRaises(ValueError, lambda: SortedList(chunk_size=0))
+
+    def test_search(self):
+        """Test membership, bisection, rank and select"""
+        values = SortedList([10, 20, 20, 30])
+        self.assertIn(20, values)
+        self.assertNotIn(25, values)
+        self.assertNotIn(40, values)
+        self.assertEqual(values.bisect_left(20), 1)
+        self.assertEqual(values.bisect_right(20), 3)
+        self.assertEqual(values.bisect(40), 4)
+        self.assertEqual(values.bisect_left(5), 0)
+        self.assertEqual(values.index_of(20), 1)
+        self.assertRaises(ValueError, lambda: values.index_of(25))
+        self.assertEqual(values.kth(0), 10)
+        self.assertEqual(values[3], 30)
+        self.assertRaises(IndexError, lambda: values.kth(4))
+        self.assertRaises(IndexError, lambda: SortedList().kth(0))
+
+    def test_irange(self):
+        """Test iterating over ranges with open, inclusive and exclusive bounds"""
+        values = SortedList(range(0, 100, 5), chunk_size=2)
+        self.assertEqual(list(values.irange(10, 30)), [10, 15, 20, 25, 30])
+        self.assertEqual(list(values.irange(10, 30, (False, False))), [15, 20, 25])
+        self.assertEqual(list(values.irange(hi=7)), [0, 5])
+        self.assertEqual(list(values.irange(lo=91)), [95])
+        self.assertEqual(list(values.irange(31, 34)), [])
+        self.assertEqual(list(values.irange(30, 10)), [])
+        self.assertEqual(list(values.irange()), list(range(0, 100, 5)))
+
+    def test_random_operations(self):
+        """Test a long random run against a plain sorted list, across many chunks"""
+        rng = random.Random(0)
+        values = SortedList(chunk_size=4)
+        expected = []
+        for _ in range(5000):
+            value = rng.randrange(200)
+            if rng.random() < 0.6 or not expected:
+                values.add(value)
+                bisect.insort(expected, value)
+            elif value in expected:
+                values.remove(value)
+                expected.remove(value)
+            else:
+                self.assertRaises(ValueError, lambda v=value: values.remove(v))
+            probe = rng.randrange(200)
+            self.assertEqual(
+                values.bisect_left(probe), bisect.bisect_left(expected, probe)
+            )
+            self.assertEqual(
+                values.bisect_right(probe), bisect.bisect_right(expected, probe)
+            )
+            self.assertEqual(probe in values, probe in expected)
+            if expected:
+                k = rng.randrange(len(expected))
+                self.assertEqual(values.kth(k), expected[k])
+                first = bisect.bisect_left(expected, expected[k])
+                self.assertEqual(values.index_of(expected[k]), first)
+        self.assertEqual(list(values), expected)
+        self.assertEqual(len(values), len(expected))
+        self.assertTrue(all(len(chunk) <= 8 for chunk in values.chunks))
+
+    def test_add_many(self):
+        """Test adding batches, both merged in at once and added one at a time"""
+        rng = random.Random(1)
+        new_values = [rng.randrange(1000) for _ in range(500)]
+        values = SortedList(new_values[:100], chunk_size=16)
+        values.add_many(new_values[100:])
+        values.add_many([7])
+        self.assertEqual(list(values), sorted(new_values + [7]))
+        self.assertEqual(values.kth(250), sorted(new_values + [7])[250])
@@ -0,0 +1,178 @@
+"""Tests for spilling_min_heap.py"""
+
+import random
+import sys
+import unittest
+from data_structures.min_heap import BoundedMinHeap, MinHeap
+from data_structures.spilling_min_heap import BLOCK_ITEMS, SpillingMinHeap
+
+
+class SpillingMinHeapTest(unittest.TestCase):
+    """Spilling min-heap tests"""
+
+    def test_spill_and_drain(self):
+        """Test that values come back in order from memory and spilled runs"""
+        values = random.Random(0).sample(range(1000), 1000)
+        with SpillingMinHeap(max_items=100) as heap:
+            for value in values:
+                heap.insert(value)
+            self.assertEqual(heap.runs.length, 10)
+            self.assertEqual(heap.length, 0)
+            self.assertEqual(len(heap), 1000)
+            heap.insert(-1)
+            self.assertEqual(heap.peek(), -1)
+            self.assertEqual(list(heap), [-1] + list(range(1000)))
+            self.assertEqual(heap.runs.length, 0)
+            self.assertRaises(IndexError, heap.remove_min)
+
+    def test_insert_many(self):
+        """Test spilling an iterable in batches, across several blocks"""
+        size = BLOCK_ITEMS * 3 + 5
+        values = random.Random(1).sample(range(size), size)
+        with SpillingMinHeap(iter(values), max_items=BLOCK_ITEMS * 2) as heap:
+            self.assertEqual(heap.runs.length, 1)
+            self.assertEqual(heap.spilled, BLOCK_ITEMS * 2)
+            heap.insert_many(range(-10, 0))
+            self.assertEqual(list(heap), list(range(-10, size)))
+
+    def test_max_bytes(self):
+        """Test spilling by the estimated size of the values"""
+        with SpillingMinHeap(max_items=None, max_bytes=100_000) as heap:
+            heap.insert_many("x" * (size % 100) for size in range(10_000))
+            self.assertGreater(heap.runs.length, 1)
+            self.assertLess(heap.memory_bytes, 100_000)
+            memory_values = heap.table[: heap.length]
+            self.assertEqual(heap.memory_bytes, sum(map(sys.getsizeof, memory_values)))
+            lengths = sorted(size % 100 for size in range(10_000))
+            self.assertEqual([len(value) for value in heap], lengths)
+
+        with SpillingMinHeap(max_items=None, max_bytes=10_000) as heap:
+            for _ in range(10):
+                heap.insert("x" * 1000)
+            self.assertEqual(heap.runs.length, 1)
+            self.assertEqual(heap.length, 0)
+
+    def test_max_bytes_accounting(self):
+        """Test that the byte estimate follows values in and out of memory"""
+        with SpillingMinHeap(max_items=None, max_bytes=10_000) as heap:
+            heap.insert_many(["a" * 500, "b" * 100])
+            heap.insert("c" * 200)
+            self.assertEqual(heap.remove_min(), "a" * 500)
+            self.assertEqual(heap.replace("d" * 2000), "b" * 100)
+            memory_values = heap.table[: heap.length]
+            self.assertEqual(heap.memory_bytes, sum(map(sys.getsizeof, memory_values)))
+            heap.replace("e" * 8000)
+            self.assertEqual(heap.runs.length, 1)
+            self.assertEqual(heap.memory_bytes, 0)
+            heap.insert("f")
+            self.assertEqual(heap.memory_bytes, sys.getsizeof("f"))
+            self.assertEqual(list(heap), ["d" * 2000, "e" * 8000, "f"])
+
+    def test_key_and_reverse(self):
+        """Test that keys and the heap direction are kept for spilled values"""
+        words = [str(number) * (number % 7) for number in range(50)]
+        with SpillingMinHeap(words, key=len, reverse=True, max_items=8) as heap:
+            self.assertGreater(heap.runs.length, 1)
+            self.assertEqual(heap.peek_key(), 12)
+            lengths = sorted(map(len, words), reverse=True)
+            self.assertEqual([len(word) for word in heap], lengths)
+
+    def test_max_runs(self):
+        """Test that runs are merged into one once there are more than max_runs"""
+        values = random.Random(3).sample(range(BLOCK_ITEMS * 3), BLOCK_ITEMS * 3)
+        with SpillingMinHeap(max_items=BLOCK_ITEMS // 2, max_runs=3) as heap:
+            heap.insert_many(values)
+            self.assertLessEqual(heap.runs.length, 3)
+            self.assertEqual(len(heap), len(values))
+            self.assertEqual(list(heap), sorted(values))
+
+        words = [str(number) * (number % 7) for number in range(200)]
+        with SpillingMinHeap(key=len, reverse=True, max_items=8, max_runs=2) as heap:
+            for word in words:
+                heap.insert(word)
+            self.assertLessEqual(heap.runs.length, 2)
+            lengths = sorted(map(len, words), reverse=True)
+            self.assertEqual([len(word) for word in heap], lengths)
+        self.assertRaises(ValueError, lambda: SpillingMinHeap(max_runs=1))
+
+    def test_tiered_merges(self):
+        """Test that only the smallest runs are merged once there are too many"""
+        values = random.Random(4).sample(range(100), 100)
+        with SpillingMinHeap(max_items=10, max_runs=4) as heap:
+            for value in values[:50]:
+                heap.insert(value)
+            runs = heap.runs.table[: heap.runs.length]
+            self.assertEqual(sorted(run.remaining for run in runs), [10, 10, 30])
+            for value in values[50:]:
+                heap.insert(value)
+            runs = heap.runs.table[: heap.runs.length]
+            self.assertEqual(sorted(run.remaining for run in runs), [10, 30, 30, 30])
+            self.assertEqual(list(heap), list(range(100)))
+
+    def test_partly_read_run(self):
+        """Test reading a run of several blocks after some of it was removed"""
+        size = BLOCK_ITEMS * 2 + 10
+        with SpillingMinHeap(range(size), max_items=size) as heap:
+            run = heap.runs.peek()
+            for _ in range(BLOCK_ITEMS + 5):
+                heap.remove_min()
+            self.assertEqual(run.position, 5)
+            lengths = [len(values) for _, values in run.iter_blocks()]
+            self.assertEqual(lengths, [BLOCK_ITEMS - 5, 10])
+            left = list(range(BLOCK_ITEMS + 5, size))
+            self.assertEqual(list(heap.iter_sorted()), left)
+            self.assertEqual(len(heap), size - BLOCK_ITEMS - 5)
+
+    def test_replace_and_pushpop(self):
+        """Test replacing the minimum when it's in memory or on disk"""
+        with SpillingMinHeap(range(10, 20), max_items=10) as heap:
+            heap.insert(15)
+            self.assertEqual(heap.replace(5), 10)
+            self.assertEqual(heap.replace(30), 5)
+            self.assertEqual(heap.pushpop(0), 0)
+            self.assertEqual(heap.pushpop(12), 11)
+            self.assertEqual(list(heap), [12, 12, 13, 14, 15, 15, 16, 17, 18, 19, 30])
+
+    def test_iter_sorted(self):
+        """Test iterating in order without consuming the spilled runs"""
+        values = random.Random(2).sample(range(300), 300)
+        with SpillingMinHeap(max_items=64) as heap:
+            for value in values:
+                heap.insert(value)
+            heap.remove_min()
+            self.assertEqual(list(heap.iter_sorted()), list(range(1, 300)))
+            self.assertEqual(heap.nsmallest(3), [1, 2, 3])
+            self.assertEqual(len(heap), 299)
+            self.assertEqual(list(heap), list(range(1, 300)))
+
+    def test_close(self):
+        """Test that closing deletes the spilled runs"""
+        heap = SpillingMinHeap(range(100), max_items=10)
+        runs = heap.runs.table[: heap.runs.length]
+        heap.close()
+        self.assertTrue(all(run.file.closed for run in runs))
+        self.assertEqual(len(heap), 0)
+
+    def test_merge(self):
+        """Test merging in another heap, including its spilled runs"""
+        with SpillingMinHeap(range(0, 40, 2), max_items=8) as heap:
+            with SpillingMinHeap(range(1, 40, 2), max_items=8) as other:
+                heap.merge(other)
+                self.assertEqual(len(other), 20)
+            self.assertEqual(list(heap), list(range(40)))
+
+    def test_merge_into_in_memory_heap(self):
+        """Test merging a spilled heap into heaps that keep everything in memory"""
+        with SpillingMinHeap(range(10), max_items=4) as spilled:
+            heap = MinHeap([20, -1])
+            heap.merge(spilled)
+            self.assertEqual(list(heap), [-1, *range(10), 20])
+            bounded = BoundedMinHeap(capacity=3)
+            bounded.merge(spilled)
+            self.assertEqual(bounded.result(), [9, 8, 7])
+            self.assertEqual(len(spilled), 10)
+
+    def test_save(self):
+        """Test that a spilling heap refuses to be saved"""
+        with SpillingMinHeap([1]) as heap:
+            self.assertRaises(TypeError, lambda: heap.save("heap.snap"))
@@ -1,5 +1,7 @@
 """Tests for stack.py"""
 
+import os
+import tempfile
 import unittest
 from data_structures.stack import Stack
 
@@ -74,3 +76,62 @@ class StackTest(unittest.TestCase):
         stack.extend(test_sequence)
         self.assertEqual(list(stack), list(reversed(test_sequence)))
         self.assertEqual(list(stack), [])
+
+    def test_push_many(self):
+        """Test pushing several values at once"""
+        stack = Stack([1])
+        stack.push_many(iter([2, 3]))
+        self.assertEqual(len(stack), 3)
+        self.assertEqual(stack.peek(), 3)
+
+    def test_pop_many(self):
+        """Test popping several values at once"""
+        stack = Stack(range(10))
+        self.assertEqual(stack.pop_many(3), [9, 8, 7])
+        self.assertEqual(stack.pop_many(0), [])
+        self.assertEqual(len(stack), 7)
+        self.assertRaises(IndexError, lambda s: s.pop_many(8), stack)
+        self.assertRaises(IndexError, lambda s: s.pop_many(-1), stack)
+        self.assertEqual(stack.pop_many(7), [6, 5, 4, 3, 2, 1, 0])
+        self.assertEqual(len(stack), 0)
+
+    def test_peek_depth(self):
+        """Test peeking below the top of the stack"""
+        stack = Stack([1, 2, 3])
+        self.assertEqual(stack.peek(0), 3)
+        self.assertEqual(stack.peek(2), 1)
+        self.assertRaises(IndexError, lambda s: s.peek(3), stack)
+        self.assertRaises(IndexError, lambda s: s.peek(-1), stack)
+        self.assertEqual(len(stack), 3)
+
+    def test_typed(self):
+        """Test a stack which stores its numbers in an array"""
+        stack = Stack([1.5, 2.5], typecode="d")
+        stack.push(3.5)
+        stack.push_many([4.5, 5.5])
+        self.assertEqual(stack.peek(1), 4.5)
+        popped = stack.pop_many(2)
+        self.assertEqual(list(popped), [5.5, 4.5])
+        self.assertEqual(list(stack.pop_many(0)), [])
+        self.assertEqual(list(stack), [3.5, 2.5, 1.5])
+        self.assertRaises(IndexError, stack.pop)
+        self.assertRaises(TypeError, lambda s: s.push("a"), stack)
+
+    def test_save_and_load(self):
+        """Test saving stacks, with and without a typecode, and loading them back"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "stack.snap")
+            Stack(["a", "b"]).save(path)
+            self.assertEqual(list(Stack.load(path)), ["b", "a"])
+            Stack([1.5, 2.5], typecode="d").save(path)
+            stack = Stack.load(path)
+            self.assertEqual(stack.typecode, "d")
+            self.assertEqual(list(stack), [2.5, 1.5])
+
+    def test_view(self):
+        """Test viewing a stack from the top down in place and draining it"""
+        stack = Stack([1, 2, 3], typecode="q")
+        self.assertEqual(list(stack.view().filter(lambda x: x != 2)), [3, 1])
+        self.assertEqual(len(stack), 3)
+        self.assertEqual(list(stack.view(drain=True).take(2)), [3, 2])
+        self.assertEqual(list(stack.view()), [1])
@@ -0,0 +1,133 @@
+"""Tests for unrolled_linked_list.py"""
+
+import random
+import unittest
+from math import isqrt
+from data_structures.unrolled_linked_list import UnrolledLinkedList
+
+
+class UnrolledLinkedListTest(unittest.TestCase):
+    """Tests for unrolled linked lists"""
+
+    test_sequence: list[int] = list(range(0, 100, 3))
+
+    def assert_matches(self, ullst, expected):
+        """Assert the contents, length and indexed access all match a list"""
+        self.assertEqual(list(ullst), expected)
+        self.assertEqual(len(ullst), len(expected))
+        self.assertEqual([ullst[idx] for idx in range(len(ullst))], expected)
+        self.assertTrue(all(ullst.chunks))
+
+    def assert_chunk_sizes(self, ullst):
+        """Assert that no chunk is over twice the chunk size, or twice √n"""
+        size = max(ullst.chunk_size, isqrt(len(ullst)))
+        self.assertLessEqual(max(map(len, ullst.chunks)), 2 * size)
+
+    def test_append(self):
+        """Test appending across several chunks"""
+        ullst = UnrolledLinkedList(chunk_size=2)
+        for value in range(10):
+            ullst.append(value)
+        self.assert_matches(ullst, list(range(10)))
+
+    def test_from_iterable(self):
+        """Test creating an unrolled linked list from an iterable"""
+        ullst = UnrolledLinkedList(self.test_sequence, chunk_size=4)
+        self.assert_matches(ullst, self.test_sequence)
+        self.assert_matches(UnrolledLinkedList([]), [])
+
+    def test_extend(self):
+        """Test extending a partly filled unrolled linked list"""
+        ullst = UnrolledLinkedList([1], chunk_size=2)
+        ullst.extend([])
+        ullst.extend(self.test_sequence)
+        ullst.extend(self.test_sequence)
+        self.assert_matches(ullst, [1] + self.test_sequence * 2)
+        self.assert_chunk_sizes(ullst)
+
+    def test_prepend(self):
+        """Test prepending to an unrolled linked list"""
+        ullst = UnrolledLinkedList(chunk_size=2)
+        for value in range(10):
+            ullst.prepend(value)
+        self.assert_matches(ullst, list(range(9, -1, -1)))
+        self.assert_chunk_sizes(ullst)
+
+    def test_chunks_grow_with_length(self):
+        """Test that there are O(√n) chunks, so rebuilding the tree stays cheap"""
+        ullst = UnrolledLinkedList(chunk_size=2)
+        rng = random.Random(0)
+        for value in range(10_000):
+            ullst.insert(rng.randint(0, len(ullst)), value)
+        self.assert_chunk_sizes(ullst)
+        self.assertLessEqual(len(ullst.chunks), 2 * isqrt(len(ullst)))
+        self.assertEqual(sorted(ullst), list(range(10_000)))
+
+    def test_get_and_set(self):
+        """Test indexed access"""
+        ullst = UnrolledLinkedList(self.test_sequence, chunk_size=4)
+        test_sequence = list(self.test_sequence)
+        self.assertEqual(ullst[5], test_sequence[5])
+        ullst[5] = 100
+        ullst.set(30, 200)
+        test_sequence[5] = 100
+        test_sequence[30] = 200
+        self.assert_matches(ullst, test_sequence)
+
+    def test_insert_and_remove(self):
+        """Test inserting and removing values in the middle and at the ends"""
+        ullst = UnrolledLinkedList(self.test_sequence, chunk_size=4)
+        test_sequence = list(self.test_sequence)
+        for idx in [0, 5, len(test_sequence), 17]:
+            ullst.insert(idx, -idx)
+            test_sequence.insert(idx, -idx)
+        self.assert_matches(ullst, test_sequence)
+        for idx in [0, 5, 17]:
+            self.assertEqual(ullst.remove(idx), test_sequence.pop(idx))
+        tail_idx = len(test_sequence) - 1
+        self.assertEqual(ullst.remove(tail_idx), test_sequence.pop(tail_idx))
+        self.assert_matches(ullst, test_sequence)
+
+    def test_remove_all(self):
+        """Test removing every value, which removes every chunk"""
+        ullst = UnrolledLinkedList(range(10), chunk_size=2)
+        for value in range(10):
+            self.assertEqual(ullst.remove(0), value)
+        self.assertEqual(ullst.chunks, [])
+        ullst.append(1)
+        self.assert_matches(ullst, [1])
+
+    def test_bounds_checks(self):
+        """Test that errors are raised when attempting to do thing out-of-bounds"""
+        ullst = UnrolledLinkedList(self.test_sequence)
+        self.assertRaises(IndexError, lambda ll_: ll_.remove(-1), ullst)
+        self.assertRaises(IndexError, lambda ll_: ll_.remove(len(ll_)), ullst)
+        self.assertRaises(IndexError, lambda ll_: ll_.get(-1), ullst)
+        self.assertRaises(IndexError, lambda ll_: ll_.get(len(ll_)), ullst)
+        self.assertRaises(IndexError, lambda ll_: ll_.insert(-1, 100), ullst)
+        self.assertRaises(IndexError, lambda ll_: ll_.insert(len(ll_) + 1, 100), ullst)
+        self.assertRaises(IndexError, lambda ll_: ll_.set(-1, 100), ullst)
+        self.assertRaises(IndexError, lambda ll_: ll_.set(len(ll_), 100), ullst)
+
+    def test_random_operations(self):
+        """Test a random mix of operations against a plain list"""
+        rng = random.Random(0)
+        ullst = UnrolledLinkedList(chunk_size=3)
+        expected = []
+        for step in range(2000):
+            operation = rng.randrange(4)
+            if operation == 0 or not expected:
+                idx = rng.randint(0, len(expected))
+                ullst.insert(idx, step)
+                expected.insert(idx, step)
+            elif operation == 1:
+                idx = rng.randrange(len(expected))
+                self.assertEqual(ullst.remove(idx), expected.pop(idx))
+            elif operation == 2:
+                idx = rng.randrange(len(expected))
+                ullst[idx] = step
+                expected[idx] = step
+            else:
+                ullst.append(step)
+                expected.append(step)
+        self.assert_matches(ullst, expected)
@@ -0,0 +1,44 @@
+"""Tests for views.py"""
+
+import unittest
+from data_structures.queue import Queue
+from data_structures.views import View
+
+
+class ViewTest(unittest.TestCase):
+    """Lazy view tests"""
+
+    def test_pipeline(self):
+        """Test chaining map, filter, take and chunked"""
+        view = View(lambda: iter(range(20)))
+        pipeline = view.filter(lambda x: x % 2 == 0).map(lambda x: x * 10).take(7)
+        self.assertEqual(list(pipeline), [0, 20, 40, 60, 80, 100, 120])
+        # A view can be iterated again, starting from the source each time
+        self.assertEqual(list(pipeline.chunked(3)), [[0, 20, 40], [60, 80, 100], [120]])
+        self.assertEqual(list(view.take(0)), [])
+        self.assertEqual(list(View(lambda: iter([])).chunked(2)), [])
+
+    def test_lazy(self):
+        """Test that values are only pulled through as far as they are needed"""
+        seen = []
+        view = View(lambda: iter(range(1_000_000))).map(seen.append)
+        self.assertEqual(len(list(view.take(3))), 3)
+        self.assertEqual(seen, [0, 1, 2])
+
+    def test_drain(self):
+        """Test that a draining view only removes the values it pulls through"""
+        queue = Queue(range(10))
+        drained = queue.view(drain=True)
+        self.assertEqual(list(drained.take(3)), [0, 1, 2])
+        self.assertEqual(len(queue), 7)
+        # Filtered out values are removed too
+        self.assertEqual(list(drained.filter(lambda x: x > 5).take(1)), [6])
+        self.assertEqual(len(queue), 3)
+        self.assertEqual(list(drained.chunked(2)), [[7, 8], [9]])
+        self.assertEqual(len(queue), 0)
+
+    def test_invalid_sizes(self):
+        """Test that negative takes and empty chunks are rejected"""
+        view = View(lambda: iter([1]))
+        self.assertRaises(ValueError, lambda: view.take(-1))
+        self.assertRaises(ValueError, lambda: view.chunked(0))
@@ -0,0 +1,81 @@
+"""Tests for work_stealing_deque.py"""
+
+import sys
+import threading
+import unittest
+from data_structures.blocking_queue import Empty
+from data_structures.work_stealing_deque import WorkStealingDeque
+
+
+class WorkStealingDequeTest(unittest.TestCase):
+    """Work-stealing deque tests"""
+
+    def test_owner_and_thief_ends(self):
+        """Test that the owner pops the newest values and thieves steal the oldest"""
+        tasks = WorkStealingDeque()
+        for value in range(5):
+            tasks.push(value)
+        self.assertEqual(len(tasks), 5)
+        self.assertEqual(tasks.pop(), 4)
+        self.assertEqual(tasks.steal(), 0)
+        self.assertEqual(tasks.steal(), 1)
+        self.assertEqual(tasks.pop(), 3)
+        self.assertEqual(tasks.pop(), 2)
+        self.assertRaises(Empty, tasks.pop)
+        self.assertRaises(Empty, tasks.steal)
+        self.assertEqual(len(tasks), 0)
+
+    def test_growth(self):
+        """Test growing the buffer while values wrap around it"""
+        tasks = WorkStealingDeque()
+        for value in range(20):
+            tasks.push(value)
+        for _ in range(20):
+            tasks.steal()
+        for value in range(100):
+            tasks.push(value)
+        self.assertEqual(len(tasks.buffer), 128)
+        self.assertEqual(tasks.steal(), 0)
+        self.assertEqual([tasks.pop() for _ in range(99)], list(range(99, 0, -1)))
+        self.assertEqual(tasks.buffer, [None] * 128)
+
+    def test_concurrent_stealing(self):
+        """Test that every value is taken exactly once while thieves race the owner"""
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, switch_interval)
+
+        tasks = WorkStealingDeque()
+        done = threading.Event()
+        stolen: list[list[int]] = [[] for _ in range(3)]
+
+        def thief(taken):
+            while not done.is_set() or len(tasks) > 0:
+                try:
+                    taken.append(tasks.steal())
+                except Empty:
+                    pass
+
+        thieves = [threading.Thread(target=thief, args=(taken,)) for taken in stolen]
+        for thread in thieves:
+            thread.start()
+        popped = []
+        for value in range(20_000):
+            tasks.push(value)
+            if value % 3 == 0:
+                try:
+                    popped.append(tasks.pop())
+                except Empty:
+                    pass
+        while True:
+            try:
+                popped.append(tasks.pop())
+            except Empty:
+                if len(tasks) == 0:
+                    break
+        done.set()
+        for thread in thieves:
+            thread.join(timeout=10)
+
+        taken = popped + [value for values in stolen for value in values]
+        self.assertEqual(sorted(taken), list(range(20_000)))
@@ -0,0 +1,140 @@
+"""Unrolled linked list implementation"""
+
+from itertools import chain
+from math import isqrt
+from typing import Generic, Iterable, Iterator, TypeVar
+
+from data_structures.fenwick_tree import FenwickTree
+
+T = TypeVar("T")  # pylint: disable=invalid-name
+
+
+class UnrolledLinkedList(Generic[T]):
+    """
+    Linked list which stores its values in chunks, with the LinkedList API
+
+    Each chunk is a contiguous list of up to twice the chunk size, which is
+    `chunk_size` or √n, whichever is bigger. A Fenwick tree of the chunk lengths
+    finds the chunk holding an index in O(log n), and is updated in O(log n) as
+    values are inserted and removed, so inserting or removing a value only touches
+    one chunk. The tree is rebuilt lazily when chunks are added or dropped. With
+    O(√n) chunks, that takes O(√n) at most once per O(√n) inserts or removals.
+    """
+
+    def __init__(
+        self, iterable: Iterable | None = None, chunk_size: int = 256
+    ) -> None:
+        self.chunk_size: int = chunk_size
+        self.chunks: list[list[T]] = []
+        self.length: int = 0
+        # Fenwick tree over the chunk lengths, or None until it's rebuilt
+        self._tree: FenwickTree | None = None
+
+        if iterable:
+            self.extend(iterable)
+
+    def extend(self, iterable: Iterable) -> None:
+        """Add all elements from a given iterable to the UnrolledLinkedList"""
+        values = list(iterable)
+        if not values:
+            return
+
+        # Top up the last chunk, then add new chunks for the rest of the values
+        self.length += len(values)
+        size = self._target_size()
+        start = 0
+        if self.chunks:
+            start = max(0, 2 * size - len(self.chunks[-1]))
+            self.chunks[-1].extend(values[:start])
+        for chunk_start in range(start, len(values), size):
+            self.chunks.append(values[chunk_start : chunk_start + size])
+        self._tree = None
+
+    def append(self, data: T) -> None:
+        """Add data to the end of the UnrolledLinkedList"""
+        if self.chunks and len(self.chunks[-1]) < 2 * self._target_size():
+            self.chunks[-1].append(data)
+            if self._tree is not None:
+                self._tree.add(len(self.chunks) - 1, 1)
+        else:
+            self.chunks.append([data])
+            self._tree = None
+        self.length += 1
+
+    def prepend(self, data: T) -> None:
+        """Add data to the start of the UnrolledLinkedList"""
+        self.insert(0, data)
+
+    def remove(self, idx: int) -> T:
+        """Remove and return the element at the given index"""
+        chunk_idx, position = self._locate(idx)
+        chunk = self.chunks[chunk_idx]
+        data = chunk.pop(position)
+        # _locate() has just made sure the tree is up to date
+        if chunk:
+            self._tree.add(chunk_idx, -1)  # type: ignore[union-attr]
+        else:
+            del self.chunks[chunk_idx]
+            self._tree = None
+        self.length -= 1
+        return data
+
+    def insert(self, idx: int, data: T) -> None:
+        """Insert data at the given index"""
+        # Make sure the index is not out-of-bounds
+        if idx < 0 or idx > self.length:
+            raise IndexError
+
+        # Inserting at the end is the only way to go past the last chunk
+        if idx == self.length:
+            return self.append(data)
+
+        chunk_idx, position = self._locate(idx)
+        chunk = self.chunks[chunk_idx]
+        chunk.insert(position, data)
+        # _locate() has just made sure the tree is up to date
+        self._tree.add(chunk_idx, 1)  # type: ignore[union-attr]
+
+        # Split chunks that grow too big, to keep inserts into them cheap
+        size = self._target_size()
+        if len(chunk) > 2 * size:
+            self.chunks.insert(chunk_idx + 1, chunk[size:])
+            del chunk[size:]
+            self._tree = None
+        self.length += 1
+
+    def get(self, idx: int) -> T:
+        """Get the value at the given index"""
+        chunk_idx, position = self._locate(idx)
+        return self.chunks[chunk_idx][position]
+
+    def set(self, idx: int, data: T) -> None:
+        """Set the value for an existing given index"""
+        chunk_idx, position = self._locate(idx)
+        self.chunks[chunk_idx][position] = data
+
+    def _target_size(self) -> int:
+        """The size chunks are cut to, which grows as √n once that's over chunk_size"""
+        return max(self.chunk_size, isqrt(self.length))
+
+    def _locate(self, idx: int) -> tuple[int, int]:
+        """Get the index of the chunk holding the given index, and its position there"""
+        # Make sure the index is not out-of-bounds
+        if idx < 0 or idx > self.length - 1:
+            raise IndexError
+
+        if self._tree is None:
+            self._tree = FenwickTree(map(len, self.chunks))
+        return self._tree.locate(idx)
+
+    def __getitem__(self, idx: int) -> T:
+        return self.get(idx)
+
+    def __setitem__(self, idx: int, data: T) -> None:
+        return self.set(idx, data)
+
+    def __iter__(self) -> Iterator[T]:
+        return chain.from_iterable(self.chunks)
+
+    def __len__(self) -> int:
+        return self.length
@@ -0,0 +1,62 @@
+"""Lazy views, for streaming values out of a structure through a pipeline"""
+
+from itertools import islice
+from typing import Callable, Generic, Iterator, TypeVar
+
+T = TypeVar("T")  # pylint: disable=invalid-name
+U = TypeVar("U")  # pylint: disable=invalid-name
+
+
+class View(Generic[T]):
+    """
+    Lazy, chainable pipeline over the values of a structure
+
+    Structures make views with their view() method, and map(), filter(), take() and
+    chunked() each wrap a view in another one without reading any values. Values
+    are only pulled through the whole pipeline one at a time as it is iterated, so
+    a pipeline of any length uses O(1) extra memory (or O(n) for chunked(n)).
+
+    Every iteration starts again from the structure. For a draining view, that
+    means carrying on with whatever values the last iteration didn't remove.
+    """
+
+    def __init__(self, iterate: Callable[[], Iterator[T]]) -> None:
+        self._iterate: Callable[[], Iterator[T]] = iterate
+
+    def map(self, func: Callable[[T], U]) -> "View[U]":
+        """A view of the values with a function applied to each"""
+        return View(lambda: map(func, self._iterate()))
+
+    def filter(self, predicate: Callable[[T], bool]) -> "View[T]":
+        """
+        A view of only the values the predicate is true for
+
+        A draining view still removes the values that are filtered out.
+        """
+        return View(lambda: filter(predicate, self._iterate()))
+
+    def take(self, n: int) -> "View[T]":
+        """
+        A view of at most the first n values
+
+        Iteration stops after n values, so a draining view removes no more than it
+        passes on.
+        """
+        if n < 0:
+            raise ValueError("n must be at least 0")
+        return View(lambda: islice(self._iterate(), n))
+
+    def chunked(self, n: int) -> "View[list[T]]":
+        """A view of the values in lists of n, with the last list holding the rest"""
+        if n < 1:
+            raise ValueError("n must be at least 1")
+
+        def chunks() -> Iterator[list[T]]:
+            iterator = self._iterate()
+            while chunk := list(islice(iterator, n)):
+                yield chunk
+
+        return View(chunks)
+
+    def __iter__(self) -> Iterator[T]:
+        return self._iterate()
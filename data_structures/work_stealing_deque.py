@@ -0,0 +1,102 @@
+"""Work-stealing deque for parallel task scheduling"""
+
+import threading
+from typing import Generic, TypeVar
+
+from data_structures.blocking_queue import Empty
+
+T = TypeVar("T")  # pylint: disable=invalid-name
+
+
+class WorkStealingDeque(Generic[T]):
+    """
+    Chase-Lev work-stealing deque
+
+    One owner thread pushes and pops at the bottom, while any number of thief
+    threads steal from the top, so the owner works depth-first on its newest tasks
+    and thieves take the oldest, which tend to be the biggest. The owner only takes
+    the lock when it pops the last value, which is the one a thief could be
+    stealing at the same time. Thieves take the lock to advance `top`, in place of
+    the compare-and-swap of the original algorithm.
+
+    `top` and `bottom` only ever grow, and map to slots of a power-of-two circular
+    buffer. When the buffer is full the owner copies it into one twice the size,
+    leaving the old one intact for any thief still reading from it.
+    """
+
+    MIN_CAPACITY: int = 32
+
+    def __init__(self) -> None:
+        self.buffer: list[T | None] = [None] * WorkStealingDeque.MIN_CAPACITY
+        self.top: int = 0
+        self.bottom: int = 0
+        self.steal_lock = threading.Lock()
+
+    def push(self, value: T) -> None:
+        """Push a value at the bottom (owner only)"""
+        bottom = self.bottom
+        buffer = self.buffer
+        if bottom - self.top >= len(buffer):
+            buffer = self._grow(bottom)
+        buffer[bottom & (len(buffer) - 1)] = value
+        # Only publish the value to thieves once it is in the buffer
+        self.bottom = bottom + 1
+
+    def pop(self) -> T:
+        """Pop the newest value from the bottom (owner only), raising Empty if none"""
+        bottom = self.bottom - 1
+        # Claim the slot before looking at the top, so a thief reading the bottom
+        # after this can't also take it
+        self.bottom = bottom
+        top = self.top
+        if top > bottom:
+            self.bottom = bottom + 1
+            raise Empty
+
+        buffer = self.buffer
+        slot = bottom & (len(buffer) - 1)
+        value = buffer[slot]
+        if top < bottom:
+            buffer[slot] = None
+            return value  # type: ignore[return-value]
+
+        # This is the last value, so race any thieves for it
+        with self.steal_lock:
+            won = self.top == top
+            if won:
+                buffer[slot] = None
+                self.top = top + 1
+        self.bottom = bottom + 1
+        if not won:
+            raise Empty
+        return value  # type: ignore[return-value]
+
+    def steal(self) -> T:
+        """Steal the oldest value from the top (any thread), raising Empty if none"""
+        with self.steal_lock:
+            top = self.top
+            if top >= self.bottom:
+                raise Empty
+            buffer = self.buffer
+            slot = top & (len(buffer) - 1)
+            value = buffer[slot]
+            # Clear the slot before moving the top past it, since the owner may
+            # reuse it straight after
+            buffer[slot] = None
+            self.top = top + 1
+        return value  # type: ignore[return-value]
+
+    def _grow(self, bottom: int) -> list[T | None]:
+        """Copy the values into a buffer twice the size (owner only)"""
+        old_buffer = self.buffer
+        old_mask = len(old_buffer) - 1
+        buffer: list[T | None] = [None] * (len(old_buffer) * 2)
+        mask = len(buffer) - 1
+        for idx in range(self.top, bottom):
+            buffer[idx & mask] = old_buffer[idx & old_mask]
+        self.buffer = buffer
+        return buffer
+
+    def __len__(self) -> int:
+        """The number of values, which may be out of date as soon as it's returned"""
+        return max(0, self.bottom - self.top)
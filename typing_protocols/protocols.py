@@ -1,9 +1,10 @@
 """Protocols bounds for TypeVars"""
 
 from abc import abstractmethod
-from typing import Protocol, TypeVar, Any
+from typing import Any, Iterator, Protocol, TypeVar
 
 C = TypeVar("C")  # pylint: disable=invalid-name
+T_co = TypeVar("T_co", covariant=True)  # pylint: disable=invalid-name
 
 
 class Comparable(Protocol):
@@ -16,3 +17,17 @@ class Comparable(Protocol):
     @abstractmethod
     def __eq__(self: C, other: Any) -> bool:
         pass
+
+
+class Heap(Protocol[T_co]):
+    """Implements iter_sorted() and __len__(), and says which way it is ordered"""
+
+    reverse: bool
+
+    @abstractmethod
+    def iter_sorted(self) -> Iterator[T_co]:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass